@@ -1,9 +1,11 @@
-"""프로젝트 서비스 — 프로젝트 조회/대시보드 집계 유스케이스"""
+"""프로젝트 서비스 — 프로젝트 조회/대시보드 집계/프로젝트 전체 티켓 조회 유스케이스"""
 
 from typing import Optional
 
+from backend.domain.dashboard import Dashboard
 from backend.domain.interfaces import ProjectRepository
 from backend.domain.project import Project
+from backend.domain.ticket import KanbanStage, Ticket
 
 
 class ProjectService:
@@ -20,7 +22,7 @@ class ProjectService:
         """특정 프로젝트 조회"""
         return await self._repo.get_by_id(project_id)
 
-    async def get_dashboard(self) -> dict:
+    async def get_dashboard(self) -> Dashboard:
         """
         대시보드 집계 데이터 반환.
 
@@ -28,23 +30,12 @@ class ProjectService:
         - total_projects: 전체 프로젝트 수
         - total_tickets: 전체 티켓 수
         - total_by_stage: 전체 스테이지별 티켓 수
-        - projects: 프로젝트별 요약 목록
+        - projects: 프로젝트별 요약 목록 (섹션별 스테이지별 수 포함)
+
+        합계는 저장소가 요약 변경분으로 유지하는 구체화 집계를 그대로 쓴다.
         """
-        projects = await self._repo.scan_all()
-
-        total_by_stage: dict[str, int] = {}
-        total_tickets = 0
-
-        for project in projects:
-            for stage_name, count in project.ticket_count_by_stage.items():
-                total_by_stage[stage_name] = (
-                    total_by_stage.get(stage_name, 0) + count
-                )
-                total_tickets += count
-
-        return {
-            "total_projects": len(projects),
-            "total_tickets": total_tickets,
-            "total_by_stage": total_by_stage,
-            "projects": projects,
-        }
+        return await self._repo.get_dashboard()
+
+    async def find_tickets(self, stage: Optional[KanbanStage] = None) -> list[Ticket]:
+        """전체 프로젝트에서 티켓 조회 (예: 진행중인 모든 티켓)"""
+        return await self._repo.find_tickets(stage)
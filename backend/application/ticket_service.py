@@ -1,9 +1,40 @@
 """티켓 서비스 — 티켓 조회/스테이지 이동/삭제/에픽 관리 유스케이스"""
 
-from typing import Optional
+from typing import Awaitable, Callable, Optional, TypeVar
 
+from backend.domain.board import TicketBoard, VersionConflictError, VersionedTicket
+from backend.domain.board_delta import BoardDelta
 from backend.domain.interfaces import TicketRepository
-from backend.domain.ticket import KanbanStage, Ticket, TicketType
+from backend.domain.ticket import KanbanStage, Ticket
+from backend.domain.ticket_operation import (
+    TicketBatchResult,
+    TicketOperation,
+    TicketOpType,
+)
+
+T = TypeVar("T")
+
+# 티켓 ID 변환 (요청 기준 버전 ID → 재시도 대상 버전 ID)
+RebaseId = Callable[[str], str]
+
+# If-Match 없는 변경이 파싱~쓰기 사이 다른 쓰기와 겹쳤을 때 재시도 횟수
+_MAX_REBASE = 3
+
+
+def _same_id(ticket_id: str) -> str:
+    return ticket_id
+
+
+def _rebased(rebase: RebaseId, conflict: VersionConflictError) -> RebaseId:
+    """rebase 뒤에 충돌 diff의 ID 이동을 이어 붙인 변환 (대상 티켓이 바뀌었으면 충돌 그대로)"""
+
+    def rebase_id(ticket_id: str) -> str:
+        rebased = conflict.diff.rebase_ticket_id(rebase(ticket_id))
+        if rebased is None:
+            raise conflict
+        return rebased
+
+    return rebase_id
 
 
 class TicketService:
@@ -12,8 +43,38 @@ class TicketService:
     def __init__(self, repository: TicketRepository) -> None:
         self._repo = repository
 
-    async def get_all(self, project_id: str) -> list[Ticket]:
-        """특정 프로젝트의 전체 티켓 조회"""
+    async def _versioned(
+        self,
+        expected_version: Optional[str],
+        attempt: Callable[[Optional[str], RebaseId], Awaitable[T]],
+    ) -> T:
+        """
+        버전 검사를 거쳐 변경 실행.
+
+        If-Match(expected_version)가 있으면 한 번만 시도하고 충돌은 그대로 전달.
+        없으면 요청 ID를 방금 파싱한 버전 기준으로 보고, 동시 쓰기로 충돌하면
+        diff로 대상 ID를 현재 버전으로 옮겨 재시도한다.
+        """
+        if expected_version is not None:
+            return await attempt(expected_version, _same_id)
+
+        version: Optional[str] = None
+        rebase = _same_id
+        previous: Optional[VersionConflictError] = None
+        for _ in range(_MAX_REBASE):
+            try:
+                return await attempt(version, rebase)
+            except VersionConflictError as conflict:
+                # diff가 없거나 대상 티켓이 직전 충돌에서 바뀌었으면 포기
+                if conflict.diff is None or conflict is previous:
+                    raise
+                previous = conflict
+                rebase = _rebased(rebase, conflict)
+                version = conflict.current_version
+        return await attempt(version, rebase)
+
+    async def get_all(self, project_id: str) -> TicketBoard:
+        """특정 프로젝트의 전체 티켓 조회 (버전 포함)"""
         return await self._repo.get_all_by_project(project_id)
 
     async def get_by_id(
@@ -22,50 +83,88 @@ class TicketService:
         """특정 티켓 조회"""
         return await self._repo.get_by_id(project_id, ticket_id)
 
+    async def get_delta(self, board: TicketBoard) -> Optional[BoardDelta]:
+        """변경 결과 보드의 변경 전 → 후 티켓 변경분 (계산할 수 없으면 None)"""
+        if board.base_version is None or board.version is None:
+            return None
+        return await self._repo.get_delta(
+            board.project_id, board.base_version, board.version
+        )
+
     async def move_ticket(
-        self, project_id: str, ticket_id: str, new_stage: KanbanStage
-    ) -> Ticket:
+        self,
+        project_id: str,
+        ticket_id: str,
+        new_stage: KanbanStage,
+        expected_version: Optional[str] = None,
+    ) -> VersionedTicket:
         """티켓 스테이지 변경 후 최신 Ticket 반환"""
-        return await self._repo.update_stage(project_id, ticket_id, new_stage)
+        return await self._versioned(
+            expected_version,
+            lambda version, rebase: self._repo.update_stage(
+                project_id, rebase(ticket_id), new_stage, version
+            ),
+        )
 
     async def delete_ticket(
         self,
         project_id: str,
         ticket_id: str,
         cascade: bool = False,
-    ) -> list[Ticket]:
+        expected_version: Optional[str] = None,
+    ) -> TicketBoard:
         """
         티켓 삭제.
 
         cascade=True: 에픽 삭제 시 자식도 함께 삭제.
         cascade=False: 에픽 삭제 시 자식은 독립 티켓으로 자동 승격 (들여쓰기만 잔존).
         """
-        ticket = await self._repo.get_by_id(project_id, ticket_id)
-        if ticket is None:
-            raise ValueError(f"티켓을 찾을 수 없습니다: {ticket_id}")
-
-        if ticket.ticket_type == TicketType.EPIC and cascade:
-            # 에픽 + 모든 자식 함께 삭제
-            ids_to_delete = [ticket_id] + ticket.children_ids
-            return await self._repo.delete_tickets(project_id, ids_to_delete)
+        if cascade:
+            # 에픽 + 직계 자식을 한 번의 쓰기로 함께 삭제
+            result = await self._versioned(
+                expected_version,
+                lambda version, rebase: self._repo.apply_batch(
+                    project_id,
+                    [TicketOperation.delete(rebase(ticket_id), cascade=True)],
+                    version,
+                ),
+            )
+            return TicketBoard.from_index(
+                project_id,
+                result.version,
+                result.index,
+                base_version=result.base_version,
+            )
 
         # 단일 삭제 (에픽이어도 자식은 보존 → 재파싱 시 자동 승격)
-        return await self._repo.delete_ticket(project_id, ticket_id)
+        return await self._versioned(
+            expected_version,
+            lambda version, rebase: self._repo.delete_ticket(
+                project_id, rebase(ticket_id), version
+            ),
+        )
 
     async def delete_tickets(
         self,
         project_id: str,
         ticket_ids: list[str],
-    ) -> list[Ticket]:
+        expected_version: Optional[str] = None,
+    ) -> TicketBoard:
         """복수 티켓 일괄 삭제"""
-        return await self._repo.delete_tickets(project_id, ticket_ids)
+        return await self._versioned(
+            expected_version,
+            lambda version, rebase: self._repo.delete_tickets(
+                project_id, [rebase(t) for t in ticket_ids], version
+            ),
+        )
 
     async def create_ticket(
         self,
         project_id: str,
         section_name: str,
         title: str,
-    ) -> list[Ticket]:
+        expected_version: Optional[str] = None,
+    ) -> TicketBoard:
         """
         티켓 생성 유스케이스.
 
@@ -74,14 +173,20 @@ class TicketService:
         title = title.strip()
         if not title:
             raise ValueError("티켓 제목이 비어있습니다")
-        return await self._repo.create_ticket(project_id, section_name, title)
+        return await self._versioned(
+            expected_version,
+            lambda version, rebase: self._repo.create_ticket(
+                project_id, section_name, title, version
+            ),
+        )
 
     async def create_child_ticket(
         self,
         project_id: str,
         parent_ticket_id: str,
         title: str,
-    ) -> list[Ticket]:
+        expected_version: Optional[str] = None,
+    ) -> TicketBoard:
         """
         부모 티켓 아래 자식 티켓 생성.
 
@@ -90,8 +195,11 @@ class TicketService:
         title = title.strip()
         if not title:
             raise ValueError("티켓 제목이 비어있습니다")
-        return await self._repo.create_child_ticket(
-            project_id, parent_ticket_id, title
+        return await self._versioned(
+            expected_version,
+            lambda version, rebase: self._repo.create_child_ticket(
+                project_id, rebase(parent_ticket_id), title, version
+            ),
         )
 
     async def move_epic(
@@ -100,22 +208,69 @@ class TicketService:
         epic_id: str,
         new_stage: KanbanStage,
         include_children: bool = True,
-    ) -> list[Ticket]:
+        expected_version: Optional[str] = None,
+    ) -> TicketBoard:
         """
         에픽 스테이지 이동 (자식 선택적 동반).
 
         include_children=True: 에픽 + 모든 자식 동시 이동.
+        반환 보드의 tickets는 에픽 + 자식의 적용 후 티켓 (작업 순서).
+        """
+        result = await self._versioned(
+            expected_version,
+            lambda version, rebase: self._repo.apply_batch(
+                project_id,
+                [
+                    TicketOperation.move(
+                        rebase(epic_id), new_stage, cascade=include_children
+                    )
+                ],
+                version,
+            ),
+        )
+        return result.targets()
+
+    async def apply_batch(
+        self,
+        project_id: str,
+        operations: list[TicketOperation],
+        expected_version: Optional[str] = None,
+    ) -> TicketBatchResult:
         """
-        epic = await self._repo.get_by_id(project_id, epic_id)
-        if epic is None:
-            raise ValueError(f"에픽을 찾을 수 없습니다: {epic_id}")
-
-        ids_to_move = [epic_id]
-        if include_children and epic.children_ids:
-            ids_to_move.extend(epic.children_ids)
-
-        results: list[Ticket] = []
-        for tid in ids_to_move:
-            result = await self._repo.update_stage(project_id, tid, new_stage)
-            results.append(result)
-        return results
+        일괄 작업 유스케이스.
+
+        작업별 필수 값/제목 검증 후 Repository에 위임 (한 번의 파싱/쓰기).
+        """
+        if not operations:
+            raise ValueError("작업 목록이 비어있습니다")
+        operations = [self._validate(op) for op in operations]
+        return await self._versioned(
+            expected_version,
+            lambda version, rebase: self._repo.apply_batch(
+                project_id,
+                [
+                    op.model_copy(update={"ticket_id": rebase(op.ticket_id)})
+                    if op.ticket_id
+                    else op
+                    for op in operations
+                ],
+                version,
+            ),
+        )
+
+    @staticmethod
+    def _validate(operation: TicketOperation) -> TicketOperation:
+        """작업 종류별 필수 값 검증 (제목은 공백 제거)"""
+        if operation.op != TicketOpType.CREATE and not operation.ticket_id:
+            raise ValueError(f"{operation.op.value} 작업에 ticket_id가 없습니다")
+        if operation.op == TicketOpType.MOVE and operation.new_stage is None:
+            raise ValueError(f"move 작업에 new_stage가 없습니다: {operation.ticket_id}")
+        if operation.op == TicketOpType.CREATE and not operation.section_name:
+            raise ValueError("create 작업에 section_name이 없습니다")
+
+        if operation.op in (TicketOpType.CREATE, TicketOpType.CREATE_CHILD):
+            title = (operation.title or "").strip()
+            if not title:
+                raise ValueError("티켓 제목이 비어있습니다")
+            return operation.model_copy(update={"title": title})
+        return operation
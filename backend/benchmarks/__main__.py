@@ -0,0 +1,86 @@
+"""벤치마크 CLI
+
+실행:
+  python -m backend.benchmarks run [--sizes 1k,10k,100k,1M] [--repeat 5] [--output baseline.json]
+  python -m backend.benchmarks compare baseline.json current.json [--threshold 0.10]
+
+compare는 회귀가 있으면 종료 코드 1을 반환한다.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from backend.benchmarks.suite import (
+    DEFAULT_SIZES,
+    DEFAULT_THRESHOLD,
+    compare,
+    parse_size,
+    run_suite,
+    size_label,
+)
+
+
+def _run(args: argparse.Namespace) -> int:
+    sizes = tuple(parse_size(s) for s in args.sizes.split(","))
+    only = set(args.only.split(",")) if args.only else None
+    data = run_suite(sizes=sizes, repeat=args.repeat, seed=args.seed, only=only)
+    if args.output:
+        path = Path(args.output)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        print(f"saved: {path}")
+    if args.baseline:
+        return _report(json.loads(Path(args.baseline).read_text()), data, args)
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    baseline = json.loads(Path(args.baseline).read_text())
+    current = json.loads(Path(args.current).read_text())
+    return _report(baseline, current, args)
+
+
+def _report(baseline: dict, current: dict, args: argparse.Namespace) -> int:
+    report, regressions = compare(baseline, current, args.threshold, args.stat)
+    print("\n".join(report))
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}: "
+              + ", ".join(regressions))
+        return 1
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m backend.benchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def _add_compare_options(p: argparse.ArgumentParser) -> None:
+        p.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+        p.add_argument("--stat", choices=("median", "min"), default="median")
+
+    run = sub.add_parser("run", help="벤치마크 실행")
+    run.add_argument(
+        "--sizes", default=",".join(size_label(s) for s in DEFAULT_SIZES)
+    )
+    run.add_argument("--repeat", type=int, default=5)
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument("--only", help="쉼표로 구분한 벤치마크 이름 (예: parse,delete_lines)")
+    run.add_argument("--output", help="결과 JSON 저장 경로")
+    run.add_argument("--baseline", help="실행 직후 비교할 기준선 JSON")
+    _add_compare_options(run)
+    run.set_defaults(handler=_run)
+
+    cmp = sub.add_parser("compare", help="두 결과 JSON 비교 (회귀 시 종료 코드 1)")
+    cmp.add_argument("baseline")
+    cmp.add_argument("current")
+    _add_compare_options(cmp)
+    cmp.set_defaults(handler=_compare)
+
+    args = parser.parse_args()
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
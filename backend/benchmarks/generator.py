@@ -0,0 +1,83 @@
+"""벤치마크용 합성 todo.md 생성기 — 같은 설정/시드면 항상 같은 내용"""
+
+import random
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# 기본 마커 분포 (계획 위주, 일부 진행/완료/QA/배포)
+DEFAULT_MARKER_WEIGHTS: dict[str, float] = {
+    " ": 0.40,
+    "~": 0.15,
+    "x": 0.25,
+    "X": 0.02,
+    "Q": 0.08,
+    "D": 0.10,
+}
+
+
+@dataclass(frozen=True)
+class TodoSpec:
+    """합성 todo.md 설정"""
+
+    # 전체 라인 수 (제목/섹션/본문 포함)
+    lines: int = 10_000
+    # ## 섹션 수 (라인 전체에 균등 분포)
+    sections: int = 20
+    # 최대 들여쓰기 깊이 (0이면 모두 루트 티켓)
+    max_depth: int = 2
+    # 마커 문자 → 가중치
+    marker_weights: dict[str, float] = field(
+        default_factory=lambda: dict(DEFAULT_MARKER_WEIGHTS)
+    )
+    # 체크박스가 아닌 본문 라인 / 빈 라인 비율
+    prose_ratio: float = 0.05
+    blank_ratio: float = 0.05
+    seed: int = 0
+
+
+def generate_lines(spec: TodoSpec) -> list[str]:
+    """
+    설정에 맞는 todo.md 라인 목록 생성.
+
+    들여쓰기는 직전 티켓보다 최대 1단계만 깊어지도록 무작위 보행하여
+    실제 에픽/자식 구조와 비슷한 계층을 만든다.
+    """
+    rng = random.Random(spec.seed)
+    markers = list(spec.marker_weights)
+    weights = list(spec.marker_weights.values())
+    section_every = max(spec.lines // max(spec.sections, 1), 1)
+
+    lines = ["# Benchmark Project"]
+    depth = 0
+    section_count = 0
+    for i in range(1, spec.lines):
+        if section_count < spec.sections and i % section_every == 1:
+            section_count += 1
+            lines.append(f"## Section {section_count}")
+            depth = 0
+            continue
+
+        roll = rng.random()
+        if roll < spec.blank_ratio:
+            lines.append("")
+            continue
+        if roll < spec.blank_ratio + spec.prose_ratio:
+            lines.append(f"메모: line {i} 관련 참고 사항")
+            continue
+
+        depth = rng.randint(0, min(depth + 1, spec.max_depth))
+        marker = rng.choices(markers, weights)[0]
+        lines.append(f"{'  ' * depth}- [{marker}] ticket {i} with a descriptive title")
+    return lines
+
+
+def generate_text(spec: TodoSpec) -> str:
+    """설정에 맞는 todo.md 본문 (끝 줄바꿈 포함)"""
+    return "\n".join(generate_lines(spec)) + "\n"
+
+
+def write_todo(path: Path, spec: TodoSpec) -> Path:
+    """합성 todo.md를 path에 기록"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(generate_text(spec), encoding="utf-8")
+    return path
@@ -0,0 +1,74 @@
+"""todo.md 렉서 벤치마크 — 라인별 3중 정규식 탐색 vs 결합 정규식 버퍼 스캔
+
+실행: python -m backend.benchmarks.lexer_bench [--lines 100000] [--repeat 5]
+"""
+
+import argparse
+from typing import Callable
+
+from backend.benchmarks.generator import TodoSpec, generate_lines
+from backend.benchmarks.suite import time_runs
+from backend.infrastructure.file_system.todo_parser import (
+    TOKEN_CHECKBOX,
+    TOKEN_SECTION,
+    TOKEN_TITLE,
+    TodoParser,
+)
+
+
+def _legacy_lex(parser: TodoParser, text: str) -> int:
+    """기존 방식: 라인 분할 후 라인마다 TITLE_RE → SECTION_RE → CHECKBOX_RE 순차 시도
+
+    lex와 같은 (토큰 종류, 라인 번호, 매치) 스트림을 만들어 개수를 센다.
+    """
+    matched = 0
+    title_found = False
+    for line_num, line in enumerate(text.splitlines(), 1):
+        if not title_found:
+            match = parser.TITLE_RE.match(line)
+            if match:
+                title_found = True
+                matched += bool((TOKEN_TITLE, line_num, match))
+                continue
+        match = parser.SECTION_RE.match(line)
+        if match:
+            matched += bool((TOKEN_SECTION, line_num, match))
+            continue
+        match = parser.CHECKBOX_RE.match(line)
+        if match:
+            matched += bool((TOKEN_CHECKBOX, line_num, match))
+    return matched
+
+
+def _token_lex(parser: TodoParser, text: str) -> int:
+    """결합 정규식 스캐너 (TodoParser.lex — 라인을 자르지 않고 버퍼를 직접 스캔)"""
+    return sum(1 for _ in parser.lex(text))
+
+
+def _best_of(repeat: int, fn: Callable[[], object]) -> float:
+    return min(time_runs(fn, repeat))
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--lines", type=int, default=100_000)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    parser = TodoParser()
+    lines = generate_lines(TodoSpec(lines=args.lines))
+    text = "\n".join(lines)
+
+    legacy = _best_of(args.repeat, lambda: _legacy_lex(parser, text))
+    scan = _best_of(args.repeat, lambda: _token_lex(parser, text))
+    full = _best_of(args.repeat, lambda: parser.parse_text(text, "pj.bench"))
+
+    print(f"lines: {len(lines):,}")
+    print(f"legacy 3-regex lex : {len(lines) / legacy:>12,.0f} lines/sec")
+    print(f"TOKEN_RE buffer lex: {len(lines) / scan:>12,.0f} lines/sec")
+    print(f"speedup            : {legacy / scan:>12.2f}x")
+    print(f"full parse_text    : {len(lines) / full:>12,.0f} lines/sec")
+
+
+if __name__ == "__main__":
+    main()
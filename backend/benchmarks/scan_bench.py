@@ -0,0 +1,70 @@
+"""프로젝트 전체 스캔 벤치마크 — 순차 vs 프로세스 풀 (프로젝트 수별 소요 시간/속도 향상)
+
+실행: python -m backend.benchmarks.scan_bench [--projects 8,32,128] [--lines 5000] [--processes 0]
+
+매 측정마다 새 카탈로그로 콜드 스캔(모든 프로젝트 파싱)한다. 프로세스 풀은
+미리 띄운 뒤 측정하므로 spawn 비용은 포함하지 않는다 (서버에서는 한 번만 든다).
+"""
+
+import argparse
+import tempfile
+from pathlib import Path
+
+from backend.benchmarks.generator import TodoSpec, write_todo
+from backend.benchmarks.suite import time_runs
+from backend.infrastructure.file_system.parse_cache import parse_cache
+from backend.infrastructure.file_system.project_catalog import (
+    ProjectCatalog,
+    _pool_size,
+)
+
+
+def _make_root(root: Path, projects: int, lines: int) -> None:
+    for i in range(projects):
+        folder = root / f"pj.{i:04d}"
+        folder.mkdir()
+        write_todo(folder / "todo.md", TodoSpec(lines=lines, seed=i))
+
+
+def _cold_scan_time(catalog: ProjectCatalog, repeat: int) -> float:
+    """콜드 스캔(캐시를 비운 뒤 전체 파싱) 최소 시간"""
+
+    def setup() -> None:
+        parse_cache.clear()
+        catalog.clear()
+
+    return min(time_runs(catalog.scan, repeat, setup=setup))
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--projects", default="8,32,128")
+    arg_parser.add_argument("--lines", type=int, default=5_000)
+    arg_parser.add_argument("--processes", type=int, default=0)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    workers = _pool_size(args.processes)
+    print(f"processes: {workers}  lines/project: {args.lines:,}")
+    print(f"{'projects':>8} {'serial':>10} {'pool':>10} {'speedup':>8}")
+    for projects in (int(n) for n in args.projects.split(",")):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            _make_root(root, projects, args.lines)
+            serial_catalog = ProjectCatalog(str(root), processes=1)
+            pool_catalog = ProjectCatalog(
+                str(root), processes=workers, min_process_projects=1
+            )
+            try:
+                pool_catalog.scan()  # 워커 기동
+                serial = _cold_scan_time(serial_catalog, args.repeat)
+                pooled = _cold_scan_time(pool_catalog, args.repeat)
+                # 병합 결과(순서 포함)가 순차 스캔과 같아야 한다
+                assert pool_catalog.scan() == serial_catalog.scan()
+            finally:
+                pool_catalog.shutdown()
+        print(f"{projects:>8} {serial:>9.3f}s {pooled:>9.3f}s {serial / pooled:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
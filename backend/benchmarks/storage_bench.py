@@ -0,0 +1,62 @@
+"""파싱 결과 저장 방식 벤치마크 — TicketTable 컬럼 vs Ticket 모델 목록 (시간/메모리)
+
+실행: python -m backend.benchmarks.storage_bench [--lines 100000] [--repeat 3]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from backend.benchmarks.generator import TodoSpec, generate_text
+from backend.benchmarks.suite import time_runs
+from backend.infrastructure.file_system.todo_parser import TodoParser
+
+
+def _retained(fn) -> tuple[object, int]:
+    """fn() 결과와 그 결과가 붙잡고 있는 메모리 (bytes)"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = fn()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, retained
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--lines", type=int, default=100_000)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    parser = TodoParser()
+    text = generate_text(TodoSpec(lines=args.lines))
+
+    parse_time = min(time_runs(lambda: parser.parse_text(text, "pj.bench"), args.repeat))
+    result, table_bytes = _retained(lambda: parser.parse_text(text, "pj.bench"))
+    count = result.ticket_count
+
+    materialize_time = min(time_runs(lambda: result.tickets, args.repeat))
+    ticket_bytes = _retained(lambda: result.tickets)[1]
+
+    gc.collect()
+    start = time.perf_counter()
+    found = sum(
+        1 for line in result.table.line_numbers[::max(count // 1000, 1)]
+        if result.find_ticket(f"pj.bench:{line}") is not None
+    )
+    find_time = (time.perf_counter() - start) / max(found, 1)
+
+    per_100k = 100_000 / max(count, 1)
+    print(f"lines: {args.lines:,}  tickets: {count:,}")
+    print(f"parse (columns)       : {parse_time:>8.3f} s")
+    print(f"materialize all       : {materialize_time:>8.3f} s")
+    print(f"find_ticket (single)  : {find_time * 1e6:>8.1f} us")
+    print(f"memory columns+buffer : {table_bytes * per_100k / 1e6:>8.1f} MB / 100k tickets")
+    print(f"memory Ticket models  : {ticket_bytes * per_100k / 1e6:>8.1f} MB / 100k tickets")
+
+
+if __name__ == "__main__":
+    main()
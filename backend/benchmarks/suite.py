@@ -0,0 +1,259 @@
+"""파서/라이터 마이크로 벤치마크 — 합성 todo.md 크기별 반복 측정 및 JSON 기준선 비교"""
+
+import asyncio
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+from backend.benchmarks.generator import TodoSpec, write_todo
+from backend.domain.ticket import KanbanStage
+from backend.infrastructure.file_system.parse_cache import parse_cache
+from backend.infrastructure.file_system.ticket_table import ParentStack
+from backend.infrastructure.file_system.todo_parser import ParseResult, TodoParser
+from backend.infrastructure.file_system.todo_writer import TodoWriter
+
+# 기본 측정 크기 (라인 수)
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+
+# 기준선 대비 허용 느려짐 비율 (0.10 = 10%)
+DEFAULT_THRESHOLD = 0.10
+
+_PROJECT_ID = "pj.bench"
+
+
+def parse_size(label: str) -> int:
+    """'1k' / '10K' / '1M' / '2500' → 라인 수"""
+    label = label.strip().lower()
+    for suffix, factor in (("k", 1_000), ("m", 1_000_000)):
+        if label.endswith(suffix):
+            return int(float(label[:-1]) * factor)
+    return int(label)
+
+
+def size_label(lines: int) -> str:
+    """라인 수 → '1k' / '1M' 표기"""
+    if lines >= 1_000_000 and lines % 1_000_000 == 0:
+        return f"{lines // 1_000_000}M"
+    if lines >= 1_000 and lines % 1_000 == 0:
+        return f"{lines // 1_000}k"
+    return str(lines)
+
+
+def time_runs(
+    fn: Callable[[], object],
+    repeat: int,
+    setup: Optional[Callable[[], None]] = None,
+) -> list[float]:
+    """fn을 repeat회 실행한 소요 시간(초) 목록 — setup은 매 회 측정 밖에서 실행"""
+    runs = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - start)
+    return runs
+
+
+@dataclass
+class _Fixture:
+    """크기 하나에 대한 측정 대상 파일과 대표 편집 위치"""
+
+    pristine: Path
+    work: Path
+    lines: int
+    result: ParseResult
+    # 중간 지점 티켓 / 섹션 / 자식 보유 티켓 라인 번호
+    ticket_line: int
+    section_line: int
+    parent_line: int
+
+    def reset(self) -> None:
+        """작업 파일을 원본으로 복구 (쓰기 벤치마크 간 드리프트 방지)"""
+        shutil.copyfile(self.pristine, self.work)
+        parse_cache.invalidate(str(self.work))
+
+
+def _make_fixture(directory: Path, lines: int, seed: int) -> _Fixture:
+    pristine = write_todo(
+        directory / f"pristine-{lines}.md", TodoSpec(lines=lines, seed=seed)
+    )
+    work = directory / f"todo-{lines}.md"
+    shutil.copyfile(pristine, work)
+
+    result = TodoParser().parse_text(
+        pristine.read_text(encoding="utf-8"), _PROJECT_ID
+    )
+    table = result.table
+    middle = len(table) // 2
+    parent = next(
+        (i for i in range(middle, len(table) - 1) if table.parent_indexes[i + 1] == i),
+        middle,
+    )
+    sections = result.sections
+    return _Fixture(
+        pristine=pristine,
+        work=work,
+        lines=lines,
+        result=result,
+        ticket_line=table.line_numbers[middle],
+        section_line=sections[len(sections) // 2].line_number if sections else 1,
+        parent_line=table.line_numbers[parent],
+    )
+
+
+def _build_parents(levels) -> list[int]:
+    """indent_level 열만으로 부모 인덱스 계산 (파서의 계층 구축 단계)"""
+    hierarchy: ParentStack[int] = ParentStack()
+    parents = []
+    for index, level in enumerate(levels):
+        parent = hierarchy.parent_for(level)
+        parents.append(-1 if parent is None else parent)
+        hierarchy.push(level, index)
+    return parents
+
+
+def _benchmarks(
+    fixture: _Fixture, loop: asyncio.AbstractEventLoop
+) -> dict[str, tuple[Callable[[], object], Optional[Callable[[], None]]]]:
+    """벤치마크 이름 → (측정 함수, 측정 밖 준비 함수)"""
+    parser = TodoParser()
+    writer = TodoWriter()
+    work = str(fixture.work)
+
+    def _run(coro_fn: Callable[[], Awaitable[object]]) -> Callable[[], object]:
+        return lambda: loop.run_until_complete(coro_fn())
+
+    return {
+        "parse": (
+            lambda: parser.parse(work, _PROJECT_ID),
+            lambda: parse_cache.invalidate(work),
+        ),
+        # 대시보드용 요약 스캔 (디코딩/티켓 컬럼 없이 마커 바이트 집계)
+        "summarize": (
+            lambda: parser.summarize(work, _PROJECT_ID),
+            lambda: parse_cache.invalidate(work),
+        ),
+        "hierarchy": (
+            lambda: _build_parents(fixture.result.table.indent_levels),
+            None,
+        ),
+        "materialize": (lambda: fixture.result.tickets, None),
+        "update_ticket_stage": (
+            _run(lambda: writer.update_ticket_stage(
+                work, fixture.ticket_line, KanbanStage.DEPLOYED
+            )),
+            fixture.reset,
+        ),
+        # 직전 쓰기로 오프셋 표가 준비된 상태의 마커 교체 (제자리 바이트 패치)
+        "update_ticket_stage_inplace": (
+            _run(lambda: writer.update_ticket_stage(
+                work, fixture.ticket_line, KanbanStage.DEPLOYED
+            )),
+            _run(lambda: writer.update_ticket_stage(
+                work, fixture.ticket_line, KanbanStage.PLAN
+            )),
+        ),
+        "delete_lines": (
+            _run(lambda: writer.delete_lines(work, [fixture.ticket_line])),
+            fixture.reset,
+        ),
+        "insert_ticket": (
+            _run(lambda: writer.insert_ticket(
+                work, fixture.section_line, "benchmark ticket"
+            )),
+            fixture.reset,
+        ),
+        "insert_child_ticket": (
+            _run(lambda: writer.insert_child_ticket(
+                work, fixture.parent_line, "benchmark child"
+            )),
+            fixture.reset,
+        ),
+    }
+
+
+def run_suite(
+    sizes: tuple[int, ...] = DEFAULT_SIZES,
+    repeat: int = 5,
+    seed: int = 0,
+    only: Optional[set[str]] = None,
+    log: Callable[[str], None] = print,
+) -> dict:
+    """
+    전체 벤치마크 실행 → JSON 직렬화 가능한 결과.
+
+    결과 키는 "{벤치마크}@{크기}" (예: "parse@100k").
+    """
+    results: dict[str, dict] = {}
+    loop = asyncio.new_event_loop()
+    directory = Path(tempfile.mkdtemp(prefix="todo-bench-"))
+    try:
+        for lines in sizes:
+            fixture = _make_fixture(directory, lines, seed)
+            for name, (fn, setup) in _benchmarks(fixture, loop).items():
+                if only and name not in only:
+                    continue
+                runs = time_runs(fn, repeat, setup)
+                key = f"{name}@{size_label(lines)}"
+                results[key] = {
+                    "lines": lines,
+                    "min": min(runs),
+                    "median": statistics.median(runs),
+                    "runs": runs,
+                }
+                log(f"{key:<36} median {statistics.median(runs) * 1e3:>10.2f} ms")
+    finally:
+        loop.close()
+        shutil.rmtree(directory, ignore_errors=True)
+
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "repeat": repeat,
+            "seed": seed,
+            "sizes": list(sizes),
+        },
+        "results": results,
+    }
+
+
+def compare(
+    baseline: dict,
+    current: dict,
+    threshold: float = DEFAULT_THRESHOLD,
+    stat: str = "median",
+) -> tuple[list[str], list[str]]:
+    """
+    기준선 대비 결과 비교.
+
+    반환: (보고 라인 목록, 회귀 키 목록) — current[stat]이
+    baseline[stat] × (1 + threshold)보다 크면 회귀.
+    """
+    report = [f"{'benchmark':<28} {'baseline':>12} {'current':>12} {'ratio':>8}"]
+    regressions = []
+    base_results = baseline.get("results", {})
+    for key, entry in current.get("results", {}).items():
+        base = base_results.get(key)
+        if base is None:
+            report.append(f"{key:<36} {'-':>12} {entry[stat] * 1e3:>10.2f}ms {'new':>8}")
+            continue
+        ratio = entry[stat] / base[stat] if base[stat] else float("inf")
+        flag = ""
+        if ratio > 1 + threshold:
+            regressions.append(key)
+            flag = "  REGRESSION"
+        report.append(
+            f"{key:<36} {base[stat] * 1e3:>10.2f}ms {entry[stat] * 1e3:>10.2f}ms"
+            f" {ratio:>7.2f}x{flag}"
+        )
+    return report, regressions
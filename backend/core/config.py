@@ -20,6 +20,43 @@ class Settings(BaseSettings):
     # CORS 허용 오리진 (로컬 전용)
     CORS_ORIGINS: str = "http://127.0.0.1:1111"
 
+    # todo.md 파싱 결과 캐시 (LRU 최대 항목 수 / 내용 해시 검증 여부)
+    PARSE_CACHE_SIZE: int = 256
+    PARSE_CACHE_VERIFY_HASH: bool = False
+
+    # 버전 충돌(409) diff 기준으로 보관할 파일별 최근 파싱 결과 수
+    VERSION_HISTORY_SIZE: int = 4
+
+    # 프로젝트별 파싱 결과 메모리 상주 한도 (추정 바이트, 초과 시 오래된 프로젝트부터 제거)
+    BOARD_STORE_MAX_BYTES: int = 256 * 1024 * 1024
+
+    # todo.md 그룹 커밋 (시간 창 ms / 배치당 최대 작업 수)
+    WRITE_BATCH_WINDOW_MS: float = 5.0
+    WRITE_BATCH_MAX_OPS: int = 32
+
+    # 프로젝트 전체 스캔 프로세스 풀 (0이면 CPU 수, 1이면 사용 안 함) /
+    # 다시 파싱할 프로젝트가 이 수보다 적으면 순차 스캔
+    SCAN_PROCESSES: int = 0
+    SCAN_PROCESS_MIN_PROJECTS: int = 16
+
+    # 대시보드 구체화 집계를 전체 스캔과 비교하는 주기 (초, 0이면 검증 안 함)
+    DASHBOARD_VERIFY_INTERVAL: float = 300.0
+
+    # 보드 영속 색인 (SQLite — 재시작 후 파싱 결과/요약 재사용) 사용 여부 /
+    # 파일 경로 (비우면 PROJECTS_ROOT/pj.0/board_index.sqlite3)
+    BOARD_INDEX_ENABLED: bool = False
+    BOARD_INDEX_PATH: str = ""
+
+    # 파일 감시 알림 — 프로젝트별 디바운스 창 (ms) / SSE 구독자별 큐 크기
+    # (가득 차면 밀린 이벤트를 resync 하나로 접는다)
+    WATCH_DEBOUNCE_MS: float = 100.0
+    SSE_QUEUE_SIZE: int = 64
+    # SSE 티켓 변경분(board_delta) 최대 티켓 수 (추가+변경+삭제, 넘으면 todo_changed)
+    SSE_DELTA_MAX_TICKETS: int = 200
+
+    # 파일 I/O 전용 스레드 풀 크기
+    IO_MAX_WORKERS: int = 8
+
     @property
     def cors_origins_list(self) -> list[str]:
         return [o.strip() for o in self.CORS_ORIGINS.split(",") if o.strip()]
@@ -0,0 +1,43 @@
+"""요청 컨텍스트 — 요청 ID를 라우터를 거치지 않고 하위 계층(파일 쓰기)까지 전달"""
+
+from contextvars import ContextVar
+from typing import Optional
+from uuid import uuid4
+
+# 현재 HTTP 요청 ID (X-Request-ID, 요청 밖에서는 None)
+request_id: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+HEADER = b"x-request-id"
+# 클라이언트가 보낸 요청 ID 최대 길이 (넘으면 자름)
+MAX_LENGTH = 128
+
+
+class RequestIdMiddleware:
+    """
+    HTTP 요청마다 request_id 설정 (ASGI 미들웨어).
+
+    클라이언트가 X-Request-ID를 보내면 그 값을, 없으면 새로 만들어 쓰고
+    응답 헤더로 되돌린다. 응답 본문은 건드리지 않으므로 SSE 스트림도 그대로 흐른다.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        raw = dict(scope["headers"]).get(HEADER)
+        rid = raw.decode("latin-1")[:MAX_LENGTH] if raw else uuid4().hex
+        header = (HEADER, rid.encode("latin-1"))
+
+        async def send_with_id(message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), header]
+            await send(message)
+
+        token = request_id.set(rid)
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            request_id.reset(token)
@@ -0,0 +1,122 @@
+"""보드 버전 Value Object — todo.md 내용 해시 기반 낙관적 동시성 제어"""
+
+from typing import Optional
+
+from pydantic import BaseModel, Field, PrivateAttr, computed_field
+
+from backend.domain.board_index import BoardIndex
+from backend.domain.section import Section
+from backend.domain.ticket import Ticket
+
+
+class TicketBoard(BaseModel):
+    """
+    버전이 붙은 티켓 목록 — version은 목록을 만든 todo.md의 내용 해시.
+
+    index는 파싱 결과의 BoardIndex를 그대로 이어받고 (from_index),
+    없으면 처음 접근할 때 tickets로 만든다.
+    """
+
+    project_id: str = Field(..., description="프로젝트 ID")
+    version: Optional[str] = Field(default=None, description="todo.md 내용 해시 (If-Match 값)")
+    tickets: list[Ticket] = Field(default_factory=list, description="티켓 목록 (파일 순서)")
+    base_version: Optional[str] = Field(
+        default=None, description="변경 결과일 때 변경 적용 전 버전 (delta 응답 기준)"
+    )
+
+    _index: Optional[BoardIndex] = PrivateAttr(default=None)
+
+    @classmethod
+    def from_index(
+        cls, project_id: str, version: Optional[str], index: BoardIndex, **fields
+    ) -> "TicketBoard":
+        """색인의 티켓 목록으로 보드 생성 (색인 공유)"""
+        board = cls(
+            project_id=project_id, version=version, tickets=index.tickets, **fields
+        )
+        board._index = index
+        return board
+
+    @property
+    def index(self) -> BoardIndex:
+        """티켓 색인 (ID/스테이지/섹션/부모별 조회)"""
+        if self._index is None:
+            self._index = BoardIndex(self.tickets)
+        return self._index
+
+
+class VersionedTicket(BaseModel):
+    """버전이 붙은 티켓 단건"""
+
+    ticket: Ticket = Field(..., description="티켓")
+    version: Optional[str] = Field(default=None, description="todo.md 내용 해시")
+
+
+class BoardDiff(BaseModel):
+    """
+    두 버전 사이의 티켓 변경분.
+
+    기준 버전 티켓에서 removed_ticket_ids를 빼고, 남은 티켓 중 line_number가
+    end_line_base보다 큰 티켓의 라인 필드(line_number, section.line_number)를
+    line_delta만큼 이동한 뒤 tickets를 더하면 현재 보드가 된다.
+    변경 구간 [start_line, end_line_base]는 계층(에픽/자식)과 섹션 소속이 바뀐
+    티켓을 모두 포함하도록 확장되어 있고, ID는 라인과 무관하므로 이동하지 않는다.
+    """
+
+    base_version: str = Field(..., description="기준 버전 (클라이언트가 보낸 If-Match)")
+    version: str = Field(..., description="현재 버전")
+    start_line: int = Field(..., description="변경 구간 시작 라인 (두 버전 공통)")
+    end_line_base: int = Field(..., description="기준 버전의 변경 구간 끝 라인")
+    end_line: int = Field(..., description="현재 버전의 변경 구간 끝 라인")
+    removed_ticket_ids: list[str] = Field(
+        default_factory=list, description="기준 버전에서 빠지는 티켓 ID (구간 + 순번 변경)"
+    )
+    tickets: list[Ticket] = Field(default_factory=list, description="현재 버전에서 더할 티켓")
+    sections: list[Section] = Field(default_factory=list, description="현재 버전 전체 섹션")
+    changed_ticket_ids: list[str] = Field(
+        default_factory=list,
+        description="removed_ticket_ids 중 자기 라인이 바뀌었거나 사라진 티켓 ID "
+        "(나머지는 구간에 포함됐을 뿐 현재 버전에 같은 ID·내용으로 남아 있음)",
+    )
+
+    @computed_field
+    @property
+    def line_delta(self) -> int:
+        """구간 뒤 라인 이동량"""
+        return self.end_line - self.end_line_base
+
+    def rebase_ticket_id(self, ticket_id: str) -> Optional[str]:
+        """
+        기준 버전 티켓 ID → 현재 버전 ID (그 티켓 자체가 바뀌었거나 사라졌으면 None).
+
+        라인과 무관한 ID는 변경 구간에 들어 있어도 자기 라인이 그대로면
+        (같은 루트 블록의 다른 티켓만 바뀌었으면) 그대로 유효하다. 이전 형식
+        ("{project_id}:{라인번호}")은 구간 뒤면 line_delta만큼 이동한다.
+        """
+        project_id, _, local_id = ticket_id.rpartition(":")
+        if not local_id.isdigit():
+            return None if ticket_id in self.changed_ticket_ids else ticket_id
+        line_number = int(local_id)
+        if line_number < self.start_line:
+            return ticket_id
+        if line_number > self.end_line_base:
+            return f"{project_id}:{line_number + self.line_delta}"
+        return None
+
+
+class VersionConflictError(Exception):
+    """요청 기준 버전과 현재 todo.md 버전 불일치 (HTTP 409)"""
+
+    def __init__(
+        self,
+        expected_version: str,
+        current_version: Optional[str],
+        diff: Optional[BoardDiff] = None,
+    ) -> None:
+        super().__init__(
+            f"todo.md 버전 불일치: 요청 {expected_version}, 현재 {current_version}"
+        )
+        self.expected_version = expected_version
+        self.current_version = current_version
+        # 기준 버전이 최근 이력에 없으면 None (전체 다시 조회 필요)
+        self.diff = diff
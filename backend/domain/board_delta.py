@@ -0,0 +1,47 @@
+"""보드 변경분 Value Object — 변경 요청 전후 보드의 티켓 단위 차이 (delta 응답용)"""
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from backend.domain.section import Section
+from backend.domain.ticket import Ticket
+
+
+class LineShift(BaseModel):
+    """기준 버전 라인 [start_line, end_line]이 delta만큼 이동"""
+
+    model_config = ConfigDict(frozen=True)
+
+    start_line: int = Field(..., description="기준 버전 시작 라인")
+    end_line: int = Field(..., description="기준 버전 끝 라인 (포함)")
+    delta: int = Field(..., description="라인 이동량")
+
+    def apply(self, line_number: int) -> int:
+        """구간 안 라인이면 이동한 라인, 아니면 그대로"""
+        if self.start_line <= line_number <= self.end_line:
+            return line_number + self.delta
+        return line_number
+
+
+class BoardDelta(BaseModel):
+    """
+    기준 버전 → 현재 버전 티켓 변경분.
+
+    기준 버전 티켓에서 removed_ticket_ids를 빼고, 남은 티켓의 line_number와
+    section.line_number에 line_shifts를 적용한 뒤 changed(같은 ID)로 교체하고
+    added를 더해 line_number 순으로 정렬하면 현재 보드가 된다.
+    line_shifts에 없는 라인은 그대로다.
+    """
+
+    project_id: str = Field(..., description="프로젝트 ID")
+    base_version: str = Field(..., description="변경 적용 전 버전")
+    version: str = Field(..., description="변경 적용 후 버전")
+    total: int = Field(..., description="현재 전체 티켓 수")
+    added: list[Ticket] = Field(default_factory=list, description="새 티켓")
+    changed: list[Ticket] = Field(
+        default_factory=list, description="내용/계층이 바뀐 티켓 (라인 이동만 한 티켓 제외)"
+    )
+    removed_ticket_ids: list[str] = Field(default_factory=list, description="사라진 티켓 ID")
+    line_shifts: list[LineShift] = Field(
+        default_factory=list, description="기준 버전 라인 이동 구간 (겹치지 않음, 라인 순)"
+    )
+    sections: list[Section] = Field(default_factory=list, description="현재 버전 전체 섹션")
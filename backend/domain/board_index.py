@@ -0,0 +1,86 @@
+"""보드 색인 — 티켓 목록을 ID/스테이지/섹션/부모별로 조회하는 해시 맵"""
+
+from typing import Iterable, Optional
+
+from backend.domain.section import Section
+from backend.domain.ticket import KanbanStage, Ticket
+
+
+class BoardIndex:
+    """
+    파싱 결과 하나에 대한 읽기 전용 티켓 색인.
+
+    티켓 목록을 한 번 순회하여 ticket_id / 스테이지 / 섹션명 / parent_id →
+    티켓 위치(tickets 인덱스) 맵을 만든다. 조회는 O(1), 그룹 조회는 O(k).
+    파싱 결과마다 한 번만 만들어 저장소/서비스/라우터가 공유하므로
+    tickets와 반환 목록을 변경하면 안 된다.
+    """
+
+    __slots__ = (
+        "tickets",
+        "sections",
+        "_by_id",
+        "_by_stage",
+        "_by_section",
+        "_by_parent",
+        "_section_by_name",
+    )
+
+    def __init__(
+        self, tickets: list[Ticket], sections: Iterable[Section] = ()
+    ) -> None:
+        self.tickets = tickets
+        self.sections = list(sections)
+
+        by_id: dict[str, int] = {}
+        by_stage: dict[KanbanStage, list[int]] = {stage: [] for stage in KanbanStage}
+        by_section: dict[str, list[int]] = {}
+        by_parent: dict[str, list[int]] = {}
+        for position, ticket in enumerate(tickets):
+            by_id[ticket.ticket_id] = position
+            by_stage[ticket.stage].append(position)
+            by_section.setdefault(ticket.section.name, []).append(position)
+            if ticket.parent_id is not None:
+                by_parent.setdefault(ticket.parent_id, []).append(position)
+        self._by_id = by_id
+        self._by_stage = by_stage
+        self._by_section = by_section
+        self._by_parent = by_parent
+
+        # 같은 이름의 섹션이 여럿이면 첫 번째 (티켓 생성 위치와 같은 규칙)
+        section_by_name: dict[str, Section] = {}
+        for section in self.sections:
+            section_by_name.setdefault(section.name, section)
+        self._section_by_name = section_by_name
+
+    def __len__(self) -> int:
+        return len(self.tickets)
+
+    def get(self, ticket_id: str) -> Optional[Ticket]:
+        """ID로 티켓 조회 (없으면 None)"""
+        position = self._by_id.get(ticket_id)
+        return None if position is None else self.tickets[position]
+
+    def stage_positions(self, stage: KanbanStage) -> list[int]:
+        """스테이지의 티켓 위치 목록 (파일 순서) — 응답 모델 재사용용"""
+        return self._by_stage[stage]
+
+    def by_stage(self, stage: KanbanStage) -> list[Ticket]:
+        """스테이지의 티켓 (파일 순서)"""
+        return [self.tickets[position] for position in self._by_stage[stage]]
+
+    def count_by_stage(self) -> dict[KanbanStage, int]:
+        """스테이지별 티켓 수 (모든 스테이지 키 포함)"""
+        return {stage: len(positions) for stage, positions in self._by_stage.items()}
+
+    def in_section(self, section_name: str) -> list[Ticket]:
+        """섹션명의 티켓 (파일 순서)"""
+        return [self.tickets[p] for p in self._by_section.get(section_name, ())]
+
+    def children(self, ticket_id: str) -> list[Ticket]:
+        """직계 자식 티켓 (파일 순서)"""
+        return [self.tickets[p] for p in self._by_parent.get(ticket_id, ())]
+
+    def section(self, section_name: str) -> Optional[Section]:
+        """이름으로 섹션 조회 (없으면 None)"""
+        return self._section_by_name.get(section_name)
@@ -0,0 +1,16 @@
+"""대시보드 Value Object — 전체 프로젝트 요약과 스테이지별 합계"""
+
+from pydantic import BaseModel, Field
+
+from backend.domain.project import Project
+
+
+class Dashboard(BaseModel):
+    """대시보드 집계 (프로젝트 목록은 폴더 이름순)"""
+
+    total_projects: int = Field(..., description="전체 프로젝트 수")
+    total_tickets: int = Field(..., description="전체 티켓 수")
+    total_by_stage: dict[str, int] = Field(
+        default_factory=dict, description="전체 스테이지별 티켓 수"
+    )
+    projects: list[Project] = Field(default_factory=list, description="프로젝트별 요약")
@@ -3,9 +3,13 @@
 from abc import ABC, abstractmethod
 from typing import Optional
 
+from backend.domain.board import TicketBoard, VersionedTicket
+from backend.domain.board_delta import BoardDelta
+from backend.domain.dashboard import Dashboard
 from backend.domain.note import ProjectNote
 from backend.domain.project import Project
 from backend.domain.ticket import KanbanStage, Ticket
+from backend.domain.ticket_operation import TicketBatchResult, TicketOperation
 
 
 class ProjectRepository(ABC):
@@ -21,13 +25,28 @@ class ProjectRepository(ABC):
         """특정 프로젝트 조회"""
         pass
 
+    @abstractmethod
+    async def get_dashboard(self) -> Dashboard:
+        """전체 프로젝트 요약과 스테이지별 합계"""
+        pass
+
+    @abstractmethod
+    async def find_tickets(self, stage: Optional[KanbanStage] = None) -> list[Ticket]:
+        """전체 프로젝트의 티켓 (stage가 주어지면 그 스테이지만, 프로젝트/라인 순)"""
+        pass
+
 
 class TicketRepository(ABC):
-    """티켓 저장소 인터페이스"""
+    """
+    티켓 저장소 인터페이스.
+
+    변경 메서드의 expected_version은 요청 기준 todo.md 버전(내용 해시) —
+    현재 버전과 다르면 변경 없이 VersionConflictError를 발생시킨다.
+    """
 
     @abstractmethod
-    async def get_all_by_project(self, project_id: str) -> list[Ticket]:
-        """특정 프로젝트의 모든 티켓 반환"""
+    async def get_all_by_project(self, project_id: str) -> TicketBoard:
+        """특정 프로젝트의 모든 티켓 반환 (버전 포함)"""
         pass
 
     @abstractmethod
@@ -37,41 +56,76 @@ class TicketRepository(ABC):
         """특정 티켓 조회"""
         pass
 
+    @abstractmethod
+    async def get_delta(
+        self, project_id: str, base_version: str, version: str
+    ) -> Optional[BoardDelta]:
+        """두 버전 사이 티켓 변경분 (계산할 수 없으면 None)"""
+        pass
+
     @abstractmethod
     async def update_stage(
-        self, project_id: str, ticket_id: str, new_stage: KanbanStage
-    ) -> Ticket:
+        self,
+        project_id: str,
+        ticket_id: str,
+        new_stage: KanbanStage,
+        expected_version: Optional[str] = None,
+    ) -> VersionedTicket:
         """티켓 스테이지 변경 (todo.md 마커 교체)"""
         pass
 
     @abstractmethod
     async def delete_ticket(
-        self, project_id: str, ticket_id: str
-    ) -> list[Ticket]:
+        self,
+        project_id: str,
+        ticket_id: str,
+        expected_version: Optional[str] = None,
+    ) -> TicketBoard:
         """티켓 삭제 후 전체 티켓 목록 반환 (라인번호 재계산)"""
         pass
 
     @abstractmethod
     async def delete_tickets(
-        self, project_id: str, ticket_ids: list[str]
-    ) -> list[Ticket]:
+        self,
+        project_id: str,
+        ticket_ids: list[str],
+        expected_version: Optional[str] = None,
+    ) -> TicketBoard:
         """복수 티켓 일괄 삭제 후 전체 티켓 목록 반환"""
         pass
 
     @abstractmethod
     async def create_ticket(
-        self, project_id: str, section_name: str, title: str
-    ) -> list[Ticket]:
+        self,
+        project_id: str,
+        section_name: str,
+        title: str,
+        expected_version: Optional[str] = None,
+    ) -> TicketBoard:
         """티켓 생성 후 전체 티켓 목록 반환 (라인번호 재계산)"""
         pass
 
     @abstractmethod
     async def create_child_ticket(
-        self, project_id: str, parent_ticket_id: str, title: str
-    ) -> list[Ticket]:
+        self,
+        project_id: str,
+        parent_ticket_id: str,
+        title: str,
+        expected_version: Optional[str] = None,
+    ) -> TicketBoard:
         """부모 티켓 아래 자식 생성 후 전체 목록 반환"""
         pass
 
+    @abstractmethod
+    async def apply_batch(
+        self,
+        project_id: str,
+        operations: list[TicketOperation],
+        expected_version: Optional[str] = None,
+    ) -> TicketBatchResult:
+        """여러 작업을 한 번의 파싱/쓰기로 원자 적용 후 결과 반환"""
+        pass
+
 
 class NoteRepository(ABC):
     """프로젝트 노트 저장소 인터페이스"""
@@ -1,5 +1,7 @@
 """프로젝트 Entity — pj.* 폴더에 대응하는 관리 단위"""
 
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
 from backend.domain.section import Section
@@ -29,4 +31,11 @@ class Project(BaseModel):
         default_factory=dict,
         description="스테이지별 티켓 수 집계",
     )
+    ticket_count_by_section: dict[str, dict[str, int]] = Field(
+        default_factory=dict,
+        description="섹션별 스테이지별 티켓 수 (섹션명 → 스테이지 → 수)",
+    )
     color: str = Field(default="#6366f1", description="프로젝트 식별 색상")
+    version: Optional[str] = Field(
+        default=None, description="todo.md 내용 해시 (티켓 변경 If-Match 값)"
+    )
@@ -62,7 +62,7 @@ CHECKBOX_PATTERN = re.compile(r"^(\s*)- \[([xX ~QD])\]\s+(.+)$")
 class Ticket(BaseModel):
     """칸반 보드의 기본 단위 — todo.md의 체크박스 항목 하나"""
 
-    ticket_id: str = Field(..., description="고유 식별자 (프로젝트ID:라인번호)")
+    ticket_id: str = Field(..., description="고유 식별자 (프로젝트ID:섹션+제목 해시[-중복순번])")
     title: str = Field(..., description="마커 제거 후 순수 텍스트")
     stage: KanbanStage = Field(..., description="현재 칸반 스테이지")
     section: Section = Field(..., description="소속 섹션 (카테고리)")
@@ -0,0 +1,73 @@
+"""티켓 일괄 작업 Value Object — 여러 변경을 한 번의 파싱/쓰기로 적용하는 단위"""
+
+from enum import Enum
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from backend.domain.board import TicketBoard
+from backend.domain.ticket import KanbanStage
+
+
+class TicketOpType(str, Enum):
+    """일괄 작업 종류"""
+
+    MOVE = "move"                  # 스테이지 변경
+    DELETE = "delete"              # 삭제
+    CREATE = "create"              # 섹션에 새 티켓 생성
+    CREATE_CHILD = "create_child"  # 부모 티켓 아래 자식 생성
+
+
+class TicketOperation(BaseModel):
+    """
+    일괄 작업 하나 (VO).
+
+    ticket_id는 배치 적용 직전 상태 기준 — 같은 배치의 앞선 작업으로 인한
+    라인 이동은 저장소가 보정한다.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    op: TicketOpType = Field(..., description="작업 종류")
+    ticket_id: Optional[str] = Field(
+        default=None, description="대상 티켓 ID (move/delete) 또는 부모 ID (create_child)"
+    )
+    new_stage: Optional[KanbanStage] = Field(default=None, description="이동할 스테이지 (move)")
+    section_name: Optional[str] = Field(default=None, description="소속 섹션명 (create)")
+    title: Optional[str] = Field(default=None, description="새 티켓 제목 (create/create_child)")
+    cascade: bool = Field(
+        default=False, description="직계 자식에도 같은 작업 적용 (move/delete)"
+    )
+
+    @classmethod
+    def move(
+        cls, ticket_id: str, new_stage: KanbanStage, cascade: bool = False
+    ) -> "TicketOperation":
+        return cls(
+            op=TicketOpType.MOVE,
+            ticket_id=ticket_id,
+            new_stage=new_stage,
+            cascade=cascade,
+        )
+
+    @classmethod
+    def delete(cls, ticket_id: str, cascade: bool = False) -> "TicketOperation":
+        return cls(op=TicketOpType.DELETE, ticket_id=ticket_id, cascade=cascade)
+
+
+class TicketBatchResult(TicketBoard):
+    """일괄 작업 결과 — 적용 후 전체 티켓(+버전) + 대상 티켓의 ID 변화"""
+
+    id_map: dict[str, str] = Field(
+        default_factory=dict,
+        description="이동 대상(cascade 자식 포함)/부모 티켓의 적용 전 ID → 적용 후 ID (작업 순서)",
+    )
+
+    def targets(self) -> TicketBoard:
+        """id_map 대상 티켓만 모은 보드 (작업 순서)"""
+        index = self.index
+        return TicketBoard(
+            project_id=self.project_id,
+            version=self.version,
+            tickets=[index.get(tid) for tid in self.id_map.values()],
+        )
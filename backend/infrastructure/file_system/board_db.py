@@ -0,0 +1,603 @@
+"""보드 영속 색인 — 파싱된 보드(섹션/스테이지별 수/티켓)를 SQLite에 저장해 재시작 후 재사용"""
+
+import heapq
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, NamedTuple, Optional
+
+from backend.core.config import settings
+from backend.domain.section import Section
+from backend.domain.ticket import KanbanStage, Ticket, TicketType
+from backend.infrastructure.file_system.parse_cache import FileFingerprint
+from backend.infrastructure.file_system.ticket_table import STAGES
+from backend.infrastructure.file_system.todo_parser import (
+    ParseResult,
+    StoredBoard,
+    TodoSummary,
+)
+
+logger = logging.getLogger(__name__)
+
+# 스키마 버전 (PRAGMA user_version) — 테이블이나 티켓 컬럼 직렬화 형식이
+# 바뀌면 올린다 (파일의 버전이 다르면 테이블을 다시 만든다)
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE boards (
+    todo_path TEXT PRIMARY KEY,
+    project_id TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    digest TEXT NOT NULL,
+    title TEXT NOT NULL,
+    -- 이하 전체 파싱 결과 (요약만 저장했으면 NULL, 티켓 행도 없음)
+    title_line INTEGER,
+    line_count INTEGER,
+    ticket_count INTEGER,
+    columns BLOB,
+    -- 티켓 행 저장 여부 (조회에 필요할 때만 만든다)
+    tickets_indexed INTEGER NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE sections (
+    todo_path TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    line_number INTEGER NOT NULL,
+    PRIMARY KEY (todo_path, position)
+);
+-- section_position -1 = 미분류, 0이 아닌 수만 저장
+CREATE TABLE stage_counts (
+    todo_path TEXT NOT NULL,
+    section_position INTEGER NOT NULL,
+    stage TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (todo_path, section_position, stage)
+);
+CREATE TABLE tickets (
+    todo_path TEXT NOT NULL,
+    ticket_id TEXT NOT NULL,
+    project_id TEXT NOT NULL,
+    line_number INTEGER NOT NULL,
+    stage TEXT NOT NULL,
+    section TEXT NOT NULL,
+    section_line INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    raw_line TEXT NOT NULL,
+    indent_level INTEGER NOT NULL,
+    ticket_type TEXT NOT NULL,
+    parent_id TEXT,
+    children_ids TEXT NOT NULL,  -- JSON 배열
+    PRIMARY KEY (todo_path, ticket_id)
+);
+CREATE INDEX tickets_by_stage ON tickets (stage, project_id, line_number);
+"""
+
+_TABLES = ("boards", "sections", "stage_counts", "tickets")
+_STAGE_CODE = {stage.value: code for code, stage in enumerate(STAGES)}
+_TICKET_COLUMNS = (
+    "ticket_id, line_number, stage, section, section_line, title, raw_line,"
+    " indent_level, ticket_type, parent_id, children_ids"
+)
+# 티켓 조회 한 번에 바인딩할 경로 수 (SQLite 변수 개수 한도 안)
+_PATH_CHUNK = 500
+
+
+class _Pending(NamedTuple):
+    """저장 대기 항목 — summary/result가 모두 None이면 삭제"""
+
+    project_id: str
+    fingerprint: Optional[FileFingerprint]
+    summary: Optional[TodoSummary]
+    result: Optional[ParseResult]
+    # 티켓 행까지 저장 (result가 있을 때만)
+    tickets: bool = False
+
+    @property
+    def digest(self) -> Optional[str]:
+        if self.result is not None:
+            return self.result.digest
+        return self.summary.digest if self.summary is not None else None
+
+    @property
+    def level(self) -> int:
+        """저장 범위 (0 요약, 1 + 티켓 컬럼, 2 + 티켓 행)"""
+        if self.result is None:
+            return 0
+        return 2 if self.tickets else 1
+
+
+class BoardDatabase:
+    """
+    파싱된 보드의 SQLite 영속 색인 (프로세스 전역, 선택 기능).
+
+    todo.md 경로별로 지문(mtime_ns, 크기)/내용 해시와 함께 다음을 저장한다.
+
+    - 요약: 제목, 섹션, 섹션별 스테이지별 티켓 수 — 카탈로그가 지문이 같으면
+      todo.md를 읽지 않고 재사용한다 (재시작 직후 대시보드)
+    - 전체 파싱 결과: 티켓 컬럼 바이트 — 파서가 내용 해시가 같으면 렉싱 없이
+      복원한다 (restore)
+    - 티켓 행: 전체 프로젝트 티켓 조회가 요청한 프로젝트만 (Ticket 생성 비용이
+      커서 쓰기마다 만들지 않는다) — 스테이지별 조회는 SQL로 처리한다
+
+    저장은 경로별로 마지막 항목만 남기는(coalesce) 백그라운드 스레드 하나가
+    WAL 모드 연결로 처리하므로 요청 경로는 기다리지 않는다. 조회는 별도 연결로
+    잠금 안에서 실행한다. SQLite 오류는 기록만 하고 색인 미스로 취급한다
+    (색인은 todo.md에서 언제든 다시 만들 수 있는 캐시).
+
+    path가 None이면 비활성 — 조회는 항상 미스, 저장은 무시한다.
+    """
+
+    def __init__(self, path: Optional[str]) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+        self._reader: Optional[sqlite3.Connection] = None
+        self._cond = threading.Condition()
+        self._pending: dict[str, _Pending] = {}
+        self._retain: Optional[frozenset[str]] = None
+        self._writer: Optional[threading.Thread] = None
+        self._writing = False
+        self._closed = False
+        self._summary_hits = 0
+        self._summary_misses = 0
+        self._restores = 0
+        self._restore_misses = 0
+        self._queries = 0
+        self._submitted = 0
+        self._coalesced = 0
+        self._written = 0
+        self._errors = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._path is not None
+
+    @staticmethod
+    def _key(todo_path: str) -> str:
+        return os.path.abspath(todo_path)
+
+    # ── 연결 ──
+
+    def _connect(self) -> sqlite3.Connection:
+        """WAL 모드 연결 (스키마 버전이 다르면 테이블 재생성)"""
+        Path(self._path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            self._path, timeout=30.0, isolation_level=None, check_same_thread=False
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            conn.execute("BEGIN IMMEDIATE")
+            # 다른 연결이 먼저 만들었을 수 있으므로 잠금 안에서 다시 확인
+            if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                for table in _TABLES:
+                    conn.execute(f"DROP TABLE IF EXISTS {table}")
+                for statement in _SCHEMA.split(";"):
+                    if statement.strip():
+                        conn.execute(statement)
+                conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+            conn.execute("COMMIT")
+        return conn
+
+    def _read(self) -> sqlite3.Connection:
+        """조회 연결 (잠금 안에서 호출, 처음 필요할 때 연결)"""
+        if self._reader is None:
+            self._reader = self._connect()
+        return self._reader
+
+    # ── 조회 ──
+
+    def summary(
+        self, todo_path: str, fingerprint: FileFingerprint
+    ) -> Optional[TodoSummary]:
+        """지문이 같은 저장된 요약 (없으면 None)"""
+        if not self.enabled:
+            return None
+        key = self._key(todo_path)
+        try:
+            with self._lock:
+                conn = self._read()
+                row = conn.execute(
+                    "SELECT mtime_ns, size, digest, title FROM boards WHERE todo_path = ?",
+                    (key,),
+                ).fetchone()
+                if row is None or FileFingerprint(row[0], row[1]) != fingerprint:
+                    self._summary_misses += 1
+                    return None
+                sections = tuple(
+                    conn.execute(
+                        "SELECT name, line_number FROM sections"
+                        " WHERE todo_path = ? ORDER BY position",
+                        (key,),
+                    )
+                )
+                counts = [[0] * len(STAGES) for _ in range(len(sections) + 1)]
+                for position, stage, count in conn.execute(
+                    "SELECT section_position, stage, count FROM stage_counts"
+                    " WHERE todo_path = ?",
+                    (key,),
+                ):
+                    counts[position + 1][_STAGE_CODE[stage]] = count
+                self._summary_hits += 1
+        except sqlite3.Error as e:
+            self._failed("요약 조회", e)
+            return None
+        return TodoSummary(
+            row[3],
+            sections,
+            tuple(sum(column) for column in zip(*counts)),
+            tuple(tuple(section_counts) for section_counts in counts),
+            row[2],
+        )
+
+    def restore(self, todo_path: str, digest: str) -> Optional[StoredBoard]:
+        """내용 해시가 같은 저장된 전체 파싱 결과 (TodoParser.parse의 restore)"""
+        if not self.enabled:
+            return None
+        key = self._key(todo_path)
+        try:
+            with self._lock:
+                conn = self._read()
+                row = conn.execute(
+                    "SELECT title, title_line, line_count, ticket_count, columns"
+                    " FROM boards WHERE todo_path = ? AND digest = ?"
+                    " AND columns IS NOT NULL",
+                    (key, digest),
+                ).fetchone()
+                if row is None:
+                    self._restore_misses += 1
+                    return None
+                sections = tuple(
+                    conn.execute(
+                        "SELECT name, line_number FROM sections"
+                        " WHERE todo_path = ? ORDER BY position",
+                        (key,),
+                    )
+                )
+                self._restores += 1
+        except sqlite3.Error as e:
+            self._failed("파싱 결과 조회", e)
+            return None
+        return StoredBoard(row[0], row[1], sections, row[2], row[3], row[4])
+
+    def indexed(self, todo_path: str, fingerprint: Optional[FileFingerprint]) -> bool:
+        """지문이 같은 티켓 행이 저장되어 있는지 (대기 중인 저장은 flush 후 반영)"""
+        if not self.enabled or fingerprint is None:
+            return False
+        try:
+            with self._lock:
+                row = self._read().execute(
+                    "SELECT mtime_ns, size FROM boards"
+                    " WHERE todo_path = ? AND tickets_indexed",
+                    (self._key(todo_path),),
+                ).fetchone()
+        except sqlite3.Error as e:
+            self._failed("색인 확인", e)
+            return False
+        return row is not None and FileFingerprint(*row) == fingerprint
+
+    def tickets(
+        self, todo_paths: Iterable[str], stage: Optional[KanbanStage] = None
+    ) -> Optional[list[Ticket]]:
+        """
+        저장된 티켓 행 조회 (프로젝트 ID, 라인 순) — todo_paths의 프로젝트만.
+
+        stage가 주어지면 스테이지 색인으로 그 스테이지만 읽는다. 최신 여부는
+        호출자가 indexed/flush로 확인한다. 비활성이거나 오류면 None.
+        """
+        if not self.enabled:
+            return None
+        keys = sorted({self._key(todo_path) for todo_path in todo_paths})
+        chunks = [keys[i:i + _PATH_CHUNK] for i in range(0, len(keys), _PATH_CHUNK)]
+        try:
+            with self._lock:
+                conn = self._read()
+                parts = [
+                    conn.execute(*self._tickets_query(chunk, stage)).fetchall()
+                    for chunk in chunks
+                ]
+                self._queries += 1
+        except sqlite3.Error as e:
+            self._failed("티켓 조회", e)
+            return None
+        # 청크별로 (프로젝트 ID, 라인) 순 → 합쳐도 같은 순서
+        rows = heapq.merge(*parts, key=lambda row: (row[0], row[1]))
+        return [
+            Ticket(
+                ticket_id=row[2],
+                line_number=row[1],
+                stage=KanbanStage(row[3]),
+                section=Section(name=row[4], line_number=row[5]),
+                title=row[6],
+                raw_line=row[7],
+                indent_level=row[8],
+                ticket_type=TicketType(row[9]),
+                parent_id=row[10],
+                children_ids=json.loads(row[11]),
+            )
+            for row in rows
+        ]
+
+    @staticmethod
+    def _tickets_query(
+        keys: list[str], stage: Optional[KanbanStage]
+    ) -> tuple[str, tuple]:
+        """경로 목록(과 스테이지)의 티켓 행 조회 SQL — (프로젝트 ID, 라인) 순"""
+        marks = ", ".join("?" * len(keys))
+        sql = (
+            "SELECT project_id, line_number, ticket_id, stage, section,"
+            " section_line, title, raw_line, indent_level, ticket_type,"
+            f" parent_id, children_ids FROM tickets WHERE todo_path IN ({marks})"
+        )
+        params = tuple(keys)
+        if stage is not None:
+            sql += " AND stage = ?"
+            params += (stage.value,)
+        return sql + " ORDER BY project_id, line_number", params
+
+    # ── 저장 (백그라운드) ──
+
+    def submit_summary(
+        self,
+        project_id: str,
+        todo_path: str,
+        fingerprint: FileFingerprint,
+        summary: TodoSummary,
+    ) -> None:
+        """요약 저장 예약 (같은 내용의 전체 결과가 있으면 지문만 갱신)"""
+        if summary.digest is not None:
+            self._submit(todo_path, _Pending(project_id, fingerprint, summary, None))
+
+    def submit_result(
+        self,
+        project_id: str,
+        todo_path: str,
+        fingerprint: FileFingerprint,
+        result: ParseResult,
+        tickets: bool = False,
+    ) -> None:
+        """
+        전체 파싱 결과 저장 예약 (tickets면 티켓 행까지).
+
+        같은 내용이 이미 저장되어 있으면 지문만 갱신한다.
+        """
+        if result.digest is not None:
+            self._submit(
+                todo_path, _Pending(project_id, fingerprint, None, result, tickets)
+            )
+
+    def retain(self, todo_paths: Iterable[str]) -> None:
+        """todo_paths 밖의 저장 항목 삭제 예약 (사라진 프로젝트 정리)"""
+        if not self.enabled:
+            return
+        with self._cond:
+            self._retain = frozenset(self._key(todo_path) for todo_path in todo_paths)
+            self._wake()
+
+    def _submit(self, todo_path: str, item: _Pending) -> None:
+        if not self.enabled:
+            return
+        key = self._key(todo_path)
+        with self._cond:
+            if self._closed:
+                return
+            self._submitted += 1
+            previous = self._pending.get(key)
+            if previous is not None:
+                self._coalesced += 1
+                # 같은 내용을 더 넓게 저장할 항목이 대기 중이면 지문만 이어받음
+                if previous.digest == item.digest and previous.level > item.level:
+                    self._pending[key] = previous._replace(fingerprint=item.fingerprint)
+                    return
+            self._pending[key] = item
+            self._wake()
+
+    def _wake(self) -> None:
+        """저장 스레드 깨우기 (없으면 시작, _cond 안에서 호출)"""
+        if self._writer is None:
+            self._writer = threading.Thread(
+                target=self._run, name="board-db-writer", daemon=True
+            )
+            self._writer.start()
+        self._cond.notify_all()
+
+    def _run(self) -> None:
+        """저장 스레드 — 대기 항목을 모아 트랜잭션 하나로 기록"""
+        conn: Optional[sqlite3.Connection] = None
+        while True:
+            with self._cond:
+                while not self._pending and self._retain is None and not self._closed:
+                    self._cond.wait()
+                if not self._pending and self._retain is None:
+                    break
+                batch, self._pending = self._pending, {}
+                retain, self._retain = self._retain, None
+                self._writing = True
+            try:
+                if conn is None:
+                    conn = self._connect()
+                self._write(conn, batch, retain)
+            except sqlite3.Error as e:
+                self._failed("저장", e)
+            finally:
+                with self._cond:
+                    self._writing = False
+                    self._cond.notify_all()
+        if conn is not None:
+            conn.close()
+
+    def _write(
+        self,
+        conn: sqlite3.Connection,
+        batch: dict[str, _Pending],
+        retain: Optional[frozenset[str]],
+    ) -> None:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for key, item in batch.items():
+                self._write_one(conn, key, item)
+            if retain is not None:
+                stored = [row[0] for row in conn.execute("SELECT todo_path FROM boards")]
+                for key in stored:
+                    if key not in retain:
+                        self._delete(conn, key)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        with self._cond:
+            self._written += len(batch)
+
+    def _write_one(self, conn: sqlite3.Connection, key: str, item: _Pending) -> None:
+        """항목 하나 기록 (트랜잭션 안)"""
+        if item.summary is None and item.result is None:
+            self._delete(conn, key)
+            return
+        row = conn.execute(
+            "SELECT digest, project_id, (columns IS NOT NULL) + tickets_indexed"
+            " FROM boards WHERE todo_path = ?",
+            (key,),
+        ).fetchone()
+        if row is not None and row[0] == item.digest and row[1] == item.project_id:
+            # 내용이 같음 — 지문 갱신 (티켓 컬럼은 있고 티켓 행만 빠졌으면 추가)
+            add_tickets = row[2] == 1 and item.level == 2
+            if row[2] >= item.level or add_tickets:
+                conn.execute(
+                    "UPDATE boards SET mtime_ns = ?, size = ?, updated_at = ?,"
+                    " tickets_indexed = tickets_indexed OR ? WHERE todo_path = ?",
+                    (*item.fingerprint, time.time(), add_tickets, key),
+                )
+                if add_tickets:
+                    self._insert_tickets(conn, key, item)
+                return
+
+        self._delete(conn, key)
+        result = item.result
+        summary = item.summary if result is None else TodoSummary.of(result)
+        stored = StoredBoard.of(result) if result is not None else None
+        conn.execute(
+            "INSERT INTO boards VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                key,
+                item.project_id,
+                *item.fingerprint,
+                summary.digest,
+                summary.title,
+                stored.title_line_number if stored else None,
+                stored.line_count if stored else None,
+                stored.ticket_count if stored else None,
+                stored.columns if stored else None,
+                item.tickets,
+                time.time(),
+            ),
+        )
+        conn.executemany(
+            "INSERT INTO sections VALUES (?, ?, ?, ?)",
+            (
+                (key, position, name, line_number)
+                for position, (name, line_number) in enumerate(summary.sections)
+            ),
+        )
+        conn.executemany(
+            "INSERT INTO stage_counts VALUES (?, ?, ?, ?)",
+            (
+                (key, position - 1, stage.value, count)
+                for position, counts in enumerate(summary.section_stage_counts)
+                for stage, count in zip(STAGES, counts)
+                if count
+            ),
+        )
+        if item.tickets:
+            self._insert_tickets(conn, key, item)
+
+    @staticmethod
+    def _insert_tickets(conn: sqlite3.Connection, key: str, item: _Pending) -> None:
+        conn.executemany(
+            f"INSERT INTO tickets (todo_path, project_id, {_TICKET_COLUMNS})"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                (
+                    key,
+                    item.project_id,
+                    ticket.ticket_id,
+                    ticket.line_number,
+                    ticket.stage.value,
+                    ticket.section.name,
+                    ticket.section.line_number,
+                    ticket.title,
+                    ticket.raw_line,
+                    ticket.indent_level,
+                    ticket.ticket_type.value,
+                    ticket.parent_id,
+                    json.dumps(ticket.children_ids),
+                )
+                for ticket in item.result.tickets
+            ),
+        )
+
+    @staticmethod
+    def _delete(conn: sqlite3.Connection, key: str) -> None:
+        for table in _TABLES:
+            conn.execute(f"DELETE FROM {table} WHERE todo_path = ?", (key,))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """대기 중인 저장이 끝날 때까지 대기 (시간 초과면 False)"""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not self._pending and self._retain is None and not self._writing,
+                timeout,
+            )
+
+    def close(self) -> None:
+        """대기 중인 저장을 마치고 연결 종료 (앱 종료 시)"""
+        with self._cond:
+            self._closed = True
+            writer = self._writer
+            self._cond.notify_all()
+        if writer is not None:
+            writer.join()
+        with self._lock:
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
+
+    def _failed(self, action: str, error: sqlite3.Error) -> None:
+        with self._cond:
+            self._errors += 1
+        logger.warning(f"보드 영속 색인 {action} 실패: {error}")
+
+    def stats(self) -> dict:
+        """색인 히트/미스, 저장 대기/병합/기록 수, 오류 수"""
+        with self._cond:
+            return {
+                "enabled": self.enabled,
+                "path": self._path,
+                "summary_hits": self._summary_hits,
+                "summary_misses": self._summary_misses,
+                "restores": self._restores,
+                "restore_misses": self._restore_misses,
+                "queries": self._queries,
+                "submitted": self._submitted,
+                "coalesced": self._coalesced,
+                "pending": len(self._pending),
+                "written": self._written,
+                "errors": self._errors,
+            }
+
+
+def _default_path() -> Optional[str]:
+    """설정의 색인 파일 경로 (비활성이면 None, 비어 있으면 중앙 저장소 pj.0 아래)"""
+    if not settings.BOARD_INDEX_ENABLED:
+        return None
+    if settings.BOARD_INDEX_PATH:
+        return settings.BOARD_INDEX_PATH
+    return str(Path(settings.PROJECTS_ROOT) / "pj.0" / "board_index.sqlite3")
+
+
+# 프로세스 전역 보드 영속 색인 (카탈로그/보드 저장소/프로젝트 저장소가 공유)
+board_db = BoardDatabase(_default_path())
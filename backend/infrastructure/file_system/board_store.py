@@ -0,0 +1,230 @@
+"""보드 저장소 — 프로젝트별 최신 파싱 결과를 메모리에 유지하는 쓰기 관통(write-through) 읽기 모델"""
+
+import os
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from backend.core.config import settings
+from backend.infrastructure.file_system.board_db import board_db
+from backend.infrastructure.file_system.io_executor import io_executor
+from backend.infrastructure.file_system.parse_cache import (
+    FileFingerprint,
+    file_fingerprint,
+    parse_cache,
+)
+from backend.infrastructure.file_system.todo_parser import ParseResult, TodoParser
+
+# 메모리 추정치 — 티켓당 컬럼/키/ID 역색인, BoardIndex가 만들어졌으면 Ticket 모델
+_TABLE_BYTES_PER_TICKET = 200
+_MODEL_BYTES_PER_TICKET = 1500
+
+
+def estimate_size(result: ParseResult) -> int:
+    """파싱 결과가 차지하는 메모리 추정치 (바이트)"""
+    per_ticket = _TABLE_BYTES_PER_TICKET
+    if result.indexed:
+        per_ticket += _MODEL_BYTES_PER_TICKET
+    return sys.getsizeof(result.table.buffer) + len(result.table) * per_ticket
+
+
+@dataclass
+class _Board:
+    project_id: str
+    # 결과가 반영한 파일 지문 (감시 이벤트 시 자기 쓰기 판별)
+    fingerprint: Optional[FileFingerprint]
+    result: ParseResult
+    size: int
+
+
+class BoardStore:
+    """
+    프로젝트별 최신 ParseResult 저장소 (프로세스 전역).
+
+    - 읽기: 파일 감시 중인 프로젝트(watch)의 상주 결과는 파일 시스템을 전혀
+      거치지 않고 반환하고, 아니면 파서(stat + 파싱 캐시)로 읽어 상주시킨다.
+    - 쓰기: 저장소가 쓰기 후 증분 결과를 put으로 넣는다 (디스크와 메모리 동시 갱신).
+      파싱 캐시 세대가 그 사이 바뀌었으면(다른 쓰기/외부 편집) 넣지 않고 비운다.
+    - 외부 편집: 감시자가 refresh를 호출하면 상주 중인 그 프로젝트만 다시 읽는다.
+    - 메모리: 추정 크기 합이 max_bytes를 넘으면 가장 오래 안 쓴 프로젝트부터 내린다.
+
+    감시 중이 아닌 프로젝트는 외부 편집을 알 수 없으므로 상주 결과를 쓰지 않는다.
+    변경 요청은 TodoWriter가 실제 파일 내용 해시로 기대 버전을 검사하므로
+    감시 이벤트 도착 전의 오래된 메모리 결과로 잘못 쓰는 일은 없다 (409 후 재로드).
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self._lock = threading.Lock()
+        self._boards: OrderedDict[str, _Board] = OrderedDict()
+        # 파일 감시 중인 프로젝트 디렉토리 (절대 경로)
+        self._watched: set[str] = set()
+        self._parser = TodoParser()
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._hits = 0
+        self._loads = 0
+        self._refreshes = 0
+        self._evictions = 0
+
+    @staticmethod
+    def _key(file_path: str) -> str:
+        return os.path.abspath(file_path)
+
+    # ── 감시 범위 ──
+
+    def watch(self, project_dirs: Iterable[str]) -> None:
+        """파일 감시 중인 프로젝트 디렉토리 설정 (이 안의 결과만 메모리에서 바로 반환)"""
+        with self._lock:
+            self._watched = {os.path.abspath(d) for d in project_dirs}
+
+    def unwatch(self) -> None:
+        """파일 감시 종료 — 이후 읽기는 파일 지문을 다시 확인"""
+        self.watch(())
+
+    # ── 조회 ──
+
+    def peek(self, file_path: str, project_id: str) -> Optional[ParseResult]:
+        """파일 시스템 접근 없이 반환 가능한 상주 결과 (감시 중이 아니면 None)"""
+        key = self._key(file_path)
+        with self._lock:
+            board = self._boards.get(key)
+            if (
+                board is None
+                or board.project_id != project_id
+                or os.path.dirname(key) not in self._watched
+            ):
+                return None
+            self._boards.move_to_end(key)
+            self._hits += 1
+            self._resize(board)
+            return board.result
+
+    def resident(self, file_path: str) -> Optional[ParseResult]:
+        """상주 결과 (감시 여부·히트 집계와 무관 — 변경 알림의 diff 기준)"""
+        with self._lock:
+            board = self._boards.get(self._key(file_path))
+        return board.result if board is not None else None
+
+    def load(self, file_path: str, project_id: str) -> ParseResult:
+        """
+        파일에서 읽어 상주시키고 반환 (I/O 스레드에서 호출).
+
+        파싱 캐시를 거치고, 캐시에 없으면 영속 색인의 같은 내용 결과를 복원한다.
+        """
+        generation = parse_cache.generation(file_path)
+        fingerprint = file_fingerprint(file_path)
+        result = self._parser.parse(file_path, project_id, restore=board_db.restore)
+        with self._lock:
+            self._loads += 1
+        self.put(file_path, result, fingerprint, generation)
+        return result
+
+    async def get(self, file_path: str, project_id: str) -> ParseResult:
+        """상주 결과 우선 조회, 없으면 I/O 스레드에서 load"""
+        result = self.peek(file_path, project_id)
+        if result is None:
+            result = await io_executor.run(self.load, file_path, project_id)
+        return result
+
+    # ── 갱신 ──
+
+    def put(
+        self,
+        file_path: str,
+        result: ParseResult,
+        fingerprint: Optional[FileFingerprint],
+        generation: int,
+    ) -> None:
+        """
+        결과 상주 (쓰기 후 증분 결과 / load) — 영속 색인에도 저장을 예약한다.
+
+        generation은 결과가 반영한 파싱 캐시 세대 — 그 뒤 무효화가 있었으면
+        더 새로운 내용이 있을 수 있으므로 넣지 않고 기존 항목도 비운다.
+        """
+        key = self._key(file_path)
+        with self._lock:
+            if fingerprint is None or generation != parse_cache.generation(file_path):
+                self._drop(key)
+                return
+            self._drop(key)
+            board = _Board(result.project_id, fingerprint, result, estimate_size(result))
+            self._boards[key] = board
+            self._bytes += board.size
+            self._evict()
+        board_db.submit_result(result.project_id, file_path, fingerprint, result)
+
+    async def refresh(self, file_path: str) -> None:
+        """
+        외부 편집 반영 (파일 감시 이벤트) — 상주 중인 프로젝트만 다시 읽는다.
+
+        파일 지문이 상주 결과와 같으면(이 프로세스의 쓰기) 다시 읽지 않는다.
+        """
+        key = self._key(file_path)
+        with self._lock:
+            board = self._boards.get(key)
+        if board is None:
+            return
+        fingerprint = await io_executor.run(file_fingerprint, file_path)
+        if fingerprint is not None and fingerprint == board.fingerprint:
+            return
+        with self._lock:
+            self._refreshes += 1
+            if self._boards.get(key) is board:
+                self._drop(key)
+        if fingerprint is not None:
+            await io_executor.run(self.load, file_path, board.project_id)
+
+    def evict(self, file_path: str) -> None:
+        """프로젝트 결과 내리기"""
+        with self._lock:
+            self._drop(self._key(file_path))
+
+    def clear(self) -> None:
+        """전체 비우기"""
+        with self._lock:
+            self._boards.clear()
+            self._bytes = 0
+
+    # ── 내부 (잠금 안에서 호출) ──
+
+    def _drop(self, key: str) -> None:
+        board = self._boards.pop(key, None)
+        if board is not None:
+            self._bytes -= board.size
+
+    def _resize(self, board: _Board) -> None:
+        """지연 생성된 색인 등으로 늘어난 크기 반영"""
+        size = estimate_size(board.result)
+        if size != board.size:
+            self._bytes += size - board.size
+            board.size = size
+            self._evict()
+
+    def _evict(self) -> None:
+        """메모리 한도 초과 시 오래된 프로젝트부터 제거 (가장 최근 하나는 유지)"""
+        while self._bytes > self._max_bytes and len(self._boards) > 1:
+            _, board = self._boards.popitem(last=False)
+            self._bytes -= board.size
+            self._evictions += 1
+
+    def stats(self) -> dict:
+        """상주 프로젝트 수/메모리 추정치/히트·로드 카운터"""
+        with self._lock:
+            total = self._hits + self._loads
+            return {
+                "boards": len(self._boards),
+                "watched_projects": len(self._watched),
+                "bytes": self._bytes,
+                "max_bytes": self._max_bytes,
+                "hits": self._hits,
+                "loads": self._loads,
+                "refreshes": self._refreshes,
+                "evictions": self._evictions,
+                "hit_ratio": (self._hits / total) if total else 0.0,
+            }
+
+
+# 프로세스 전역 보드 저장소 (저장소/감시자가 공유)
+board_store = BoardStore(max_bytes=settings.BOARD_STORE_MAX_BYTES)
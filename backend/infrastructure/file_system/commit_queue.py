@@ -0,0 +1,116 @@
+"""파일별 그룹 커밋 큐 — 짧은 시간 창에 모인 쓰기 작업을 한 번의 파일 쓰기로 묶음"""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Callable, Generic, TypeVar, Union
+
+from backend.infrastructure.file_system.file_locks import file_locks
+from backend.infrastructure.file_system.io_executor import io_executor
+
+Op = TypeVar("Op")
+R = TypeVar("R")
+
+# 배치 처리 함수: (파일 경로, 작업 목록) → 작업별 결과 또는 예외 (순서 동일)
+FlushFn = Callable[[str, list[Op]], list[Union[R, BaseException]]]
+
+
+@dataclass
+class _Batch(Generic[Op]):
+    ops: list[Op] = field(default_factory=list)
+    futures: list[asyncio.Future] = field(default_factory=list)
+    # 작업 수 한도 도달 시 시간 창을 기다리지 않고 즉시 flush
+    full: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+class GroupCommitter(Generic[Op, R]):
+    """
+    파일별 그룹 커밋.
+
+    파일의 첫 작업이 도착하면 window초 동안(또는 max_ops개까지) 같은 파일의
+    작업을 모은 뒤, 파일 잠금을 잡고 flush(경로, 작업 목록)를 I/O 스레드에서
+    한 번 호출한다.
+    각 호출자의 future는 배치가 디스크에 기록된 뒤(flush 반환 후) 완료된다.
+    flush 중 도착한 작업은 다음 배치로 모이며, 파일 잠금 순서대로 이어서 기록된다.
+    """
+
+    def __init__(self, flush: FlushFn, window: float, max_ops: int) -> None:
+        self._flush = flush
+        self._window = window
+        self._max_ops = max(max_ops, 1)
+        self._batches: dict[str, _Batch[Op]] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._batch_count = 0
+        self._op_count = 0
+        self._max_batch = 0
+
+    async def submit(self, file_path: str, op: Op) -> R:
+        """작업을 파일의 현재 배치에 추가하고 배치 기록 완료까지 대기"""
+        key = file_locks.key(file_path)
+        loop = asyncio.get_running_loop()
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = self._batches[key] = _Batch()
+            task = loop.create_task(self._run(key, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        future = loop.create_future()
+        batch.ops.append(op)
+        batch.futures.append(future)
+        if len(batch.ops) >= self._max_ops:
+            # 가득 찬 배치는 분리 → 이후 작업은 새 배치로
+            self._detach(key, batch)
+            batch.full.set()
+        return await future
+
+    def _detach(self, key: str, batch: _Batch[Op]) -> None:
+        if self._batches.get(key) is batch:
+            del self._batches[key]
+
+    async def _run(self, key: str, batch: _Batch[Op]) -> None:
+        """시간 창 대기 → 파일 잠금 → flush → 호출자 future 완료"""
+        try:
+            await asyncio.wait_for(batch.full.wait(), timeout=self._window)
+        except asyncio.TimeoutError:
+            pass
+        self._detach(key, batch)
+
+        try:
+            async with file_locks.acquire(key):
+                outcomes = await io_executor.run(
+                    self._flush, key, batch.ops, name="flush_batch"
+                )
+        except Exception as e:
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        except BaseException:
+            for future in batch.futures:
+                future.cancel()
+            raise
+
+        self._batch_count += 1
+        self._op_count += len(batch.ops)
+        self._max_batch = max(self._max_batch, len(batch.ops))
+        for future, outcome in zip(batch.futures, outcomes):
+            if future.done():
+                continue  # 호출자 취소 (작업 자체는 이미 기록됨)
+            if isinstance(outcome, BaseException):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+    def stats(self) -> dict:
+        """배치 수/작업 수/배치 크기"""
+        return {
+            "window_ms": self._window * 1000,
+            "max_ops": self._max_ops,
+            "batches": self._batch_count,
+            "ops": self._op_count,
+            "avg_batch_size": (
+                self._op_count / self._batch_count if self._batch_count else 0.0
+            ),
+            "max_batch_size": self._max_batch,
+            "pending_files": len(self._batches),
+        }
@@ -0,0 +1,120 @@
+"""파일별 쓰기 잠금 레지스트리 — 서로 다른 todo.md 쓰기는 병렬, 같은 파일만 직렬화"""
+
+import asyncio
+import os
+import time
+import weakref
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator
+
+# 대기 지표를 보관할 최대 경로 수 (넘으면 오래 쓰지 않은 경로부터 버림)
+MAX_TRACKED_FILES = 256
+
+
+@dataclass
+class _LockStats:
+    """파일 하나의 잠금 대기 지표"""
+
+    acquisitions: int = 0
+    # 다른 쓰기가 잡고 있어 기다린 횟수
+    contended: int = 0
+    waiting: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+
+class FileLockRegistry:
+    """
+    resolved 경로별 asyncio.Lock 레지스트리.
+
+    잠금은 WeakValueDictionary에 보관하므로 사용(대기) 중인 쓰기가 없으면
+    자동으로 사라진다. 대기 시간 지표는 경로별로 누적하되 최근에 잠근
+    max_tracked개 경로만 유지한다 (대기 중인 경로는 버리지 않음).
+    """
+
+    def __init__(self, max_tracked: int = MAX_TRACKED_FILES) -> None:
+        self._locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = (
+            weakref.WeakValueDictionary()
+        )
+        self._stats: "OrderedDict[str, _LockStats]" = OrderedDict()
+        self._max_tracked = max(max_tracked, 1)
+
+    @staticmethod
+    def key(file_path: str) -> str:
+        """잠금 키 — 심볼릭 링크/상대 경로를 풀어낸 실제 경로"""
+        return os.path.realpath(file_path)
+
+    def lock_for(self, file_path: str) -> asyncio.Lock:
+        """경로의 잠금 반환 (없으면 생성) — 호출자가 참조를 유지하는 동안 유효"""
+        key = self.key(file_path)
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[key] = lock
+        return lock
+
+    @asynccontextmanager
+    async def acquire(self, file_path: str) -> AsyncIterator[None]:
+        """경로 잠금 획득 (대기 시간 기록)"""
+        key = self.key(file_path)
+        lock = self.lock_for(key)
+        stats = self._track(key)
+        if lock.locked():
+            stats.contended += 1
+
+        stats.waiting += 1
+        start = time.perf_counter()
+        try:
+            await lock.acquire()
+        finally:
+            stats.waiting -= 1
+        waited = time.perf_counter() - start
+        stats.acquisitions += 1
+        stats.total_wait += waited
+        stats.max_wait = max(stats.max_wait, waited)
+        try:
+            yield
+        finally:
+            lock.release()
+
+    def _track(self, key: str) -> _LockStats:
+        """경로 지표 (최근 사용으로 표시, 한도 초과 시 대기 없는 오래된 경로 제거)"""
+        stats = self._stats.get(key)
+        if stats is not None:
+            self._stats.move_to_end(key)
+            return stats
+        stats = self._stats[key] = _LockStats()
+        if len(self._stats) > self._max_tracked:
+            idle = [k for k, s in self._stats.items() if s.waiting == 0 and k != key]
+            for old in idle[: len(self._stats) - self._max_tracked]:
+                del self._stats[old]
+        return stats
+
+    def active_locks(self) -> int:
+        """현재 살아 있는 잠금 수 (사용 중인 파일 수)"""
+        return len(self._locks)
+
+    def stats(self) -> dict:
+        """경로별 잠금 대기 지표 (ms)"""
+        return {
+            "active_locks": self.active_locks(),
+            "files": {
+                key: {
+                    "acquisitions": s.acquisitions,
+                    "contended": s.contended,
+                    "waiting": s.waiting,
+                    "total_wait_ms": round(s.total_wait * 1000, 3),
+                    "avg_wait_ms": round(
+                        s.total_wait * 1000 / s.acquisitions, 3
+                    ) if s.acquisitions else 0.0,
+                    "max_wait_ms": round(s.max_wait * 1000, 3),
+                }
+                for key, s in self._stats.items()
+            },
+        }
+
+
+# 프로세스 전역 레지스트리 (모든 TodoWriter 인스턴스가 공유)
+file_locks = FileLockRegistry()
@@ -1,62 +1,401 @@
-"""파일 감시 — todo.md 변경을 감지하여 SSE 구독자에게 알림"""
+"""파일 감시 — todo.md/중앙 노트 변경을 감지하여 SSE 구독자에게 알림"""
 
 import asyncio
+import itertools
 import logging
+import os
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
 
 from watchfiles import awatch, Change
 
+from backend.core.config import settings
+from backend.infrastructure.file_system.board_store import board_store
+from backend.infrastructure.file_system.io_executor import io_executor
+from backend.infrastructure.file_system.parse_cache import parse_cache
+from backend.infrastructure.file_system.todo_parser import ParseResult
+from backend.infrastructure.file_system.project_catalog import project_catalog
+from backend.infrastructure.file_system.version_diff import board_delta
+from backend.infrastructure.file_system.write_journal import write_journal
+
 logger = logging.getLogger(__name__)
 
+# 밀린 이벤트를 대신하는 전체 재조회 요청 (구독자 큐가 가득 찼을 때)
+RESYNC_EVENT = {"type": "resync"}
+
+
+class Subscription:
+    """
+    SSE 구독자 하나의 크기 제한 큐.
+
+    감시자는 기다리지 않고(put_nowait) 넣으며, 큐가 가득 차면(느린 클라이언트)
+    밀린 이벤트를 모두 버리고 resync 이벤트 하나로 접는다 — 클라이언트는
+    resync를 받으면 전체를 다시 조회한다.
+    """
+
+    def __init__(self, subscriber_id: int, max_size: int) -> None:
+        self.subscriber_id = subscriber_id
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max(max_size, 1))
+        self.enqueued = 0
+        self.dropped = 0
+        self.resyncs = 0
+
+    async def get(self) -> dict:
+        """다음 이벤트 (없으면 대기)"""
+        return await self._queue.get()
+
+    def offer(self, event: dict) -> None:
+        """이벤트 넣기 (대기 없음, 가득 차면 resync로 접기)"""
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            while not self._queue.empty():
+                self._queue.get_nowait()
+                self.dropped += 1
+            # 새 이벤트도 resync에 포함
+            self.dropped += 1
+            self.resyncs += 1
+            self._queue.put_nowait(RESYNC_EVENT)
+        else:
+            self.enqueued += 1
+
+    def stats(self) -> dict:
+        return {
+            "id": self.subscriber_id,
+            "queued": self._queue.qsize(),
+            "enqueued": self.enqueued,
+            "dropped": self.dropped,
+            "resyncs": self.resyncs,
+        }
+
+
+@dataclass
+class _PendingChange:
+    """디바운스 창 안에서 모인 파일 하나의 변경"""
+
+    event_type: str
+    project_id: str
+    path: str
+    change: str
+    events: int = 1
+
+
+class WatchFilter:
+    """
+    감시 이벤트 필터 — 루트 바로 아래 pj.* 항목(프로젝트 추가/삭제),
+    pj.*/todo.md, pj.0/notes/*.md(중앙 노트)만 통과시킨다.
+
+    kind는 통과한 경로의 종류: "project" / "todo" / "note" (아니면 None).
+    """
+
+    def __init__(self, root: Path) -> None:
+        self._root = root
+
+    def kind(self, path: str) -> Optional[str]:
+        try:
+            parts = Path(path).relative_to(self._root).parts
+        except ValueError:
+            return None
+        if not parts or not parts[0].startswith("pj."):
+            return None
+        if len(parts) == 1:
+            return "project"
+        if len(parts) == 2 and parts[1] == "todo.md":
+            return "todo"
+        if parts[:2] == ("pj.0", "notes"):
+            if len(parts) == 2:
+                # 노트 폴더 생성/삭제 → 감시 대상 다시 구성
+                return "project"
+            if len(parts) == 3 and parts[2].endswith(".md"):
+                return "note"
+        return None
+
+    def __call__(self, change: Change, path: str) -> bool:
+        return self.kind(path) is not None
+
 
 class TodoFileWatcher:
-    """pj.*/todo.md 파일 변경을 감지하는 비동기 감시자"""
+    """
+    pj.*/todo.md 파일 변경을 감지하는 비동기 감시자.
+
+    루트와 각 pj.* 폴더, 중앙 노트 폴더(pj.0/notes)를 재귀 없이 감시하므로
+    프로젝트 안의 node_modules/.git/빌드 산출물에는 감시 핸들을 쓰지 않는다.
+    루트에서 pj.* 폴더가 생기거나 사라지면 감시 대상을 다시 구성하고
+    (재시작 불필요), 추가/삭제된 프로젝트는 todo.md 변경으로 알린다.
+
+    파싱 캐시/카탈로그 무효화는 변경마다 바로 하고, 보드 갱신과 구독자 알림은
+    파일별 디바운스 창(debounce_ms) 동안 모아 한 번만 한다 — 편집기 저장
+    한 번의 연속 이벤트나 git checkout의 대량 변경이 중복 알림이 되지 않는다.
+    알림은 보드 저장소를 갱신한 뒤 보내므로 알림을 받고 다시 조회하면 새 내용이다.
+
+    보드가 상주 중인 프로젝트(누군가 보고 있는 보드)는 마지막으로 알린 버전과
+    새 결과의 티켓 변경분을 board_delta로 보내 클라이언트가 다시 조회하지 않고
+    적용할 수 있게 한다. 기준 버전이 이력에 없거나 변경분이 delta_max_tickets를
+    넘으면 todo_changed(그 프로젝트 다시 조회)로 대신한다.
+
+    이 프로세스의 쓰기(TodoWriter)로 생긴 변경은 자기 쓰기 기록(write_journal)의
+    파일 지문과 현재 파일이 같으면 todo_applied(새 버전 + 요청 ID)로 알린다 —
+    그 요청을 보낸 클라이언트는 이미 응답으로 새 보드를 받았으므로 다시 조회하지 않는다.
+    """
 
-    def __init__(self, base_dir: str) -> None:
-        self._base_dir = Path(base_dir)
-        self._subscribers: list[asyncio.Queue] = []
+    def __init__(
+        self,
+        base_dir: str,
+        debounce_ms: float = settings.WATCH_DEBOUNCE_MS,
+        queue_size: int = settings.SSE_QUEUE_SIZE,
+        delta_max_tickets: int = settings.SSE_DELTA_MAX_TICKETS,
+    ) -> None:
+        self._base_dir = Path(os.path.abspath(base_dir))
+        self._filter = WatchFilter(self._base_dir)
+        self._debounce = debounce_ms / 1000
+        self._queue_size = queue_size
+        self._delta_max_tickets = delta_max_tickets
+        self._subscribers: list[Subscription] = []
+        self._ids = itertools.count(1)
         self._task: asyncio.Task | None = None
+        # 디바운스 중인 프로젝트 / 창이 끝나면 알리는 태스크
+        self._pending: dict[str, _PendingChange] = {}
+        self._flushes: set[asyncio.Task] = set()
+        # 감시 중인 pj.* 폴더 이름 / 삭제 이벤트를 이미 받은 todo.md
+        self._projects: set[str] = set()
+        self._deleted: set[str] = set()
+        # todo.md별 마지막으로 알린 버전 (board_delta 기준)
+        self._versions: dict[str, str] = {}
+        self._watched_dirs = 0
+        self._rebuilds = 0
+        self._changes = 0
+        self._coalesced = 0
+        self._notifications = 0
+        self._deltas = 0
+        self._delta_fallbacks = 0
+        self._applied = 0
 
-    def subscribe(self) -> asyncio.Queue:
-        """SSE 구독자 큐 등록"""
-        queue: asyncio.Queue = asyncio.Queue()
-        self._subscribers.append(queue)
-        return queue
+    def subscribe(self) -> Subscription:
+        """SSE 구독자 등록"""
+        subscription = Subscription(next(self._ids), self._queue_size)
+        self._subscribers.append(subscription)
+        return subscription
 
-    def unsubscribe(self, queue: asyncio.Queue) -> None:
+    def unsubscribe(self, subscription: Subscription) -> None:
         """SSE 구독 해제"""
-        if queue in self._subscribers:
-            self._subscribers.remove(queue)
+        if subscription in self._subscribers:
+            self._subscribers.remove(subscription)
 
     async def start(self) -> None:
         """백그라운드 태스크로 파일 감시 시작"""
         if self._task is None:
             self._task = asyncio.create_task(self._watch())
 
+    def _list_projects(self) -> list[str]:
+        """감시 대상 pj.* 폴더 이름 (이름순)"""
+        return [
+            pj_dir.name
+            for pj_dir in sorted(self._base_dir.glob("pj.*"))
+            if pj_dir.is_dir()
+        ]
+
     async def _watch(self) -> None:
-        """watchfiles로 pj.* 디렉토리 내 todo.md 변경 감지"""
-        watch_paths: list[str] = []
-        for pj_dir in sorted(self._base_dir.glob("pj.*")):
-            if pj_dir.is_dir():
-                watch_paths.append(str(pj_dir))
-
-        if not watch_paths:
-            logger.warning("감시할 pj.* 디렉토리가 없음")
+        """
+        watchfiles로 루트/pj.* 폴더/노트 폴더를 재귀 없이 감시.
+
+        pj.* 폴더 추가/삭제 이벤트가 오면 현재 감시를 멈추고 대상을 다시 구성한다.
+        """
+        if not await io_executor.run(self._base_dir.is_dir):
+            logger.warning(f"감시할 루트 디렉토리가 없음: {self._base_dir}")
             return
 
+        project_catalog.watch()
         try:
-            async for changes in awatch(*watch_paths):
-                for change_type, changed_path in changes:
-                    if Path(changed_path).name == "todo.md":
-                        project_id = Path(changed_path).parent.name
-                        event = {
-                            "type": "todo_changed",
-                            "project_id": project_id,
-                            "change": change_type.name,
-                        }
-                        for queue in self._subscribers:
-                            await queue.put(event)
+            initial = True
+            while True:
+                projects = await io_executor.run(self._list_projects)
+                await self._update_projects(projects, initial)
+                initial = False
+                watch_paths = [str(self._base_dir)]
+                watch_paths += [str(self._base_dir / name) for name in projects]
+                notes_dir = self._base_dir / "pj.0" / "notes"
+                if "pj.0" in self._projects and await io_executor.run(
+                    notes_dir.is_dir
+                ):
+                    watch_paths.append(str(notes_dir))
+                self._watched_dirs = len(watch_paths)
+
+                stop = asyncio.Event()
+                async for changes in awatch(
+                    *watch_paths,
+                    watch_filter=self._filter,
+                    recursive=False,
+                    stop_event=stop,
+                ):
+                    for change_type, changed_path in changes:
+                        kind = self._filter.kind(changed_path)
+                        if kind == "project":
+                            # 이 배치까지 처리하고 감시 대상 재구성
+                            stop.set()
+                        elif kind == "todo":
+                            self._on_change(change_type, changed_path)
+                        elif kind == "note":
+                            self._on_note(change_type, changed_path)
+                if not stop.is_set():
+                    break
+                self._rebuilds += 1
         except asyncio.CancelledError:
             logger.info("파일 감시 종료")
         except Exception as e:
             logger.error(f"파일 감시 오류: {e}")
+        finally:
+            board_store.unwatch()
+            project_catalog.unwatch()
+            self._projects = set()
+
+    async def _update_projects(self, projects: list[str], initial: bool) -> None:
+        """
+        감시 중인 프로젝트 교체 — 추가/삭제된 프로젝트는 todo.md 변경으로 처리.
+
+        감시를 다시 구성하는 사이 놓쳤을 수 있는 변경은 상주 보드를 다시
+        확인하여(지문 비교) 반영한다.
+        """
+        previous, current = self._projects, set(projects)
+        self._projects = current
+        # 감시 중인 프로젝트는 보드 저장소가 메모리 결과를 그대로 반환
+        # (대시보드 집계는 감시 이벤트로 표시된 프로젝트만 다시 요약)
+        board_store.watch(str(self._base_dir / name) for name in projects)
+        if initial:
+            return
+        for name in sorted(current - previous):
+            todo_path = self._base_dir / name / "todo.md"
+            if await io_executor.run(todo_path.exists):
+                self._on_change(Change.added, str(todo_path))
+        for name in sorted(previous - current):
+            todo_path = str(self._base_dir / name / "todo.md")
+            if todo_path not in self._deleted:
+                self._on_change(Change.deleted, todo_path)
+        for name in sorted(current & previous):
+            await board_store.refresh(str(self._base_dir / name / "todo.md"))
+
+    def _on_change(self, change_type: Change, changed_path: str) -> None:
+        """todo.md 변경 하나 — 캐시는 바로 무효화, 알림은 디바운스"""
+        # 외부 편집 → 파싱 캐시 무효화
+        parse_cache.invalidate(changed_path)
+        project_id = Path(changed_path).parent.name
+        project_catalog.invalidate(project_id)
+        if change_type == Change.deleted:
+            self._deleted.add(changed_path)
+        else:
+            self._deleted.discard(changed_path)
+        self._debounce_event("todo_changed", project_id, changed_path, change_type)
+
+    def _on_note(self, change_type: Change, changed_path: str) -> None:
+        """중앙 노트 변경 (pj.0/notes/{project_id}.md) — 디바운스 후 알림"""
+        project_id = Path(changed_path).stem
+        self._debounce_event("note_changed", project_id, changed_path, change_type)
+
+    def _debounce_event(
+        self, event_type: str, project_id: str, path: str, change_type: Change
+    ) -> None:
+        """파일별 디바운스 창 시작 (이미 창 안이면 병합)"""
+        self._changes += 1
+        pending = self._pending.get(path)
+        if pending is not None:
+            # 창 안의 연속 변경 — 마지막 변경 종류만 남김
+            pending.change = change_type.name
+            pending.events += 1
+            self._coalesced += 1
+            return
+        self._pending[path] = _PendingChange(
+            event_type, project_id, path, change_type.name
+        )
+        task = asyncio.create_task(self._flush_after(path))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _flush_after(self, path: str) -> None:
+        """디바운스 창이 끝나면 (todo.md면 보드 갱신 후) 구독자에게 한 번 알림"""
+        await asyncio.sleep(self._debounce)
+        pending = self._pending.pop(path)
+        event = {
+            "type": pending.event_type,
+            "project_id": pending.project_id,
+            "change": pending.change,
+            "events": pending.events,
+        }
+        if pending.event_type == "todo_changed":
+            try:
+                own = await io_executor.run(write_journal.claim, path)
+                # 상주 중인 프로젝트만 다시 읽기 (자기 쓰기면 생략)
+                previous = board_store.resident(path)
+                await board_store.refresh(path)
+                if own is not None:
+                    self._applied += 1
+                    event = {
+                        **event,
+                        "type": "todo_applied",
+                        "version": own.version,
+                        "request_ids": own.request_ids,
+                    }
+                event = await self._with_delta(event, path, previous)
+            except Exception as e:
+                logger.error(f"보드 갱신 오류 ({pending.project_id}): {e}")
+        self._publish(event)
+
+    async def _with_delta(
+        self, event: dict, path: str, previous: Optional[ParseResult]
+    ) -> dict:
+        """
+        상주 보드면 마지막으로 알린 버전(없으면 갱신 전 상주 결과) 대비
+        변경분을 붙인다 — todo_changed는 board_delta로 바꾸고 todo_applied는
+        종류를 유지한다 (못 하면 event 그대로).
+        """
+        current = board_store.resident(path)
+        if current is None or current.digest is None:
+            self._versions.pop(path, None)
+            return event
+        base_version = self._versions.get(path)
+        if base_version is None and previous is not None:
+            base_version = previous.digest
+        self._versions[path] = current.digest
+        base = (
+            parse_cache.recall(path, current.project_id, base_version)
+            if base_version is not None
+            else None
+        )
+        if base is None:
+            self._delta_fallbacks += 1
+            return event
+        delta = await io_executor.run(board_delta, base, current)
+        size = len(delta.added) + len(delta.changed) + len(delta.removed_ticket_ids)
+        if size > self._delta_max_tickets:
+            self._delta_fallbacks += 1
+            return event
+        self._deltas += 1
+        return {
+            **event,
+            "type": "board_delta" if event["type"] == "todo_changed" else event["type"],
+            "delta": delta.model_dump(mode="json"),
+        }
+
+    def _publish(self, event: dict) -> None:
+        """모든 구독자에게 대기 없이 전달"""
+        self._notifications += 1
+        for subscription in self._subscribers:
+            subscription.offer(event)
+
+    def stats(self) -> dict:
+        """감시 이벤트/병합/알림 수와 구독자별 큐 투입·버림 수"""
+        return {
+            "projects": len(self._projects),
+            "watched_dirs": self._watched_dirs,
+            "rebuilds": self._rebuilds,
+            "debounce_ms": self._debounce * 1000,
+            "queue_size": self._queue_size,
+            "changes": self._changes,
+            "coalesced": self._coalesced,
+            "notifications": self._notifications,
+            "deltas": self._deltas,
+            "delta_fallbacks": self._delta_fallbacks,
+            "applied": self._applied,
+            "own_writes": write_journal.stats(),
+            "pending": len(self._pending),
+            "subscribers": [s.stats() for s in self._subscribers],
+        }
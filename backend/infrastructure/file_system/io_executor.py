@@ -0,0 +1,164 @@
+"""파일 I/O 전용 실행기 — 블로킹 읽기/쓰기/디렉토리 스캔을 이벤트 루프 밖 스레드 풀에서 실행"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Optional, TypeVar
+
+from backend.core.config import settings
+
+T = TypeVar("T")
+
+
+@dataclass
+class _OpStats:
+    """작업 이름 하나의 누적 지표 (초)"""
+
+    calls: int = 0
+    errors: int = 0
+    total_run: float = 0.0
+    max_run: float = 0.0
+    # 스레드가 빌 때까지 큐에서 기다린 시간
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+
+class IOExecutor:
+    """
+    크기 제한 스레드 풀 기반 I/O 실행기.
+
+    모든 파일 읽기/쓰기/스캔은 run()을 거쳐 워커 스레드에서 실행되므로
+    느린 디스크가 SSE 스트림이나 다른 요청의 이벤트 루프를 막지 않는다.
+    작업 이름별 실행/대기 시간과 큐 깊이를 기록한다.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        self._max_workers = max(max_workers, 1)
+        self._pool = ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="todo-io"
+        )
+        # 워커 스레드에서도 갱신되므로 지표는 잠금으로 보호
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._max_queued = 0
+        self._ops: dict[str, _OpStats] = {}
+
+    async def run(
+        self, fn: Callable[..., T], *args, name: Optional[str] = None
+    ) -> T:
+        """fn(*args)를 I/O 스레드에서 실행하고 결과 반환 (예외는 그대로 전파)"""
+        op_name = name or getattr(fn, "__qualname__", repr(fn))
+        submitted = time.perf_counter()
+        with self._lock:
+            self._queued += 1
+            self._max_queued = max(self._max_queued, self._queued)
+
+        def task() -> T:
+            started = time.perf_counter()
+            with self._lock:
+                self._queued -= 1
+                self._running += 1
+            failed = True
+            try:
+                result = fn(*args)
+                failed = False
+                return result
+            finally:
+                self._record(
+                    op_name, started - submitted, time.perf_counter() - started, failed
+                )
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, task)
+
+    def _record(self, name: str, waited: float, ran: float, failed: bool) -> None:
+        with self._lock:
+            self._running -= 1
+            stats = self._ops.setdefault(name, _OpStats())
+            stats.calls += 1
+            stats.errors += failed
+            stats.total_run += ran
+            stats.max_run = max(stats.max_run, ran)
+            stats.total_wait += waited
+            stats.max_wait = max(stats.max_wait, waited)
+
+    def stats(self) -> dict:
+        """큐 깊이 및 작업별 실행/대기 시간 (ms)"""
+        with self._lock:
+            return {
+                "max_workers": self._max_workers,
+                "queued": self._queued,
+                "running": self._running,
+                "max_queued": self._max_queued,
+                "ops": {
+                    name: {
+                        "calls": s.calls,
+                        "errors": s.errors,
+                        "avg_ms": round(s.total_run * 1000 / s.calls, 3),
+                        "max_ms": round(s.max_run * 1000, 3),
+                        "avg_wait_ms": round(s.total_wait * 1000 / s.calls, 3),
+                        "max_wait_ms": round(s.max_wait * 1000, 3),
+                    }
+                    for name, s in self._ops.items()
+                },
+            }
+
+
+class LoopLagMonitor:
+    """
+    이벤트 루프 응답성 측정.
+
+    interval마다 깨어나 예정 시각보다 늦어진 시간을 기록한다. 블로킹 I/O가
+    루프에서 빠졌다면 대용량 스캔 중에도 지연이 수 ms 안에 머문다.
+    """
+
+    def __init__(self, interval: float = 0.1) -> None:
+        self._interval = interval
+        self._task: Optional[asyncio.Task] = None
+        self._samples = 0
+        self._total = 0.0
+        self._max = 0.0
+        self._last = 0.0
+
+    def start(self) -> None:
+        """백그라운드 측정 태스크 시작"""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """측정 태스크 종료"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self._interval)
+            lag = max(time.perf_counter() - start - self._interval, 0.0)
+            self._samples += 1
+            self._total += lag
+            self._max = max(self._max, lag)
+            self._last = lag
+
+    def stats(self) -> dict:
+        """루프 지연 (ms)"""
+        return {
+            "interval_ms": self._interval * 1000,
+            "samples": self._samples,
+            "last_ms": round(self._last * 1000, 3),
+            "avg_ms": round(self._total * 1000 / self._samples, 3) if self._samples else 0.0,
+            "max_ms": round(self._max * 1000, 3),
+        }
+
+
+# 프로세스 전역 I/O 실행기 / 루프 지연 측정기
+io_executor = IOExecutor(max_workers=settings.IO_MAX_WORKERS)
+loop_monitor = LoopLagMonitor()
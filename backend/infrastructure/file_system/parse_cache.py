@@ -0,0 +1,202 @@
+"""todo.md 파싱 결과 캐시 — (경로, mtime_ns, 크기, 선택적 내용 해시) 키 기반 프로세스 전역 LRU"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable, NamedTuple, Optional
+
+from backend.core.config import settings
+
+if TYPE_CHECKING:
+    from backend.infrastructure.file_system.todo_parser import ParseResult
+
+
+class FileFingerprint(NamedTuple):
+    """파일 변경 감지용 stat 지문"""
+
+    mtime_ns: int
+    size: int
+
+
+def file_fingerprint(file_path: str) -> Optional[FileFingerprint]:
+    """파일 stat 지문 반환 (파일이 없으면 None)"""
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
+        return None
+    return FileFingerprint(st.st_mtime_ns, st.st_size)
+
+
+# 내용 해시 청크 크기 — 청크별 해시를 다시 해시하므로 일부 바이트만 바뀐 경우
+# 해당 청크만 재계산하면 된다 (TodoWriter 제자리 패치)
+DIGEST_CHUNK_SIZE = 1 << 16
+
+
+def chunk_digests(data: bytes) -> list[bytes]:
+    """DIGEST_CHUNK_SIZE 단위 청크별 해시"""
+    view = memoryview(data)
+    return [
+        hashlib.blake2b(view[i:i + DIGEST_CHUNK_SIZE], digest_size=16).digest()
+        for i in range(0, len(view), DIGEST_CHUNK_SIZE)
+    ]
+
+
+def combine_digests(chunks: Iterable[bytes]) -> str:
+    """청크 해시 목록 → 내용 해시"""
+    return hashlib.blake2b(b"".join(chunks), digest_size=16).hexdigest()
+
+
+def content_digest(data: bytes) -> str:
+    """
+    파일 내용 해시 — mtime 해상도 내 동일 크기 변경 감지 및 버전(If-Match) 토큰.
+
+    combine_digests(chunk_digests(data))와 같다.
+    """
+    return combine_digests(chunk_digests(data))
+
+
+@dataclass
+class _CacheEntry:
+    project_id: str
+    fingerprint: FileFingerprint
+    digest: Optional[str]
+    result: "ParseResult"
+
+
+class ParseCache:
+    """
+    ParseResult LRU 캐시.
+
+    캐시 히트 시 저장된 ParseResult를 그대로 반환하므로
+    호출자는 반환된 결과(티켓 포함)를 변경하면 안 된다.
+    I/O 스레드 풀에서 동시에 호출되므로 모든 접근은 내부 잠금으로 직렬화한다.
+    """
+
+    def __init__(
+        self, max_entries: int, verify_hash: bool = False, history_size: int = 0
+    ) -> None:
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        # 경로별 최근 버전(내용 해시) → 파싱 결과 (버전 충돌 시 diff 기준)
+        self._history: dict[str, OrderedDict[str, "ParseResult"]] = {}
+        self._history_size = history_size
+        # 경로별 무효화 세대 (무효화 이전에 시작된 파싱 결과의 저장 차단용)
+        self._generations: dict[str, int] = {}
+        self._max_entries = max_entries
+        self.verify_hash = verify_hash
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    @staticmethod
+    def _key(file_path: str) -> str:
+        return os.path.abspath(file_path)
+
+    def generation(self, file_path: str) -> int:
+        """경로의 현재 무효화 세대"""
+        with self._lock:
+            return self._generations.get(self._key(file_path), 0)
+
+    def get(
+        self,
+        file_path: str,
+        project_id: str,
+        fingerprint: FileFingerprint,
+        digest: Optional[str] = None,
+    ) -> Optional["ParseResult"]:
+        """지문(및 해시)이 일치하는 캐시 결과 반환, 없으면 None"""
+        key = self._key(file_path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if (
+                entry is None
+                or entry.project_id != project_id
+                or entry.fingerprint != fingerprint
+                or (digest is not None and entry.digest != digest)
+            ):
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.result
+
+    def put(
+        self,
+        file_path: str,
+        project_id: str,
+        fingerprint: FileFingerprint,
+        result: "ParseResult",
+        digest: Optional[str] = None,
+        generation: Optional[int] = None,
+    ) -> None:
+        """
+        파싱 결과 저장 (용량 초과 시 가장 오래 사용되지 않은 항목 제거).
+
+        generation이 주어지면 그 사이 무효화가 있었던 경우 저장하지 않는다
+        (mtime 해상도 내 동일 크기 쓰기로 인한 오래된 결과 고착 방지).
+        버전 기록은 내용 해시 기준이므로 세대와 무관하게 남긴다.
+        """
+        key = self._key(file_path)
+        with self._lock:
+            if digest is not None and self._history_size > 0:
+                history = self._history.setdefault(key, OrderedDict())
+                history[digest] = result
+                history.move_to_end(digest)
+                while len(history) > self._history_size:
+                    history.popitem(last=False)
+
+            if generation is not None and generation != self._generations.get(key, 0):
+                return
+            self._entries[key] = _CacheEntry(project_id, fingerprint, digest, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def recall(
+        self, file_path: str, project_id: str, digest: str
+    ) -> Optional["ParseResult"]:
+        """최근 버전 중 내용 해시가 digest인 파싱 결과 (없으면 None)"""
+        with self._lock:
+            result = self._history.get(self._key(file_path), {}).get(digest)
+        if result is None or result.project_id != project_id:
+            return None
+        return result
+
+    def invalidate(self, file_path: str) -> None:
+        """특정 파일의 캐시 항목 제거 (TodoWriter 쓰기 / 파일 감시 이벤트에서 호출)"""
+        key = self._key(file_path)
+        with self._lock:
+            self._generations[key] = self._generations.get(key, 0) + 1
+            if self._entries.pop(key, None) is not None:
+                self._invalidations += 1
+
+    def clear(self) -> None:
+        """전체 캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+            self._history.clear()
+
+    def stats(self) -> dict:
+        """히트/미스 카운터 및 현재 크기"""
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self._max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "invalidations": self._invalidations,
+                "hit_ratio": (self._hits / total) if total else 0.0,
+                "verify_hash": self.verify_hash,
+            }
+
+
+# 프로세스 전역 캐시 (모든 저장소/라이터/감시자가 공유)
+parse_cache = ParseCache(
+    max_entries=settings.PARSE_CACHE_SIZE,
+    verify_hash=settings.PARSE_CACHE_VERIFY_HASH,
+    history_size=settings.VERSION_HISTORY_SIZE,
+)
@@ -0,0 +1,603 @@
+"""프로젝트 카탈로그 — pj.* 폴더 목록과 프로젝트 요약을 stat 기반으로 캐시"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from backend.core.config import settings
+from backend.domain.dashboard import Dashboard
+from backend.domain.project import PROJECT_COLORS, Project
+from backend.domain.section import Section
+from backend.infrastructure.file_system.board_db import board_db
+from backend.infrastructure.file_system.io_executor import io_executor
+from backend.infrastructure.file_system.parse_cache import (
+    FileFingerprint,
+    file_fingerprint,
+    parse_cache,
+)
+from backend.infrastructure.file_system.ticket_table import FALLBACK_SECTION, STAGES
+from backend.infrastructure.file_system.todo_parser import (
+    ParseResult,
+    TodoParser,
+    TodoSummary,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ProjectFolder(NamedTuple):
+    """pj.* 폴더 하나 (색상 인덱스 = 정렬된 pj.* 항목 중 순서)"""
+
+    color_index: int
+    name: str
+
+
+def summarize_todo(todo_path: str) -> Optional[TodoSummary]:
+    """
+    todo.md 하나를 읽어 요약 (파일이 없으면 None).
+
+    프로세스 풀 워커에서 실행되므로 모듈 최상위 함수이며 파싱 캐시를 쓰지 않는다.
+    """
+    try:
+        with open(todo_path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+    return TodoParser().summarize_bytes(data)
+
+
+def _pool_size(processes: int) -> int:
+    """프로젝트 스캔 프로세스 수 (0이면 사용 가능한 CPU 수)"""
+    if processes > 0:
+        return processes
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+class _Listing(NamedTuple):
+    root_mtime_ns: int
+    folders: list[ProjectFolder]
+    by_name: dict[str, ProjectFolder]
+
+
+class ProjectCatalog:
+    """
+    pj.* 프로젝트 목록/요약 캐시 (프로세스 전역).
+
+    - 폴더 목록: 루트 디렉토리 mtime이 같으면 재사용 (pj.* 생성/삭제/이름
+      변경은 루트 디렉토리 항목을 바꾸므로 mtime이 바뀐다)
+    - 프로젝트 요약(제목/섹션/스테이지별 수/버전): todo.md 지문(mtime_ns, 크기)이
+      같으면 재사용하고, 바뀐 프로젝트만 요약 스캔(TodoParser.summarize —
+      티켓 컬럼 없이 마커 바이트만 집계)한다. 영속 색인(board_db)이 켜져 있으면
+      재시작 후에도 지문이 같은 프로젝트는 색인의 요약을 쓴다
+
+    색상은 기존과 같이 정렬된 pj.* 항목(파일 포함) 중 순서로 정하므로 목록
+    캐시 여부와 무관하게 같다. 반환한 Project는 공유되므로 변경하면 안 된다.
+    I/O 스레드에서 동시에 호출되므로 캐시 접근은 내부 잠금으로 직렬화한다.
+
+    전체 스캔(scan)에서 다시 파싱할 프로젝트가 min_process_projects개
+    이상이고 프로세스가 2개 이상이면 파싱/집계를 프로세스 풀에 나눠 맡긴다
+    (결과는 TodoSummary로 받아 폴더 순서대로 합친다). 그보다 적으면 현재
+    스레드에서 파싱 캐시를 거쳐 순차 처리한다.
+
+    대시보드 합계(스테이지별 티켓 수)는 요약이 바뀔 때마다 이전 요약과의
+    차이만큼 갱신하는 구체화 집계다. 파일 감시 중(watch)이고 전체 스캔 이후
+    폴더 목록이 그대로면 대시보드는 프로젝트별 stat 없이 집계를 바로 반환하고,
+    변경 요청(put)과 감시 이벤트(invalidate)로 표시된 프로젝트만 다시 요약한다.
+    verify는 집계를 캐시 없는 전체 스캔과 비교하여 어긋난 프로젝트를 보고/복구한다.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        processes: int = settings.SCAN_PROCESSES,
+        min_process_projects: int = settings.SCAN_PROCESS_MIN_PROJECTS,
+    ) -> None:
+        self._root = Path(root)
+        self._processes = processes
+        self._min_process_projects = min_process_projects
+        self._parser = TodoParser()
+        self._lock = threading.Lock()
+        self._listing: Optional[_Listing] = None
+        self._summaries: dict[str, tuple[FileFingerprint, Project]] = {}
+        self._pool: Optional[ProcessPoolExecutor] = None
+        # 대시보드 구체화 집계 — STAGES 순서 합계 / 이름순 프로젝트 목록 (지연 생성)
+        self._total_by_stage = [0] * len(STAGES)
+        self._projects: Optional[list[Project]] = None
+        # 파일 감시 여부 / 전체 스캔을 마친 폴더 목록 / 다시 요약할 프로젝트
+        self._watched = False
+        self._scanned_listing: Optional[_Listing] = None
+        self._stale: set[str] = set()
+        self._listing_hits = 0
+        self._listing_scans = 0
+        self._summary_hits = 0
+        self._summary_parses = 0
+        self._process_scans = 0
+        self._process_parses = 0
+        self._dashboard_hits = 0
+        self._dashboard_scans = 0
+        self._verifications = 0
+        self._drifts = 0
+        self._last_drift: list[str] = []
+
+    def folders(self) -> list[ProjectFolder]:
+        """pj.* 폴더 목록 (이름순)"""
+        return self._current_listing().folders
+
+    def get(self, project_id: str) -> Optional[Project]:
+        """프로젝트 하나의 요약 (그 프로젝트만 stat/파싱, 없으면 None)"""
+        folder = self._current_listing().by_name.get(project_id)
+        if folder is None:
+            return None
+        return self.summary(folder)
+
+    def summary(self, folder: ProjectFolder) -> Optional[Project]:
+        """폴더의 프로젝트 요약 (todo.md가 없으면 None)"""
+        fingerprint, project = self._lookup(folder)
+        if project is not None or fingerprint is None:
+            return project
+        # 지문은 파싱 전에 얻었으므로 파싱 중 파일이 바뀌면 다음 호출에서 다시 파싱
+        (summary,) = self._summarize_misses([(folder, fingerprint)])
+        return self._store(folder, fingerprint, summary)
+
+    def scan(self) -> list[Project]:
+        """모든 프로젝트 요약 (폴더 순서, 바뀐 프로젝트만 파싱)"""
+        listing = self._current_listing()
+        projects: list[Optional[Project]] = []
+        misses: list[tuple[int, ProjectFolder, FileFingerprint]] = []
+        for folder in listing.folders:
+            fingerprint, project = self._lookup(folder)
+            if project is None and fingerprint is not None:
+                misses.append((len(projects), folder, fingerprint))
+            projects.append(project)
+
+        summaries = self._summarize_misses(
+            [(folder, fingerprint) for _, folder, fingerprint in misses]
+        )
+        for (position, folder, fingerprint), summary in zip(misses, summaries):
+            projects[position] = self._store(folder, fingerprint, summary)
+        with self._lock:
+            relisted = self._scanned_listing is not listing
+            self._scanned_listing = listing
+        if relisted:
+            # 사라진 프로젝트의 영속 색인 정리
+            board_db.retain(str(self._todo_path(folder)) for folder in listing.folders)
+        return [project for project in projects if project is not None]
+
+    # ── 대시보드 집계 ──
+
+    def dashboard(self) -> Dashboard:
+        """
+        대시보드 집계.
+
+        감시 중이고 폴더 목록이 마지막 전체 스캔과 같으면 표시된 프로젝트만
+        다시 요약하고 구체화 집계를 반환한다 (루트 stat 1회). 아니면 전체
+        스캔(바뀐 프로젝트만 파싱)으로 집계를 갱신한 뒤 반환한다.
+        """
+        listing = self._current_listing()
+        with self._lock:
+            fresh = self._watched and self._scanned_listing is listing
+            stale, self._stale = self._stale, set()
+            if fresh:
+                self._dashboard_hits += 1
+            else:
+                self._dashboard_scans += 1
+
+        try:
+            if fresh:
+                for name in sorted(stale):
+                    folder = listing.by_name.get(name)
+                    if folder is not None:
+                        self.summary(folder)
+            else:
+                self.scan()
+        except BaseException:
+            with self._lock:
+                self._stale |= stale
+            raise
+        return self._snapshot()
+
+    def put(
+        self,
+        project_id: str,
+        result: ParseResult,
+        fingerprint: Optional[FileFingerprint],
+        generation: int,
+    ) -> None:
+        """
+        변경 요청 후 파싱 결과 반영 (파일을 다시 읽지 않고 요약/집계 갱신).
+
+        generation은 결과가 반영한 파싱 캐시 세대 — 그 뒤 무효화가 있었으면
+        더 새로운 내용이 있을 수 있으므로 반영하지 않고 다시 요약하도록 표시한다.
+        """
+        with self._lock:
+            listing = self._listing
+        folder = listing.by_name.get(project_id) if listing is not None else None
+        if folder is None:
+            # 목록에 없는 새 폴더는 루트 mtime 변경으로 다음 전체 스캔에서 반영
+            return
+        project = self._project(folder, TodoSummary.of(result))
+        todo_path = str(self._todo_path(folder))
+        with self._lock:
+            if fingerprint is None or generation != parse_cache.generation(todo_path):
+                self._stale.add(project_id)
+                return
+            self._set_summary(folder.name, (fingerprint, project))
+
+    def invalidate(self, project_id: str) -> None:
+        """외부 편집 표시 (파일 감시 이벤트) — 다음 대시보드 조회에서 다시 요약"""
+        with self._lock:
+            self._stale.add(project_id)
+
+    def watch(self) -> None:
+        """파일 감시 시작 — 이후 대시보드는 감시 이벤트로 표시된 프로젝트만 확인"""
+        with self._lock:
+            self._watched = True
+
+    def unwatch(self) -> None:
+        """파일 감시 종료 — 이후 대시보드는 매번 프로젝트별 지문을 확인"""
+        with self._lock:
+            self._watched = False
+
+    def verify(self) -> list[str]:
+        """
+        구체화 집계 검증 — 대시보드가 반환할 집계를 캐시 없는 전체 스캔과 비교.
+
+        어긋난 프로젝트 ID 목록을 반환하고 새로 스캔한 요약으로 바로잡는다.
+        검증 중 todo.md가 바뀐 프로젝트는 비교하지 않는다 (다음 검증에서 확인).
+        합계가 프로젝트별 수의 합과 다르면 "*totals*"를 포함하고 다시 계산한다.
+        """
+        served = self.dashboard()
+        listing = self._current_listing()
+        by_id = {project.project_id: project for project in served.projects}
+        drifted: list[str] = []
+        for folder in listing.folders:
+            todo_path = str(self._todo_path(folder))
+            fingerprint = file_fingerprint(todo_path)
+            summary = summarize_todo(todo_path)
+            if fingerprint != file_fingerprint(todo_path):
+                continue
+            current = by_id.get(folder.name)
+            expected = None if summary is None else self._project(folder, summary)
+            if expected == current:
+                continue
+            drifted.append(folder.name)
+            with self._lock:
+                cached = self._summaries.get(folder.name)
+                if cached is not None and cached[1] is not current:
+                    # 검증 중 다른 경로가 이미 갱신
+                    continue
+                if expected is None:
+                    self._drop_summary(folder.name)
+                else:
+                    self._set_summary(folder.name, (fingerprint, expected))
+
+        totals = [0] * len(STAGES)
+        for project in served.projects:
+            for code, stage in enumerate(STAGES):
+                totals[code] += project.ticket_count_by_stage.get(stage.value, 0)
+        with self._lock:
+            if [served.total_by_stage[stage.value] for stage in STAGES] != totals:
+                drifted.append("*totals*")
+                self._recount()
+            self._verifications += 1
+            self._drifts += len(drifted)
+            if drifted:
+                self._last_drift = drifted
+        if drifted:
+            logger.warning(f"대시보드 집계 불일치 (복구함): {', '.join(drifted)}")
+        return drifted
+
+    # ── 요약 생성 ──
+
+    def _lookup(
+        self, folder: ProjectFolder
+    ) -> tuple[Optional[FileFingerprint], Optional[Project]]:
+        """(todo.md 지문, 지문이 같은 캐시 요약) — 파일이 없으면 (None, None)"""
+        fingerprint = file_fingerprint(str(self._todo_path(folder)))
+        with self._lock:
+            if fingerprint is None:
+                self._drop_summary(folder.name)
+                return None, None
+            cached = self._summaries.get(folder.name)
+            if (
+                cached is not None
+                and cached[0] == fingerprint
+                and cached[1].color == self._color(folder)
+            ):
+                self._summary_hits += 1
+                return fingerprint, cached[1]
+            self._summary_parses += 1
+        return fingerprint, None
+
+    def _summarize_misses(
+        self, misses: list[tuple[ProjectFolder, FileFingerprint]]
+    ) -> list[Optional[TodoSummary]]:
+        """
+        캐시에 없는 프로젝트 요약 (결과는 입력 순서).
+
+        영속 색인에 지문이 같은 요약이 있으면 읽지 않고 쓰고(재시작 직후),
+        나머지만 요약 스캔한 뒤 색인에 저장을 예약한다.
+        """
+        summaries = [
+            board_db.summary(str(self._todo_path(folder)), fingerprint)
+            for folder, fingerprint in misses
+        ]
+        stale = [i for i, summary in enumerate(summaries) if summary is None]
+        scanned = self._summarize_all([misses[i][0] for i in stale])
+        for i, summary in zip(stale, scanned):
+            summaries[i] = summary
+            folder, fingerprint = misses[i]
+            if summary is not None:
+                board_db.submit_summary(
+                    folder.name, str(self._todo_path(folder)), fingerprint, summary
+                )
+        return summaries
+
+    def _summarize_local(self, folder: ProjectFolder) -> Optional[TodoSummary]:
+        """현재 스레드에서 요약 (캐시된 전체 파싱 결과가 없으면 바이트 요약 스캔)"""
+        return self._parser.summarize(str(self._todo_path(folder)), folder.name)
+
+    def _summarize_all(
+        self, folders: list[ProjectFolder]
+    ) -> list[Optional[TodoSummary]]:
+        """여러 프로젝트 요약 (많으면 프로세스 풀, 결과는 입력 순서)"""
+        workers = _pool_size(self._processes)
+        if workers > 1 and len(folders) >= self._min_process_projects:
+            paths = [str(self._todo_path(folder)) for folder in folders]
+            try:
+                summaries = list(
+                    self._process_pool(workers).map(
+                        summarize_todo,
+                        paths,
+                        chunksize=max(len(paths) // (workers * 4), 1),
+                    )
+                )
+            except BrokenProcessPool:
+                logger.warning("프로젝트 스캔 프로세스 풀 중단 — 순차 스캔으로 대체")
+                self.shutdown()
+            else:
+                with self._lock:
+                    self._process_scans += 1
+                    self._process_parses += len(paths)
+                return summaries
+        return [self._summarize_local(folder) for folder in folders]
+
+    def _process_pool(self, workers: int) -> ProcessPoolExecutor:
+        """프로젝트 스캔 프로세스 풀 (처음 필요할 때 생성, spawn — 스레드가 있는 서버에서 fork 회피)"""
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._pool
+
+    def shutdown(self) -> None:
+        """프로세스 풀 종료 (앱 종료 시)"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _store(
+        self,
+        folder: ProjectFolder,
+        fingerprint: FileFingerprint,
+        summary: Optional[TodoSummary],
+    ) -> Optional[Project]:
+        """요약 → Project (캐시 저장)"""
+        if summary is None:
+            return None
+        project = self._project(folder, summary)
+        with self._lock:
+            self._set_summary(folder.name, (fingerprint, project))
+        return project
+
+    def _project(self, folder: ProjectFolder, summary: TodoSummary) -> Project:
+        """요약 → Project"""
+        # 섹션별 스테이지별 수 (같은 이름 섹션은 합산, 섹션 밖 티켓은 미분류)
+        section_names = [FALLBACK_SECTION.name] + [name for name, _ in summary.sections]
+        by_section: dict[str, dict[str, int]] = {}
+        for position, (name, counts) in enumerate(
+            zip(section_names, summary.section_stage_counts)
+        ):
+            if position == 0 and not any(counts):
+                continue
+            merged = by_section.setdefault(
+                name, dict.fromkeys((stage.value for stage in STAGES), 0)
+            )
+            for stage, count in zip(STAGES, counts):
+                merged[stage.value] += count
+
+        return Project(
+            project_id=folder.name,
+            name=summary.title or folder.name,
+            path=str(self._root / folder.name),
+            todo_file_path=str(self._todo_path(folder)),
+            sections=[
+                Section(name=name, line_number=line_number)
+                for name, line_number in summary.sections
+            ],
+            # 스테이지별 티켓 수 (모든 스테이지 키 포함)
+            ticket_count_by_stage={
+                stage.value: count
+                for stage, count in zip(STAGES, summary.stage_counts)
+            },
+            ticket_count_by_section=by_section,
+            color=self._color(folder),
+            version=summary.digest,
+        )
+
+    def _todo_path(self, folder: ProjectFolder) -> Path:
+        return self._root / folder.name / "todo.md"
+
+    @staticmethod
+    def _color(folder: ProjectFolder) -> str:
+        return PROJECT_COLORS[folder.color_index % len(PROJECT_COLORS)]
+
+    # ── 구체화 집계 (잠금 안에서 호출) ──
+
+    def _set_summary(self, name: str, entry: tuple[FileFingerprint, Project]) -> None:
+        """요약 교체 — 합계에서 이전 요약을 빼고 새 요약을 더한다"""
+        previous = self._summaries.get(name)
+        if previous is not None:
+            self._add_counts(previous[1], -1)
+        self._summaries[name] = entry
+        self._add_counts(entry[1], 1)
+        self._projects = None
+
+    def _drop_summary(self, name: str) -> None:
+        previous = self._summaries.pop(name, None)
+        if previous is not None:
+            self._add_counts(previous[1], -1)
+            self._projects = None
+
+    def _add_counts(self, project: Project, sign: int) -> None:
+        counts = project.ticket_count_by_stage
+        totals = self._total_by_stage
+        for code, stage in enumerate(STAGES):
+            totals[code] += sign * counts.get(stage.value, 0)
+
+    def _recount(self) -> None:
+        """합계를 프로젝트별 수에서 다시 계산"""
+        self._total_by_stage = [0] * len(STAGES)
+        for _, project in self._summaries.values():
+            self._add_counts(project, 1)
+
+    def _snapshot(self) -> Dashboard:
+        """현재 구체화 집계 (프로젝트 목록은 변경이 있을 때만 다시 정렬)"""
+        with self._lock:
+            if self._projects is None:
+                self._projects = [
+                    project for _, (_, project) in sorted(self._summaries.items())
+                ]
+            total_by_stage = {
+                stage.value: count
+                for stage, count in zip(STAGES, self._total_by_stage)
+            }
+            return Dashboard.model_construct(
+                total_projects=len(self._projects),
+                total_tickets=sum(self._total_by_stage),
+                total_by_stage=total_by_stage,
+                projects=self._projects,
+            )
+
+    def _current_listing(self) -> _Listing:
+        """루트 mtime으로 검증한 폴더 목록 (바뀌었으면 다시 스캔)"""
+        try:
+            root_mtime_ns = os.stat(self._root).st_mtime_ns
+        except FileNotFoundError:
+            return _Listing(0, [], {})
+
+        with self._lock:
+            listing = self._listing
+            if listing is not None and listing.root_mtime_ns == root_mtime_ns:
+                self._listing_hits += 1
+                return listing
+            self._listing_scans += 1
+
+        # pj.* 항목을 정렬하여 색상 인덱스 안정화 (폴더가 아닌 항목도 순서에 포함)
+        folders = [
+            ProjectFolder(index, entry.name)
+            for index, entry in enumerate(sorted(self._root.glob("pj.*")))
+            if entry.is_dir()
+        ]
+        listing = _Listing(
+            root_mtime_ns, folders, {folder.name: folder for folder in folders}
+        )
+        with self._lock:
+            self._listing = listing
+            # 사라진 폴더의 요약 제거
+            for name in list(self._summaries):
+                if name not in listing.by_name:
+                    self._drop_summary(name)
+        return listing
+
+    def clear(self) -> None:
+        """전체 비우기"""
+        with self._lock:
+            self._listing = None
+            self._summaries.clear()
+            self._total_by_stage = [0] * len(STAGES)
+            self._projects = None
+            self._scanned_listing = None
+            self._stale.clear()
+
+    def stats(self) -> dict:
+        """목록/요약 캐시 히트 카운터와 대시보드 집계 검증 결과"""
+        with self._lock:
+            return {
+                "projects": len(self._listing.folders) if self._listing else 0,
+                "summaries": len(self._summaries),
+                "listing_hits": self._listing_hits,
+                "listing_scans": self._listing_scans,
+                "summary_hits": self._summary_hits,
+                "summary_parses": self._summary_parses,
+                "process_workers": _pool_size(self._processes),
+                "process_scans": self._process_scans,
+                "process_parses": self._process_parses,
+                "dashboard_hits": self._dashboard_hits,
+                "dashboard_scans": self._dashboard_scans,
+                "stale": len(self._stale),
+                "verifications": self._verifications,
+                "drifts": self._drifts,
+                "last_drift": list(self._last_drift),
+            }
+
+
+class CatalogVerifier:
+    """
+    대시보드 집계 주기 검증.
+
+    interval초마다 I/O 스레드에서 ProjectCatalog.verify를 실행한다
+    (어긋남은 verify가 경고 로그로 남기고 바로잡는다). interval이 0 이하면
+    시작하지 않는다.
+    """
+
+    def __init__(self, catalog: ProjectCatalog, interval: float) -> None:
+        self._catalog = catalog
+        self._interval = interval
+        self._task: Optional[asyncio.Task] = None
+        self._last_run = 0.0
+
+    def start(self) -> None:
+        """백그라운드 검증 태스크 시작"""
+        if self._task is None and self._interval > 0:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """검증 태스크 종료"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await io_executor.run(self._catalog.verify)
+            except Exception as e:
+                logger.error(f"대시보드 집계 검증 오류: {e}")
+            self._last_run = time.time()
+
+    def stats(self) -> dict:
+        """검증 주기 / 마지막 실행 시각 (epoch 초)"""
+        return {"interval_s": self._interval, "last_run": self._last_run}
+
+
+# 프로세스 전역 프로젝트 카탈로그 (프로젝트 저장소가 공유) / 집계 주기 검증기
+project_catalog = ProjectCatalog(settings.PROJECTS_ROOT)
+catalog_verifier = CatalogVerifier(project_catalog, settings.DASHBOARD_VERIFY_INTERVAL)
@@ -0,0 +1,429 @@
+"""파싱된 보드의 컬럼 저장소 — 티켓 필드를 병렬 배열로 보관하고 Ticket 모델은 요청 시 생성"""
+
+import hashlib
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Generic, Optional, Sequence, TypeVar
+
+from backend.domain.section import Section
+from backend.domain.ticket import MARKER_TO_STAGE, KanbanStage, Ticket, TicketType
+
+# 배열 저장용 스테이지 코드 (코드 = STAGES 인덱스)
+STAGES: tuple[KanbanStage, ...] = tuple(KanbanStage)
+MARKER_TO_CODE: dict[str, int] = {
+    marker: STAGES.index(stage) for marker, stage in MARKER_TO_STAGE.items()
+}
+
+# 섹션이 없는 티켓의 소속 섹션 (모든 미분류 티켓이 같은 인스턴스 공유)
+FALLBACK_SECTION = Section(name="미분류", line_number=0)
+
+# 정수 컬럼 (티켓 하나당 각 배열 한 칸)
+_INT_COLUMNS = ("line_numbers", "indent_levels", "section_indexes", "parent_indexes")
+# 버퍼 오프셋 컬럼 (라인 시작 / 제목 구간 — 제목은 항상 라인 끝까지)
+_OFFSET_COLUMNS = ("line_starts", "title_starts", "title_ends")
+
+T = TypeVar("T")
+
+
+def ticket_key(section_name: str, title: str) -> str:
+    """
+    라인 번호와 무관한 티켓 키 — 소속 섹션명 + 제목 해시.
+
+    같은 섹션에 같은 제목이 여럿이면 두 번째부터 "-{순번}"이 붙는다
+    (number_keys). 마커/들여쓰기는 포함하지 않으므로 스테이지 이동이나
+    다른 티켓의 삽입/삭제로는 바뀌지 않는다.
+    """
+    digest = hashlib.blake2b(
+        f"{section_name}\n{title}".encode("utf-8"), digest_size=5
+    ).hexdigest()
+    return f"t{digest}"
+
+
+def number_keys(keys: Sequence[str]) -> list[str]:
+    """티켓 키 목록 → 중복 순번이 붙은 로컬 ID 목록 (파일 순서 기준)"""
+    seen: dict[str, int] = {}
+    ids = []
+    for key in keys:
+        count = seen.get(key, 0)
+        seen[key] = count + 1
+        ids.append(key if count == 0 else f"{key}-{count}")
+    return ids
+
+
+class ParentStack(Generic[T]):
+    """
+    indent_level 기반 부모 추적 스택 (티켓 순서대로 점진 구축).
+
+    알고리즘:
+    - 다음 티켓보다 indent_level이 같거나 깊은 항목은 pop
+    - 남은 스택 top이 부모 (indent_level > 0일 때만)
+    - 부모 없는 indent>0 티켓은 STANDALONE 유지 (안전)
+    """
+
+    __slots__ = ("_levels", "_items")
+
+    def __init__(self) -> None:
+        self._levels: list[int] = []
+        self._items: list[T] = []
+
+    def parent_for(self, indent_level: int) -> Optional[T]:
+        """다음 티켓(indent_level)의 부모 반환 — 스택에서 현재 레벨 이상 제거"""
+        levels = self._levels
+        while levels and levels[-1] >= indent_level:
+            levels.pop()
+            self._items.pop()
+        if indent_level > 0 and levels:
+            return self._items[-1]
+        return None
+
+    def push(self, indent_level: int, item: T) -> None:
+        """parent_for 직후 호출 — 티켓을 스택에 추가"""
+        self._levels.append(indent_level)
+        self._items.append(item)
+
+
+class TicketTable:
+    """
+    티켓 컬럼 저장소.
+
+    i번째 티켓의 필드를 각 배열의 i번째 칸에 보관한다. 라인/제목 텍스트는
+    복사하지 않고 buffer(원본 라인을 \\n으로 이은 문자열)의 오프셋만 기록한다.
+    에픽 여부와 자식 목록은 parent_indexes에서 유도한다
+    (자손은 항상 부모 바로 뒤에 연속으로 위치하므로 구간 탐색으로 충분).
+
+    티켓 ID("{project_id}:{로컬 ID}")의 키/로컬 ID/역색인은 처음 필요할 때
+    계산하며, 증분 갱신(spliced) 시 편집 구간만 다시 해시한다.
+    """
+
+    __slots__ = (
+        "buffer",
+        "line_count",
+        "stages",
+        *_INT_COLUMNS,
+        *_OFFSET_COLUMNS,
+        "_keys",
+        "_ids",
+        "_index",
+    )
+
+    def __init__(self, buffer: str = "", line_count: int = 0) -> None:
+        self.buffer = buffer
+        self.line_count = line_count
+        self.stages = array("b")
+        self.line_numbers = array("i")
+        self.indent_levels = array("i")
+        # ParseResult.sections 인덱스 (-1이면 미분류)
+        self.section_indexes = array("i")
+        # 부모 티켓 인덱스 (-1이면 없음)
+        self.parent_indexes = array("i")
+        self.line_starts = array("q")
+        self.title_starts = array("q")
+        self.title_ends = array("q")
+        # 티켓 키 / 로컬 ID / 로컬 ID → 인덱스 (지연 계산)
+        self._keys: Optional[list[str]] = None
+        self._ids: Optional[list[str]] = None
+        self._index: Optional[dict[str, int]] = None
+
+    def __len__(self) -> int:
+        return len(self.line_numbers)
+
+    # ── 조회 ──
+
+    def index_of_line(self, line_number: int) -> Optional[int]:
+        """라인 번호의 티켓 인덱스 (이진 탐색, 없으면 None)"""
+        index = bisect_left(self.line_numbers, line_number)
+        if index < len(self.line_numbers) and self.line_numbers[index] == line_number:
+            return index
+        return None
+
+    def line_offset(self, line_number: int) -> int:
+        """1-based 라인의 buffer 시작 오프셋 (가장 가까운 앞쪽 티켓 라인부터 이동)"""
+        index = bisect_right(self.line_numbers, line_number) - 1
+        if index >= 0:
+            line, pos = self.line_numbers[index], self.line_starts[index]
+        else:
+            line, pos = 1, 0
+        find = self.buffer.find
+        while line < line_number:
+            pos = find("\n", pos) + 1
+            line += 1
+        return pos
+
+    def local_ids(self, sections: Sequence[Section]) -> list[str]:
+        """티켓별 로컬 ID (파일 순서) — 반환 목록을 변경하면 안 됨"""
+        if self._ids is None:
+            if self._keys is None:
+                self._keys = self._compute_keys(sections)
+            self._ids = number_keys(self._keys)
+        return self._ids
+
+    def index_of_id(self, local_id: str, sections: Sequence[Section]) -> Optional[int]:
+        """로컬 ID의 티켓 인덱스 (역색인 조회, 없으면 None)"""
+        if self._index is None:
+            ids = self.local_ids(sections)
+            self._index = dict(zip(ids, range(len(ids))))
+        return self._index.get(local_id)
+
+    def _compute_keys(
+        self, sections: Sequence[Section], lo: int = 0, hi: Optional[int] = None
+    ) -> list[str]:
+        """[lo, hi) 티켓의 키 계산 (섹션명 + 버퍼의 제목 구간)"""
+        buffer = self.buffer
+        names = [section.name for section in sections]
+        fallback = FALLBACK_SECTION.name
+        section_indexes = self.section_indexes
+        title_starts = self.title_starts
+        title_ends = self.title_ends
+        keys = []
+        for i in range(lo, len(self) if hi is None else hi):
+            section_index = section_indexes[i]
+            keys.append(
+                ticket_key(
+                    names[section_index] if section_index >= 0 else fallback,
+                    buffer[title_starts[i]:title_ends[i]].strip(),
+                )
+            )
+        return keys
+
+    def stage_counts(self) -> dict[KanbanStage, int]:
+        """스테이지별 티켓 수 (Ticket 생성 없이 코드 배열만 집계)"""
+        return {stage: self.stages.count(code) for code, stage in enumerate(STAGES)}
+
+    def section_stage_counts(self, section_count: int) -> list[tuple[int, ...]]:
+        """
+        섹션별 스테이지별 티켓 수 — [미분류, 섹션 0, 섹션 1, ...] (STAGES 순서).
+
+        티켓은 파일 순서라 section_indexes가 오름차순이므로 섹션 구간을
+        이진 탐색으로 잘라 코드 배열만 센다.
+        """
+        sections = self.section_indexes
+        stages = self.stages
+        counts = []
+        start = 0
+        for section_index in range(-1, section_count):
+            end = bisect_left(sections, section_index + 1, start)
+            block = stages[start:end]
+            counts.append(tuple(block.count(code) for code in range(len(STAGES))))
+            start = end
+        return counts
+
+    def children(self, index: int) -> list[int]:
+        """직계 자식 인덱스 — 자손 구간(다음 같은/얕은 레벨 티켓 전까지)에서 탐색"""
+        levels = self.indent_levels
+        parents = self.parent_indexes
+        level = levels[index]
+        result = []
+        for i in range(index + 1, len(levels)):
+            if levels[i] <= level:
+                break
+            if parents[i] == index:
+                result.append(i)
+        return result
+
+    # ── Ticket 생성 ──
+
+    def ticket(
+        self, index: int, project_id: str, sections: Sequence[Section]
+    ) -> Ticket:
+        """i번째 티켓 하나만 Ticket 모델로 생성"""
+        local_ids = self.local_ids(sections)
+        parent = self.parent_indexes[index]
+        children_ids = [
+            f"{project_id}:{local_ids[child]}" for child in self.children(index)
+        ]
+        parent_id = f"{project_id}:{local_ids[parent]}" if parent >= 0 else None
+        return self._make(
+            index,
+            project_id,
+            sections,
+            parent_id,
+            children_ids,
+            f"{project_id}:{local_ids[index]}",
+        )
+
+    def tickets(self, project_id: str, sections: Sequence[Section]) -> list[Ticket]:
+        """전체 티켓을 파일 순서대로 Ticket 모델로 생성"""
+        ids = [f"{project_id}:{local_id}" for local_id in self.local_ids(sections)]
+        children_ids: dict[int, list[str]] = {}
+        for index, parent in enumerate(self.parent_indexes):
+            if parent >= 0:
+                children_ids.setdefault(parent, []).append(ids[index])
+
+        parents = self.parent_indexes
+        return [
+            self._make(
+                index,
+                project_id,
+                sections,
+                ids[parents[index]] if parents[index] >= 0 else None,
+                children_ids.get(index, []),
+                ids[index],
+            )
+            for index in range(len(ids))
+        ]
+
+    def _make(
+        self,
+        index: int,
+        project_id: str,
+        sections: Sequence[Section],
+        parent_id: Optional[str],
+        children_ids: list[str],
+        ticket_id: str,
+    ) -> Ticket:
+        # 자식이 있으면 (부모가 있더라도) 에픽
+        if children_ids:
+            ticket_type = TicketType.EPIC
+        elif parent_id is not None:
+            ticket_type = TicketType.CHILD
+        else:
+            ticket_type = TicketType.STANDALONE
+
+        line_number = self.line_numbers[index]
+        section_index = self.section_indexes[index]
+        buffer = self.buffer
+        return Ticket(
+            ticket_id=ticket_id,
+            title=buffer[self.title_starts[index]:self.title_ends[index]].strip(),
+            stage=STAGES[self.stages[index]],
+            section=sections[section_index] if section_index >= 0 else FALLBACK_SECTION,
+            line_number=line_number,
+            raw_line=buffer[self.line_starts[index]:self.title_ends[index]],
+            indent_level=self.indent_levels[index],
+            ticket_type=ticket_type,
+            parent_id=parent_id,
+            children_ids=children_ids,
+        )
+
+    # ── 직렬화 ──
+
+    def to_bytes(self) -> bytes:
+        """컬럼 배열을 이어 붙인 바이트 (버퍼 제외, from_bytes로 복원)"""
+        return b"".join(
+            getattr(self, name).tobytes()
+            for name in ("stages", *_INT_COLUMNS, *_OFFSET_COLUMNS)
+        )
+
+    @classmethod
+    def from_bytes(
+        cls, buffer: str, line_count: int, count: int, data: bytes
+    ) -> Optional["TicketTable"]:
+        """
+        to_bytes 결과 복원 (티켓 count개, 길이가 맞지 않으면 None).
+
+        buffer는 직렬화 당시와 같은 내용이어야 한다 (오프셋 검증 없음).
+        """
+        table = cls(buffer, line_count)
+        names = ("stages", *_INT_COLUMNS, *_OFFSET_COLUMNS)
+        sizes = [getattr(table, name).itemsize * count for name in names]
+        if sum(sizes) != len(data):
+            return None
+        start = 0
+        for name, size in zip(names, sizes):
+            getattr(table, name).frombytes(data[start:start + size])
+            start += size
+        return table
+
+    # ── 증분 갱신 ──
+
+    def spliced(
+        self,
+        lo: int,
+        hi: int,
+        middle: "TicketTable",
+        line_delta: int,
+        offset_delta: int,
+        sections: Sequence[Section] = (),
+    ) -> "TicketTable":
+        """
+        [lo, hi) 티켓을 middle 티켓으로 교체한 새 테이블 (self는 변경하지 않음).
+
+        middle은 새 버퍼(middle.buffer)에서 렉싱된 티켓이며, hi 이후 티켓은
+        라인 번호/오프셋을 일괄 이동한다. 부모 인덱스는 앞쪽 티켓에만 의존하므로
+        lo 이전은 그대로 두고, lo부터 편집 이후 첫 루트(indent 0) 티켓 전까지만
+        다시 계산한 뒤 나머지는 인덱스 차이만큼 이동한다.
+
+        sections는 middle의 section_indexes가 가리키는 섹션 목록 (섹션명 불변) —
+        self의 ID가 계산되어 있으면 middle 티켓만 해시하여 이어받는다.
+        """
+        table = TicketTable(middle.buffer, middle.line_count)
+        shifts = {"line_numbers": line_delta}
+        shifts.update((name, offset_delta) for name in _OFFSET_COLUMNS)
+        for name in ("stages", *_INT_COLUMNS[:-1], *_OFFSET_COLUMNS):
+            old = getattr(self, name)
+            column = old[:lo]
+            column += getattr(middle, name)
+            tail = old[hi:]
+            shift = shifts.get(name, 0)
+            if shift:
+                tail = array(old.typecode, [value + shift for value in tail])
+            column += tail
+            setattr(table, name, column)
+
+        # 부모 인덱스: lo 직전 티켓의 조상 체인으로 스택 복원 후 재계산
+        old_parents = self.parent_indexes
+        parents = old_parents[:lo]
+        chain = []
+        index = lo - 1
+        while index >= 0:
+            chain.append(index)
+            index = old_parents[index]
+        stack: ParentStack[int] = ParentStack()
+        levels = table.indent_levels
+        for index in reversed(chain):
+            stack.push(levels[index], index)
+
+        count_delta = len(middle) - (hi - lo)
+        tail_start = lo + len(middle)
+        index = lo
+        total = len(levels)
+        while index < total and (index < tail_start or levels[index] > 0):
+            parent = stack.parent_for(levels[index])
+            parents.append(-1 if parent is None else parent)
+            stack.push(levels[index], index)
+            index += 1
+        parents += array(
+            "i",
+            [
+                parent + count_delta if parent >= 0 else parent
+                for parent in old_parents[index - count_delta:]
+            ],
+        )
+        table.parent_indexes = parents
+        if self._keys is not None:
+            self._splice_ids(table, lo, hi, middle._compute_keys(sections))
+        return table
+
+    def _splice_ids(
+        self, table: "TicketTable", lo: int, hi: int, middle_keys: list[str]
+    ) -> None:
+        """
+        spliced 결과에 키/로컬 ID/역색인 이어받기.
+
+        구간의 키가 그대로면(스테이지 변경 등) 목록과 역색인을 공유하고,
+        아니면 바뀐 키의 중복 순번만 다시 매긴다 (역색인은 다음 조회 시 재구성).
+        """
+        old_keys = self._keys
+        removed = old_keys[lo:hi]
+        keys = old_keys[:lo] + middle_keys + old_keys[hi:]
+        table._keys = keys
+        if self._ids is None:
+            return
+        if removed == middle_keys:
+            table._ids = self._ids
+            table._index = self._index
+            return
+
+        ids = self._ids[:lo] + middle_keys + self._ids[hi:]
+        for key in set(removed).union(middle_keys):
+            # 같은 키 티켓만 C 수준 검색으로 찾아 순번 재계산
+            index = -1
+            count = 0
+            while True:
+                try:
+                    index = keys.index(key, index + 1)
+                except ValueError:
+                    break
+                ids[index] = key if count == 0 else f"{key}-{count}"
+                count += 1
+        table._ids = ids
@@ -1,21 +1,288 @@
 """todo.md 파싱 엔진 — 마크다운 체크박스를 구조화된 Ticket 데이터로 변환"""
 
+import mmap
+import os
 import re
-from dataclasses import dataclass, field
-from pathlib import Path
-from typing import Optional
+from bisect import bisect_left
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Union,
+)
 
+from backend.domain.board_index import BoardIndex
 from backend.domain.section import Section
 from backend.domain.ticket import MARKER_TO_STAGE, KanbanStage, Ticket, TicketType
+from backend.infrastructure.file_system.parse_cache import (
+    content_digest,
+    file_fingerprint,
+    parse_cache,
+)
+from backend.infrastructure.file_system.ticket_table import (
+    FALLBACK_SECTION,
+    MARKER_TO_CODE,
+    STAGES,
+    ParentStack,
+    TicketTable,
+    ticket_key,
+)
+
+if TYPE_CHECKING:
+    from backend.infrastructure.file_system.todo_writer import WriteResult
+
+# 메모리 매핑 디코딩 블록 크기 (\n 경계로 맞춤)
+_DECODE_BLOCK_SIZE = 1 << 20
+
+# \n 외의 str.splitlines() 라인 경계 문자
+# (문자별 `in` 검색이 정규식 문자 클래스보다 수 배 빨라 대용량 파싱 시 GIL 점유가 짧음)
+_SPECIAL_BREAKS = "\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+
+# 위 경계 문자의 UTF-8 바이트 — ASCII / 멀티바이트 (ASCII 버퍼면 뒤쪽 검사 생략)
+_ASCII_BREAK_BYTES = tuple(ch.encode() for ch in _SPECIAL_BREAKS if ch < "\x80")
+_UNICODE_BREAK_BYTES = tuple(ch.encode() for ch in _SPECIAL_BREAKS if ch >= "\x80")
+
+# 정규식 \s 중 \n 외 라인 경계를 뺀 공백 문자의 UTF-8 바이트 패턴
+# (ASCII 공백 / 그 밖의 유니코드 공백 — 파서 렉서의 [^\S\n]과 같은 문자 집합)
+_ASCII_SPACE = rb"[\t \x1f]"
+_UNICODE_SPACE = (
+    rb"(?:\xc2\xa0|\xe1\x9a\x80|\xe2\x80[\x80-\x8a\xaf]|\xe2\x81\x9f|\xe3\x80\x80)"
+)
+
+
+@dataclass(frozen=True)
+class ProjectTitle:
+    """todo.md 첫 번째 # 헤더 (스트리밍 파싱 이벤트)"""
+
+    name: str
+    line_number: int
+
+
+# 스트리밍 파싱 이벤트 — 파일 순서대로 방출
+ParseEvent = Union[ProjectTitle, Section, Ticket]
+
+# TodoParser.lex 토큰 종류 (= TodoParser.TOKEN_RE 매치의 마지막 그룹 번호)
+TOKEN_CHECKBOX = 3
+TOKEN_SECTION = 4
+TOKEN_TITLE = 5
 
 
-@dataclass
 class ParseResult:
-    """todo.md 파싱 결과"""
+    """
+    todo.md 파싱 결과.
+
+    티켓은 TicketTable 컬럼으로만 보관하고, tickets/find_ticket 접근 시
+    Ticket 모델을 생성한다 (tickets는 호출마다 새 목록을 만든다).
+    index는 처음 접근할 때 한 번 만들어 캐시된 결과와 함께 공유한다.
+    """
+
+    __slots__ = (
+        "project_id",
+        "project_title",
+        "sections",
+        "table",
+        "title_line_number",
+        "digest",
+        "_index",
+        "_section_by_name",
+    )
+
+    def __init__(
+        self,
+        project_id: str = "",
+        project_title: str = "",
+        sections: Optional[list[Section]] = None,
+        table: Optional[TicketTable] = None,
+        title_line_number: int = 0,
+        digest: Optional[str] = None,
+    ) -> None:
+        self.project_id = project_id
+        self.project_title = project_title
+        self.sections: list[Section] = sections if sections is not None else []
+        self.table = table if table is not None else TicketTable()
+        # 제목 라인 번호 (0이면 제목 없음) — 증분 재파싱 시 구조 변경 감지용
+        self.title_line_number = title_line_number
+        # 파싱한 원본 바이트의 내용 해시 (쓰기 전후 일치 검증용)
+        self.digest = digest
+        # 보드 색인 / 섹션명 → 섹션 (지연 생성)
+        self._index: Optional[BoardIndex] = None
+        self._section_by_name: Optional[dict[str, Section]] = None
 
-    project_title: str = ""
-    sections: list[Section] = field(default_factory=list)
-    tickets: list[Ticket] = field(default_factory=list)
+    @property
+    def tickets(self) -> list[Ticket]:
+        """전체 티켓 (파일 순서)"""
+        return self.table.tickets(self.project_id, self.sections)
+
+    @property
+    def index(self) -> BoardIndex:
+        """
+        전체 티켓의 BoardIndex (결과당 한 번 생성, 공유되므로 변경 금지).
+
+        다른 스레드와 동시에 처음 접근하면 두 번 만들어질 수 있지만
+        내용이 같으므로 나중 것이 남아도 무방하다.
+        """
+        index = self._index
+        if index is None:
+            index = BoardIndex(self.tickets, self.sections)
+            self._index = index
+        return index
+
+    @property
+    def indexed(self) -> bool:
+        """BoardIndex가 이미 만들어졌는지 (메모리 추정용)"""
+        return self._index is not None
+
+    def section_named(self, name: str) -> Optional[Section]:
+        """
+        이름으로 섹션 조회 (같은 이름이 여럿이면 첫 번째).
+
+        쓰기 경로에서 쓰므로 티켓을 생성하지 않는 섹션 맵만 만든다.
+        """
+        if self._index is not None:
+            return self._index.section(name)
+        if self._section_by_name is None:
+            section_by_name: dict[str, Section] = {}
+            for section in self.sections:
+                section_by_name.setdefault(section.name, section)
+            self._section_by_name = section_by_name
+        return self._section_by_name.get(name)
+
+    @property
+    def ticket_count(self) -> int:
+        return len(self.table)
+
+    def _index_of(self, ticket_id: str) -> Optional[int]:
+        """
+        티켓 ID의 테이블 인덱스 (로컬 ID 역색인 조회).
+
+        하위 호환: 로컬 ID가 숫자면 이전 형식("{project_id}:{라인번호}")으로 보고
+        라인 번호로 이진 탐색한다.
+        """
+        project_id, _, local_id = ticket_id.rpartition(":")
+        if project_id != self.project_id:
+            return None
+        if local_id.isdigit():
+            line_number = int(local_id)
+            if str(line_number) != local_id:
+                return None
+            return self.table.index_of_line(line_number)
+        return self.table.index_of_id(local_id, self.sections)
+
+    def find_ticket(self, ticket_id: str) -> Optional[Ticket]:
+        """ID로 티켓 조회 (색인이 있으면 공유 티켓, 없으면 하나만 생성)"""
+        if self._index is not None:
+            ticket = self._index.get(ticket_id)
+            if ticket is not None:
+                return ticket
+        index = self._index_of(ticket_id)
+        if index is None:
+            return None
+        return self.table.ticket(index, self.project_id, self.sections)
+
+    def line_of(self, ticket_id: str) -> Optional[int]:
+        """티켓 ID의 현재 라인 번호 (없으면 None)"""
+        index = self._index_of(ticket_id)
+        return None if index is None else self.table.line_numbers[index]
+
+    def ticket_at_line(self, line_number: int) -> Optional[Ticket]:
+        """라인 번호의 티켓 하나만 생성 (이진 탐색, 없으면 None)"""
+        index = self.table.index_of_line(line_number)
+        if index is None:
+            return None
+        return self.table.ticket(index, self.project_id, self.sections)
+
+    def ticket_id_at_line(self, line_number: int) -> Optional[str]:
+        """라인 번호의 티켓 ID (Ticket 생성 없음)"""
+        index = self.table.index_of_line(line_number)
+        if index is None:
+            return None
+        return f"{self.project_id}:{self.table.local_ids(self.sections)[index]}"
+
+    def count_by_stage(self) -> dict[KanbanStage, int]:
+        """스테이지별 티켓 수 (Ticket 생성 없음)"""
+        return self.table.stage_counts()
+
+
+class TodoSummary(NamedTuple):
+    """
+    todo.md 요약 — 제목/섹션/스테이지별 티켓 수/내용 해시 (티켓 컬럼 없음).
+
+    프로세스 풀 워커의 반환값으로도 쓰므로 기본 타입만 사용한다
+    (Pydantic 모델보다 피클 크기/비용이 작다).
+    """
+
+    title: str
+    sections: tuple[tuple[str, int], ...]
+    # STAGES 순서의 스테이지별 티켓 수
+    stage_counts: tuple[int, ...]
+    # [미분류, 섹션 0, 섹션 1, ...]의 STAGES 순서 스테이지별 티켓 수
+    section_stage_counts: tuple[tuple[int, ...], ...]
+    digest: Optional[str]
+
+    @classmethod
+    def of(cls, result: ParseResult) -> "TodoSummary":
+        """전체 파싱 결과의 요약"""
+        counts = result.count_by_stage()
+        return cls(
+            result.project_title,
+            tuple((section.name, section.line_number) for section in result.sections),
+            tuple(counts[stage] for stage in STAGES),
+            tuple(result.table.section_stage_counts(len(result.sections))),
+            result.digest,
+        )
+
+
+class StoredBoard(NamedTuple):
+    """
+    영속 색인에 저장하는 전체 파싱 결과 — 티켓 컬럼은 바이트, 버퍼는 제외.
+
+    내용 해시가 같은 파일의 텍스트와 합쳐 ParseResult로 복원한다
+    (TodoParser.parse의 restore).
+    """
+
+    title: str
+    title_line_number: int
+    sections: tuple[tuple[str, int], ...]
+    line_count: int
+    ticket_count: int
+    columns: bytes
+
+    @classmethod
+    def of(cls, result: ParseResult) -> "StoredBoard":
+        """파싱 결과의 저장 형태"""
+        return cls(
+            result.project_title,
+            result.title_line_number,
+            tuple((section.name, section.line_number) for section in result.sections),
+            result.table.line_count,
+            len(result.table),
+            result.table.to_bytes(),
+        )
+
+
+# (파일 경로, 내용 해시) → 같은 내용의 저장된 파싱 결과 (없으면 None)
+RestoreHook = Callable[[str, str], Optional[StoredBoard]]
+
+
+@dataclass(frozen=True)
+class LineEdit:
+    """
+    라인 범위 편집 — start(1-based)부터 deleted줄을 new_lines로 교체.
+
+    - 교체: deleted=1, new_lines=(새 라인,)
+    - 삽입: deleted=0
+    - 삭제: new_lines=()
+    """
+
+    start: int
+    deleted: int
+    new_lines: tuple[str, ...] = ()
 
 
 class TodoParser:
@@ -27,91 +294,565 @@ class TodoParser:
     SECTION_RE = re.compile(r"^##\s+(.+)$")
     # 프로젝트 제목 패턴 (첫 번째 # 라인)
     TITLE_RE = re.compile(r"^#\s+(.+)$")
+    # 렉서용 결합 패턴 — 위 세 패턴을 라인 단위로 적용한 것과 같은 결과
+    # (버퍼 전체를 한 번에 스캔하므로 공백 클래스에서 \n 제외)
+    # 그룹: 1 들여쓰기, 2 마커, 3 체크박스 내용, 4 섹션 이름, 5 프로젝트 제목
+    TOKEN_RE = re.compile(
+        r"^(?:([^\S\n]*)- \[([xX ~QD])\][^\S\n]+(.+)"
+        r"|##[^\S\n]+(.+)"
+        r"|#[^\S\n]+(.+))$",
+        re.MULTILINE,
+    )
+    # 요약 스캔용 바이트 패턴 — TOKEN_RE와 같은 라인을 찾되 체크박스는 마커만,
+    # 헤더는 "#"/"##"과 나머지 라인만 캡처 (버퍼 앞에 \n을 붙여 라인 시작을
+    # 리터럴 \n으로 찾으므로 MULTILINE ^보다 빠르다. 들여쓰기 뒤에는 "-"나
+    # 다른 공백만 올 수 있으므로 소유 수량자로 되돌림 시도를 없앤다)
+    _SPACE = rb"(?:" + _ASCII_SPACE + rb"|" + _UNICODE_SPACE + rb")"
+    _CONTENT = rb"(?=" + _SPACE + rb"[^\n])"
+    COUNT_RE = re.compile(
+        rb"\n" + _ASCII_SPACE + rb"*+(?:" + _UNICODE_SPACE + _ASCII_SPACE + rb"*+)*+"
+        rb"- \[([xX ~QD])\]" + _CONTENT
+    )
+    HEADER_RE = re.compile(rb"\n(##?)" + _CONTENT + rb"([^\n]*)")
 
-    def parse(self, file_path: str, project_id: str) -> ParseResult:
+    def parse(
+        self,
+        file_path: str,
+        project_id: str,
+        restore: Optional[RestoreHook] = None,
+    ) -> ParseResult:
         """
         todo.md를 읽어 제목, 섹션, 티켓 목록을 반환.
 
         알고리즘:
         1. # 라인 → 프로젝트 제목
         2. ## 라인 → 현재 섹션 갱신
-        3. - [*] 라인 → Ticket 생성 (현재 섹션 소속)
+        3. - [*] 라인 → 티켓 컬럼 추가 (현재 섹션 소속)
+
+        파일 지문(mtime_ns, 크기)이 같으면 전역 캐시의 결과를 그대로 반환한다.
+        캐시에 없고 restore가 같은 내용 해시의 저장된 결과를 주면 렉싱 없이 복원한다.
+
+        스트리밍 경로(iter_parse)를 쓰지 않는다 — 결과를 통째로 캐시/증분
+        갱신하므로 메모리 매핑한 파일을 한 번에 디코딩해 컬럼 테이블로 렉싱한다
+        (메모리는 파일 크기에 비례). 일정 메모리 순회가 필요하면 iter_parse를 쓴다.
+        """
+        generation = parse_cache.generation(file_path)
+        fingerprint = file_fingerprint(file_path)
+        if fingerprint is None:
+            return ParseResult(project_id=project_id)
+
+        if not parse_cache.verify_hash:
+            cached = parse_cache.get(file_path, project_id, fingerprint)
+            if cached is not None:
+                return cached
+
+        with _map_file(file_path) as buf:
+            digest = content_digest(buf)
+            # 해시 검증 모드에서는 내용까지 비교
+            if parse_cache.verify_hash:
+                cached = parse_cache.get(
+                    file_path, project_id, fingerprint, digest
+                )
+                if cached is not None:
+                    return cached
+            text = str(buf, "utf-8")
+
+        stored = restore(file_path, digest) if restore is not None else None
+        result = self.restore_text(text, project_id, stored) if stored else None
+        if result is None:
+            result = self.parse_text(text, project_id)
+        result.digest = digest
+        parse_cache.put(
+            file_path, project_id, fingerprint, result, digest, generation
+        )
+        return result
+
+    def parse_text(self, text: str, project_id: str) -> ParseResult:
+        """todo.md 본문 텍스트를 파싱 (캐시 미사용)"""
+        buffer = _normalize(text)
+        result = ParseResult(
+            project_id=project_id,
+            table=TicketTable(buffer, _line_count(text, buffer)),
+        )
+        self._scan(result, 0, len(buffer), 1, -1)
+        return result
+
+    def restore_text(
+        self, text: str, project_id: str, stored: StoredBoard
+    ) -> Optional[ParseResult]:
+        """저장된 결과를 같은 내용의 본문 텍스트로 복원 (컬럼이 손상됐으면 None)"""
+        buffer = _normalize(text)
+        table = TicketTable.from_bytes(
+            buffer, stored.line_count, stored.ticket_count, stored.columns
+        )
+        if table is None or table.line_count != _line_count(text, buffer):
+            return None
+        return ParseResult(
+            project_id=project_id,
+            project_title=stored.title,
+            sections=[
+                Section(name=name, line_number=line_number)
+                for name, line_number in stored.sections
+            ],
+            table=table,
+            title_line_number=stored.title_line_number,
+        )
+
+    def summarize(self, file_path: str, project_id: str) -> Optional[TodoSummary]:
+        """
+        todo.md 요약 (파일이 없으면 None).
+
+        지문이 같은 전체 파싱 결과가 캐시에 있으면 그 요약을, 없으면 바이트
+        요약 스캔(summarize_bytes) 결과를 반환한다. 결과는 캐시하지 않는다.
+        """
+        fingerprint = file_fingerprint(file_path)
+        if fingerprint is None:
+            return None
+        if not parse_cache.verify_hash:
+            cached = parse_cache.get(file_path, project_id, fingerprint)
+            if cached is not None:
+                return TodoSummary.of(cached)
+        try:
+            with open(file_path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        return self.summarize_bytes(data)
+
+    def summarize_bytes(self, data: bytes) -> TodoSummary:
+        """
+        todo.md 원본 바이트 요약 — 디코딩/티켓 컬럼 없이 마커 바이트만 센다.
+
+        제목/섹션/스테이지별 수는 parse_text와 정확히 같다: 라인 경계를 \n으로
+        통일한 뒤(_normalize와 같은 라인 번호) 렉서와 같은 공백 문자 집합의
+        바이트 패턴으로 체크박스 마커와 헤더 라인만 찾는다.
+
+        parse 대비 약 6~10배 빠르다 (벤치마크 summarize/parse: 10k 8배,
+        100k 10배, 1M 6배). 대시보드 콜드 조회는 약 7배로 10배에 못 미친다 —
+        남은 시간은 대부분 버전에 필요한 내용 해시와 마커 findall이다.
+        """
+        digest = content_digest(data)
+        buffer = b"\n" + data
+        special_breaks = _ASCII_BREAK_BYTES
+        if not buffer.isascii():
+            special_breaks += _UNICODE_BREAK_BYTES
+        for special in special_breaks:
+            # 첫 바이트 검색(memchr)으로 먼저 걸러 멀티바이트 패턴 검색 생략
+            if special[:1] in buffer and special in buffer:
+                if special == b"\r":
+                    # \r\n은 경계 하나
+                    buffer = buffer.replace(b"\r\n", b"\n")
+                buffer = buffer.replace(special, b"\n")
+
+        title = ""
+        sections: list[tuple[str, int]] = []
+        # 섹션 구간 경계 (섹션 헤더 라인 앞 \n 위치, 첫 구간은 미분류)
+        bounds = [0]
+        line_num = 1
+        last = 0
+        for match in self.HEADER_RE.finditer(buffer):
+            start = match.start()
+            line_num += buffer.count(b"\n", last, start)
+            last = start
+            hashes, rest = match.groups()
+            # 렉서 그룹(.+)의 strip()과 같다 (앞 공백은 어차피 제거)
+            name = rest.decode("utf-8").strip()
+            if hashes == b"##":
+                sections.append((name, line_num))
+                bounds.append(start)
+            elif not title and name:
+                title = name
+        bounds.append(len(buffer))
+
+        # 섹션 구간별 마커 집계 (구간 경계는 라인 시작이므로 체크박스가 걸치지 않음)
+        section_stage_counts = []
+        for start, end in zip(bounds, bounds[1:]):
+            counts = [0] * len(STAGES)
+            markers = Counter(self.COUNT_RE.findall(buffer, start, end))
+            for marker, count in markers.items():
+                counts[MARKER_TO_CODE[marker.decode()]] += count
+            section_stage_counts.append(tuple(counts))
+        stage_counts = tuple(map(sum, zip(*section_stage_counts)))
+
+        return TodoSummary(
+            title, tuple(sections), stage_counts, tuple(section_stage_counts), digest
+        )
+
+    def iter_parse(
+        self, file_path: str, project_id: str
+    ) -> Iterator[ParseEvent]:
+        """
+        todo.md를 메모리 매핑하여 제목/섹션/티켓을 파일 순서대로 yield.
+
+        전체 목록을 만들지 않으므로 수백 MB 파일도 개수 세기, 필터링,
+        직렬화를 일정 메모리로 처리할 수 있다. 에픽 여부는 후속 티켓을 봐야
+        확정되므로 부모 스택이 빌 때까지(다음 티켓이 어느 티켓의 자식도 아닐
+        때까지)만 버퍼링한다 — 보류량은 가장 큰 최상위 티켓 블록 하나로 제한된다.
+        캐시를 거치지 않는다.
+        """
+        if file_fingerprint(file_path) is None:
+            return
+        with _map_file(file_path) as buf:
+            yield from self._iter_events(_iter_blocks(buf), project_id)
+
+    def lex(
+        self,
+        buffer: str,
+        pos: int = 0,
+        endpos: Optional[int] = None,
+        first_line: int = 1,
+    ) -> Iterator[tuple[int, int, re.Match]]:
         """
-        path = Path(file_path)
-        if not path.exists():
-            return ParseResult()
+        토큰 스캐너 — TOKEN_RE 하나로 버퍼를 스캔하여 제목/섹션/체크박스 라인만 방출.
+
+        buffer는 라인을 \n으로 이은 텍스트 (_normalize 참고)이며 pos는 라인
+        시작이어야 한다. 라인을 잘라내지 않고 정규식 엔진이 버퍼를 직접
+        훑으므로 매치되지 않는 라인에는 파이썬 코드가 실행되지 않는다.
+        매치 전체(group(0))가 라인 텍스트, 토큰 종류는 match.lastindex.
 
-        text = path.read_text(encoding="utf-8")
-        lines = text.splitlines()
+        렉싱 단계만 보면 라인별 3중 정규식 탐색보다 약 1.0~1.5배 빠를 뿐이다
+        (lexer_bench, 10만 라인 중 9할이 체크박스 — 정규식 매치 자체가 대부분).
+        전체 파싱의 이득은 Ticket 생성을 미루는 컬럼 테이블(_scan)에서 나온다.
+
+        yield: (토큰 종류, 1-based 라인 번호, 매치 객체)
+        """
+        if endpos is None:
+            endpos = len(buffer)
+        count = buffer.count
+        line_num = first_line
+        last = pos
+        for match in self.TOKEN_RE.finditer(buffer, pos, endpos):
+            start = match.start()
+            line_num += count("\n", last, start)
+            last = start
+            yield match.lastindex, line_num, match
 
-        result = ParseResult()
+    def _scan(
+        self,
+        result: ParseResult,
+        pos: int,
+        endpos: int,
+        first_line: int,
+        section_index: int,
+    ) -> None:
+        """result.table.buffer의 [pos, endpos) 구간을 렉싱하여 제목/섹션/티켓 컬럼 추가"""
+        table = result.table
+        sections = result.sections
+        title_found = result.title_line_number > 0
+        hierarchy: ParentStack[int] = ParentStack()
+        parent_for = hierarchy.parent_for
+        push = hierarchy.push
+
+        # 컬럼 append 메서드 (핫 루프 속성 조회 제거)
+        add_line = table.line_numbers.append
+        add_stage = table.stages.append
+        add_level = table.indent_levels.append
+        add_section = table.section_indexes.append
+        add_parent = table.parent_indexes.append
+        add_line_start = table.line_starts.append
+        add_title_start = table.title_starts.append
+        add_title_end = table.title_ends.append
+        marker_codes = MARKER_TO_CODE
+        index = len(table)
+
+        for kind, line_num, match in self.lex(table.buffer, pos, endpos, first_line):
+            if kind == TOKEN_CHECKBOX:
+                # 그룹 구간 한 번에 조회: (전체, 들여쓰기, 마커, 내용)
+                line_span, indent_span, _, content_span = match.regs[:4]
+                level = (indent_span[1] - indent_span[0]) // 2
+                parent = parent_for(level)
+                add_line(line_num)
+                add_stage(marker_codes[match.group(2)])
+                add_level(level)
+                add_section(section_index)
+                add_parent(-1 if parent is None else parent)
+                add_line_start(line_span[0])
+                add_title_start(content_span[0])
+                add_title_end(content_span[1])
+                push(level, index)
+                index += 1
+            elif kind == TOKEN_SECTION:
+                # 섹션 헤더 갱신 (같은 섹션의 티켓은 이 인스턴스를 공유)
+                sections.append(
+                    Section(name=match.group(kind).strip(), line_number=line_num)
+                )
+                section_index = len(sections) - 1
+            elif not title_found:
+                # 프로젝트 제목 추출 (첫 번째 # 만, 빈 제목은 무시)
+                name = match.group(kind).strip()
+                if name:
+                    title_found = True
+                    result.project_title = name
+                    result.title_line_number = line_num
+
+    def _iter_events(
+        self, blocks: Iterable[str], project_id: str
+    ) -> Iterator[ParseEvent]:
+        """텍스트 블록 스트림 → 파싱 이벤트 스트림 (계층 관계 확정 후 방출)"""
+        title_found = False
         current_section: Optional[Section] = None
+        hierarchy: ParentStack[Ticket] = ParentStack()
+        # 티켓 키별 등장 횟수 (중복 순번)
+        seen: dict[str, int] = {}
+        # 부모 스택에 남은(자식이 더 붙을 수 있는) 티켓이 있는 동안 이벤트 보류
+        pending: list[ParseEvent] = []
+        first_line = 1
 
-        for line_num, line in enumerate(lines, start=1):
-            # 프로젝트 제목 추출 (첫 번째 # 만)
-            if not result.project_title:
-                title_match = self.TITLE_RE.match(line)
-                if title_match:
-                    result.project_title = title_match.group(1).strip()
+        for block in blocks:
+            buffer = _normalize(block)
+            for kind, line_num, match in self.lex(buffer, first_line=first_line):
+                if kind == TOKEN_CHECKBOX:
+                    # 부모는 생성 시점에 확정 (에픽 여부만 후속 티켓이 결정)
+                    level = len(match.group(1)) // 2
+                    parent = hierarchy.parent_for(level)
+                    key = ticket_key(
+                        (current_section or FALLBACK_SECTION).name,
+                        match.group(3).strip(),
+                    )
+                    count = seen.get(key, 0)
+                    seen[key] = count + 1
+                    ticket = self._make_ticket(
+                        match,
+                        line_num,
+                        current_section,
+                        f"{project_id}:{key if count == 0 else f'{key}-{count}'}",
+                        parent,
+                    )
+                    # 부모 없음 = 스택이 비었음 → 보류 중인 티켓의 계층 확정, 방출
+                    # (루트 없이 들여쓴 티켓만 있는 파일도 블록마다 흘려보낸다)
+                    if parent is None and pending:
+                        yield from pending
+                        pending = []
+                    if parent is not None:
+                        parent.children_ids.append(ticket.ticket_id)
+                        parent.ticket_type = TicketType.EPIC
+                    hierarchy.push(level, ticket)
+                    pending.append(ticket)
                     continue
 
-            # 섹션 헤더 갱신
-            section_match = self.SECTION_RE.match(line)
-            if section_match:
-                current_section = Section(
-                    name=section_match.group(1).strip(),
-                    line_number=line_num,
-                )
-                result.sections.append(current_section)
-                continue
-
-            # 체크박스 → 티켓 변환
-            checkbox_match = self.CHECKBOX_RE.match(line)
-            if checkbox_match:
-                indent = checkbox_match.group(1)
-                marker_char = checkbox_match.group(2)
-                content = checkbox_match.group(3).strip()
-
-                stage = MARKER_TO_STAGE.get(marker_char, KanbanStage.PLAN)
-                fallback_section = Section(name="미분류", line_number=0)
-
-                ticket = Ticket(
-                    ticket_id=f"{project_id}:{line_num}",
-                    title=content,
-                    stage=stage,
-                    section=current_section or fallback_section,
-                    line_number=line_num,
-                    raw_line=line,
-                    indent_level=len(indent) // 2,
-                )
-                result.tickets.append(ticket)
+                if kind == TOKEN_SECTION:
+                    event: ParseEvent = Section(
+                        name=match.group(kind).strip(),
+                        line_number=line_num,
+                    )
+                    current_section = event
+                else:
+                    name = match.group(kind).strip()
+                    if title_found or not name:
+                        continue
+                    title_found = True
+                    event = ProjectTitle(name=name, line_number=line_num)
+
+                if pending:
+                    pending.append(event)
+                else:
+                    yield event
+            first_line += _line_count(block, buffer)
+
+        yield from pending
+
+    @staticmethod
+    def _make_ticket(
+        checkbox_match: re.Match,
+        line_num: int,
+        section: Optional[Section],
+        ticket_id: str,
+        parent: Optional[Ticket] = None,
+    ) -> Ticket:
+        """체크박스 매치(그룹 1~3) → Ticket (parent가 있으면 자식으로 생성)"""
+        indent, marker_char, content = checkbox_match.group(1, 2, 3)
+        return Ticket(
+            ticket_id=ticket_id,
+            title=content.strip(),
+            stage=MARKER_TO_STAGE.get(marker_char, KanbanStage.PLAN),
+            section=section or FALLBACK_SECTION,
+            line_number=line_num,
+            raw_line=checkbox_match.group(0),
+            indent_level=len(indent) // 2,
+            ticket_type=TicketType.STANDALONE if parent is None else TicketType.CHILD,
+            parent_id=None if parent is None else parent.ticket_id,
+        )
+
+    def apply_write(
+        self,
+        file_path: str,
+        project_id: str,
+        prev: ParseResult,
+        write: "WriteResult",
+    ) -> ParseResult:
+        """
+        TodoWriter 쓰기 결과를 이전 파싱 결과에 반영.
+
+        prev가 쓰기 직전 파일 내용과 정확히 일치(내용 해시 비교)하면
+        편집 범위만 재파싱하고, 아니면 전체 재파싱으로 폴백한다.
+        갱신된 결과는 쓰기 후 파일 지문으로 캐시에 저장된다.
+        """
+        if (
+            write.edits is None
+            or prev.digest is None
+            or prev.digest != write.before_digest
+            or write.after_fingerprint is None
+        ):
+            return self.parse(file_path, project_id)
+
+        result: Optional[ParseResult] = prev
+        for edit in write.edits:
+            result = self.reparse_edit(result, edit, project_id)
+            if result is None:
+                return self.parse(file_path, project_id)
 
-        # 후처리: indent_level 기반 에픽/자식 계층 구축
-        self._build_hierarchy(result.tickets)
+        result.digest = write.after_digest
+        parse_cache.put(
+            file_path,
+            project_id,
+            write.after_fingerprint,
+            result,
+            write.after_digest,
+            write.generation,
+        )
         return result
 
-    def _build_hierarchy(self, tickets: list[Ticket]) -> None:
+    def reparse_edit(
+        self, prev: ParseResult, edit: LineEdit, project_id: str
+    ) -> Optional[ParseResult]:
         """
-        indent_level 기반으로 부모-자식 관계 설정.
+        라인 범위 편집 하나를 반영한 새 ParseResult 반환 (prev는 변경하지 않음).
 
-        알고리즘: 스택 기반 부모 추적
-        - indent_level이 증가하면 직전 티켓이 부모 (에픽)
-        - indent_level이 감소하면 스택에서 pop
-        - 부모 없는 indent>0 티켓은 STANDALONE 유지 (안전)
+        알고리즘:
+        1. 버퍼는 편집 범위만 교체, 편집 범위의 새 라인만 재렉싱
+        2. 편집 범위 밖 티켓 컬럼은 복사, 이후는 라인번호/오프셋만 일괄 이동
+        3. 부모 인덱스는 편집 지점부터 다음 루트(indent 0) 티켓 전까지만 재계산
+           (TicketTable.spliced 참고)
+
+        제목/섹션 헤더가 편집 범위에 걸리면 이후 전체 티켓의 소속이 바뀌므로
+        None을 반환한다 (호출자가 전체 재파싱).
         """
-        parent_stack: list[Ticket] = []
+        table = prev.table
+        start = edit.start
+        end = edit.start + edit.deleted  # 제거되는 기존 범위 [start, end)
+        delta = len(edit.new_lines) - edit.deleted
+
+        if project_id != prev.project_id or end > table.line_count + 1:
+            return None
+        if start <= prev.title_line_number < end:
+            return None
+        if any(line.startswith("#") for line in edit.new_lines):
+            return None
+        section_lines = [s.line_number for s in prev.sections]
+        sec_idx = bisect_left(section_lines, start)
+        if sec_idx < len(section_lines) and section_lines[sec_idx] < end:
+            return None
+
+        # 버퍼: [편집 앞 라인] + [새 라인] + [편집 뒤 라인]을 \n으로 연결
+        buffer = table.buffer
+        parts = []
+        if start > 1:
+            parts.append(
+                buffer[:table.line_offset(start) - 1]
+                if start <= table.line_count
+                else buffer
+            )
+        middle = "\n".join(edit.new_lines)
+        if edit.new_lines:
+            parts.append(middle)
+        tail_offset = 0
+        tail = ""
+        if end <= table.line_count:
+            tail_offset = table.line_offset(end)
+            tail = buffer[tail_offset:]
+            parts.append(tail)
+        new_buffer = "\n".join(parts)
+        middle_start = len(parts[0]) + 1 if start > 1 else 0
+
+        # 편집 범위의 새 라인만 렉싱 (섹션 헤더가 없으므로 소속은 고정)
+        edited = ParseResult(
+            project_id=project_id,
+            table=TicketTable(new_buffer, table.line_count + delta),
+            title_line_number=prev.title_line_number,
+        )
+        if edit.new_lines:
+            self._scan(
+                edited, middle_start, middle_start + len(middle), start, sec_idx - 1
+            )
+
+        lo = bisect_left(table.line_numbers, start)
+        hi = bisect_left(table.line_numbers, end)
+        new_table = table.spliced(
+            lo,
+            hi,
+            edited.table,
+            delta,
+            (len(new_buffer) - len(tail)) - tail_offset,
+            prev.sections,
+        )
+
+        # 섹션: 편집 범위 이후만 이동
+        sections = prev.sections
+        if delta:
+            sections = sections[:sec_idx] + [
+                Section(name=s.name, line_number=s.line_number + delta)
+                for s in sections[sec_idx:]
+            ]
+
+        title_line = prev.title_line_number
+        if title_line >= end:
+            title_line += delta
+
+        return ParseResult(
+            project_id=project_id,
+            project_title=prev.project_title,
+            sections=sections,
+            table=new_table,
+            title_line_number=title_line,
+        )
+
+
+@contextmanager
+def _map_file(file_path: str) -> Iterator[Union[mmap.mmap, bytes]]:
+    """파일을 읽기 전용 메모리 매핑 (빈 파일은 매핑 불가 → 빈 bytes)"""
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            yield buf
+
+
+def _iter_blocks(
+    buf: Union[mmap.mmap, bytes], block_size: int = _DECODE_BLOCK_SIZE
+) -> Iterator[str]:
+    """
+    버퍼를 \n 경계에 맞춘 블록 단위로 디코딩하여 순회.
+
+    UTF-8 멀티바이트 시퀀스에는 0x0A가 없으므로 안전하게 자를 수 있고,
+    블록이 항상 라인 끝에서 끝나므로 블록별 라인 경계(\r, \r\n, 유니코드
+    줄 구분자 포함)가 전체 텍스트 splitlines()와 같다.
+    메모리는 블록 크기(또는 가장 긴 라인)로 제한된다.
+    """
+    pos = 0
+    size = len(buf)
+    while pos < size:
+        end = min(pos + block_size, size)
+        if end < size:
+            newline = buf.rfind(b"\n", pos, end)
+            if newline < 0:
+                newline = buf.find(b"\n", end)
+            end = size if newline < 0 else newline + 1
+        yield buf[pos:end].decode("utf-8")
+        pos = end
+
+
+def _normalize(text: str) -> str:
+    """
+    라인 경계를 \n 하나로 통일한 렉싱 버퍼 — "\n".join(text.splitlines())와 동일.
 
-        for ticket in tickets:
-            # 스택에서 현재 레벨 이상의 부모 제거
-            while parent_stack and parent_stack[-1].indent_level >= ticket.indent_level:
-                parent_stack.pop()
+    \n 외의 경계 문자가 없으면(일반적인 경우) 끝 줄바꿈만 제거한다.
+    """
+    if any(ch in text for ch in _SPECIAL_BREAKS):
+        return "\n".join(text.splitlines())
+    return text[:-1] if text.endswith("\n") else text
 
-            if ticket.indent_level > 0 and parent_stack:
-                # 자식 티켓
-                parent = parent_stack[-1]
-                ticket.ticket_type = TicketType.CHILD
-                ticket.parent_id = parent.ticket_id
-                parent.children_ids.append(ticket.ticket_id)
-                parent.ticket_type = TicketType.EPIC
 
-            parent_stack.append(ticket)
+def _line_count(text: str, buffer: str) -> int:
+    """text.splitlines()의 라인 수 (buffer = _normalize(text))"""
+    return buffer.count("\n") + 1 if text else 0
@@ -1,78 +1,579 @@
 """todo.md 라이터 — 마커 교체, 라인 삭제, 티켓 삽입 (원본 포맷 100% 보존)"""
 
-import asyncio
+import contextlib
+import os
 import re
+import stat
+import tempfile
+import time
+from array import array
+from dataclasses import dataclass
+from functools import partial
+from itertools import accumulate
 from pathlib import Path
+from typing import Callable, Optional, Union
 
+from backend.core.config import settings
+from backend.core.request_context import request_id
+from backend.domain.board import VersionConflictError
 from backend.domain.ticket import STAGE_TO_MARKER, KanbanStage
+from backend.infrastructure.file_system.commit_queue import GroupCommitter
+from backend.infrastructure.file_system.parse_cache import (
+    DIGEST_CHUNK_SIZE,
+    FileFingerprint,
+    chunk_digests,
+    combine_digests,
+    content_digest,
+    file_fingerprint,
+    parse_cache,
+)
+from backend.infrastructure.file_system.todo_parser import LineEdit
+from backend.infrastructure.file_system.write_journal import write_journal
 
 # 섹션 헤더 정규식 (## 으로 시작)
 _SECTION_RE = re.compile(r"^##\s+")
 
-# 모듈 레벨 파일 쓰기 잠금 (동시 쓰기 방지)
-_file_lock = asyncio.Lock()
+# 체크박스 마커 정규식 (그룹 1: 마커 앞, 그룹 2: 마커 뒤)
+_CHECKBOX_RE = re.compile(r"^(\s*- \[)[xX ~QD](\]\s+)")
+# 제자리 패치용 바이트 버전 (ASCII 공백만 — 불일치 시 전체 재작성 경로로)
+_CHECKBOX_BYTES_RE = re.compile(rb"(\s*- \[)[xX ~QD](\]\s+)")
+
+# \n 외 str.splitlines() 라인 경계의 UTF-8 바이트 — 포함 파일은 오프셋 표 미사용
+_SPECIAL_BREAK_BYTES_RE = re.compile(
+    rb"[\r\x0b\x0c\x1c-\x1e]|\xc2\x85|\xe2\x80[\xa8\xa9]"
+)
+
+# 배치 쓰기 작업: (라인 목록, 라인 번호 변환) → 적용한 편집 (None이면 증분 불가)
+# 라인 목록을 직접 수정하며, 검증 실패 시 수정 없이 ValueError.
+# 라인 번호 변환: 배치 시작 시점 기준 번호 → 앞선 작업 적용 후 번호
+WriteOp = Callable[[list[str], Callable[[int], int]], Optional[list[LineEdit]]]
+
+
+@dataclass
+class WriteResult:
+    """
+    쓰기 결과 — 증분 재파싱(TodoParser.apply_write)에 필요한 편집 정보.
+
+    같은 배치의 모든 호출자가 같은 결과(배치 전체 편집)를 받는다.
+    """
+
+    # 적용 순서대로의 라인 편집 (None이면 증분 불가 → 전체 재파싱)
+    edits: Optional[list[LineEdit]]
+    # 쓰기 전/후 파일 내용 해시
+    before_digest: str
+    after_digest: str
+    after_fingerprint: Optional[FileFingerprint]
+    # 쓰기 직후 캐시 무효화 세대
+    generation: int
+
+    def line_after(self, line_number: int) -> int:
+        """쓰기 전 라인 번호 → 배치 적용 후 라인 번호 (증분 불가 시 그대로)"""
+        if self.edits is None:
+            return line_number
+        return _remap(self.edits, line_number)
+
+
+@dataclass
+class _LineTable:
+    """
+    파일의 라인 시작 바이트 오프셋 — 마커 한 바이트 제자리 패치용.
+
+    마지막 쓰기(전체 재작성 또는 패치) 직후의 파일 지문과 내용 해시를 함께
+    보관하며, 지문이 달라지면(외부 수정) 사용하지 않는다.
+    """
+
+    fingerprint: FileFingerprint
+    digest: str
+    # i번째 라인(0-based) 시작 오프셋, 마지막 원소는 파일 크기
+    starts: array
+    # DIGEST_CHUNK_SIZE 단위 청크 해시 (패치한 청크만 다시 해시해 digest 갱신)
+    chunks: list[bytes]
+
+
+# 실제 경로 → 라인 오프셋 표 (파일 잠금 안에서만 읽고 갱신)
+_line_tables: dict[str, _LineTable] = {}
+
+
+def _record_lines(
+    file_path: str,
+    data: bytes,
+    fingerprint: Optional[FileFingerprint],
+    chunks: list[bytes],
+) -> None:
+    """전체 재작성 직후 오프셋 표 갱신 (\n 외 줄바꿈이 있으면 제거)"""
+    key = os.path.realpath(file_path)
+    if fingerprint is None or _SPECIAL_BREAK_BYTES_RE.search(data):
+        _line_tables.pop(key, None)
+        return
+    starts = array("q", accumulate(map(len, data.splitlines(keepends=True)), initial=0))
+    _line_tables[key] = _LineTable(fingerprint, combine_digests(chunks), starts, chunks)
+
+
+def _read_lines(path: Path) -> tuple[str, list[str]]:
+    """파일을 읽어 (내용 해시, 줄바꿈 포함 라인 목록) 반환 — 줄바꿈은 \\n으로 정규화"""
+    data = path.read_bytes()
+    text = data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+    return content_digest(data), text.splitlines(keepends=True)
+
+
+def _is_unterminated(lines: list[str]) -> bool:
+    """마지막 라인이 줄바꿈 없이 끝나는지 (끝에 삽입 시 라인 병합 발생)"""
+    return bool(lines) and lines[-1].splitlines()[0] == lines[-1]
+
+
+def _remap(edits: list[LineEdit], line_number: int) -> int:
+    """배치 시작 기준 라인 번호를 앞선 편집들이 적용된 라인 번호로 변환"""
+    for edit in edits:
+        if line_number < edit.start:
+            continue
+        if line_number >= edit.start + edit.deleted:
+            line_number += len(edit.new_lines) - edit.deleted
+        elif len(edit.new_lines) != edit.deleted:
+            raise ValueError(
+                f"라인 번호 {line_number}이 같은 배치의 이전 쓰기로 삭제됨"
+            )
+    return line_number
+
+
+def _atomic_write(file_path: str, data: bytes) -> None:
+    """
+    임시 파일 + fsync + os.replace로 파일 교체.
+
+    중간에 프로세스가 죽어도 원본 또는 새 내용 중 하나만 남는다.
+    심볼릭 링크는 실제 파일을 교체하고, 원본 권한을 유지한다.
+    """
+    real_path = os.path.realpath(file_path)
+    directory, name = os.path.split(real_path)
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{name}.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        with contextlib.suppress(FileNotFoundError):
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(real_path).st_mode))
+        os.replace(tmp_path, real_path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+        raise
+
+    # rename 자체의 영속화 (POSIX)
+    if os.name == "posix":
+        dir_fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def _commit(
+    file_path: str,
+    lines: list[str],
+    before_digest: str,
+    edits: Optional[list[LineEdit]],
+) -> WriteResult:
+    """라인 목록을 파일에 기록하고 캐시 무효화 후 WriteResult 반환"""
+    text = "".join(lines)
+    if os.linesep != "\n":
+        text = text.replace("\n", os.linesep)
+    data = text.encode("utf-8")
+    _atomic_write(file_path, data)
+    parse_cache.invalidate(file_path)
+    chunks = chunk_digests(data)
+    result = WriteResult(
+        edits=edits,
+        before_digest=before_digest,
+        after_digest=combine_digests(chunks),
+        after_fingerprint=file_fingerprint(file_path),
+        generation=parse_cache.generation(file_path),
+    )
+    _record_lines(file_path, data, result.after_fingerprint, chunks)
+    return result
+
+
+def _patch_markers(
+    file_path: str, patches: list["_StageOp"], versions: set[str]
+) -> Optional[WriteResult]:
+    """
+    마커 교체만으로 이루어진 배치를 파일 재작성 없이 제자리 패치.
+
+    오프셋 표의 지문이 현재 파일과 같고 기대 버전(versions)이 모두 표의
+    내용 해시와 같으며 모든 대상 라인이 체크박스일 때만 해당 마커 바이트를
+    pwrite로 덮어쓰고, 바뀐 청크만 다시 해시한다 (파일 크기와 무관한 비용).
+    조건이 하나라도 어긋나면 아무것도 쓰지 않고 None (전체 재작성 경로로 폴백).
+    """
+    if parse_cache.verify_hash:
+        return None
+    real_path = os.path.realpath(file_path)
+    table = _line_tables.get(real_path)
+    if table is None or versions - {table.digest}:
+        return None
+
+    fd = os.open(real_path, os.O_RDWR)
+    try:
+        st = os.fstat(fd)
+        if FileFingerprint(st.st_mtime_ns, st.st_size) != table.fingerprint:
+            return None
+
+        # 라인별 (마커 오프셋, 원래 라인 바이트, 최종 마커) — 모두 검증 후 기록
+        targets: dict[int, tuple[int, bytes, bytes]] = {}
+        line_count = len(table.starts) - 1
+        for patch in patches:
+            if patch.line_number in targets:
+                offset, raw, _ = targets[patch.line_number]
+                targets[patch.line_number] = (offset, raw, patch.marker)
+                continue
+            if not (1 <= patch.line_number <= line_count):
+                return None
+            start = table.starts[patch.line_number - 1]
+            raw = os.pread(fd, table.starts[patch.line_number] - start, start)
+            if b"\n" in raw[:-1]:
+                return None
+            match = _CHECKBOX_BYTES_RE.match(raw)
+            if match is None:
+                # 체크박스가 아닌 라인은 전체 재작성 경로에서도 변경 없음
+                if _CHECKBOX_RE.match(raw.decode("utf-8")):
+                    return None
+                continue
+            targets[patch.line_number] = (start + match.end(1), raw, patch.marker)
+
+        edits: list[LineEdit] = []
+        dirty_chunks: set[int] = set()
+        for line_number, (offset, raw, marker) in targets.items():
+            index = offset - table.starts[line_number - 1]
+            if raw[index:index + 1] == marker:
+                continue
+            os.pwrite(fd, marker, offset)
+            new_raw = raw[:index] + marker + raw[index + 1:]
+            edits.append(
+                LineEdit(line_number, 1, tuple(new_raw.decode("utf-8").splitlines()))
+            )
+            dirty_chunks.add(offset // DIGEST_CHUNK_SIZE)
+
+        if not edits:
+            return _unchanged(file_path, table.digest)
+
+        for chunk in dirty_chunks:
+            data = os.pread(fd, DIGEST_CHUNK_SIZE, chunk * DIGEST_CHUNK_SIZE)
+            table.chunks[chunk] = chunk_digests(data)[0]
+
+        # 같은 시각 해상도 안의 쓰기도 지문이 바뀌도록 mtime을 앞당김
+        os.utime(
+            fd, ns=(st.st_atime_ns, max(time.time_ns(), st.st_mtime_ns + 1))
+        )
+        os.fsync(fd)
+        st = os.fstat(fd)
+    finally:
+        os.close(fd)
+
+    before_digest = table.digest
+    table.digest = combine_digests(table.chunks)
+    table.fingerprint = FileFingerprint(st.st_mtime_ns, st.st_size)
+    parse_cache.invalidate(file_path)
+    return WriteResult(
+        edits=edits,
+        before_digest=before_digest,
+        after_digest=table.digest,
+        after_fingerprint=table.fingerprint,
+        generation=parse_cache.generation(file_path),
+    )
+
+
+def _unchanged(file_path: str, digest: str) -> WriteResult:
+    """변경 없는 쓰기 요청의 WriteResult"""
+    return WriteResult(
+        edits=[],
+        before_digest=digest,
+        after_digest=digest,
+        after_fingerprint=file_fingerprint(file_path),
+        generation=parse_cache.generation(file_path),
+    )
+
+
+def _flush_batch(
+    file_path: str, ops: list[WriteOp]
+) -> list[Union[WriteResult, BaseException]]:
+    """
+    배치 하나를 파일 메모리 사본에 순서대로 적용 후 한 번만 기록.
+
+    작업별 ValueError는 해당 호출자에게만 전달되고 나머지 작업은 계속 적용된다.
+    기대 버전이 배치 시작 시점 내용 해시와 다른 작업은 적용하지 않고
+    VersionConflictError를 돌려준다. 마커 교체만 있는 배치는 먼저 제자리 패치를 시도한다.
+    """
+    versions = {op.version for op in ops if isinstance(op, _Expect)}
+    patches = _stage_patches(ops)
+    if patches is not None:
+        patched = _patch_markers(file_path, patches, versions)
+        if patched is not None:
+            return [patched] * len(ops)
+
+    before_digest, lines = _read_lines(Path(file_path))
+    applied: list[LineEdit] = []
+    remap = partial(_remap, applied)
+    incremental = True
+    changed = False
+    errors: list[Optional[Exception]] = []
+
+    for op in ops:
+        if isinstance(op, _Expect) and op.version != before_digest:
+            errors.append(VersionConflictError(op.version, before_digest))
+            continue
+        try:
+            edits = op(lines, remap)
+        except ValueError as e:
+            errors.append(e)
+            continue
+        errors.append(None)
+        if edits is None:
+            incremental = False
+            changed = True
+        elif edits:
+            applied.extend(edits)
+            changed = True
+
+    if changed:
+        result = _commit(
+            file_path, lines, before_digest, applied if incremental else None
+        )
+    else:
+        result = _unchanged(file_path, before_digest)
+    return [result if error is None else error for error in errors]
+
+
+class _StageOp:
+    """마커 교체 작업 (WriteOp) — 제자리 패치 경로가 대상 라인/마커를 알 수 있도록 클래스로 둠"""
+
+    __slots__ = ("line_number", "marker")
+
+    def __init__(self, line_number: int, new_stage: KanbanStage) -> None:
+        self.line_number = line_number
+        self.marker = STAGE_TO_MARKER[new_stage].encode("ascii")
+
+    def __call__(
+        self, lines: list[str], remap: Callable[[int], int]
+    ) -> list[LineEdit]:
+        target_idx = remap(self.line_number) - 1  # 0-based
+        if not (0 <= target_idx < len(lines)):
+            raise ValueError(
+                f"라인 번호 {self.line_number}이 파일 범위를 벗어남 "
+                f"(총 {len(lines)}줄)"
+            )
 
+        old_line = lines[target_idx]
+        new_line = _CHECKBOX_RE.sub(
+            rf"\g<1>{self.marker.decode('ascii')}\g<2>",
+            old_line,
+            count=1,
+        )
+
+        if new_line == old_line:
+            return []  # 변경 없음
+
+        lines[target_idx] = new_line
+        return [LineEdit(target_idx + 1, 1, tuple(new_line.splitlines()))]
+
+
+class _CombinedOp:
+    """
+    작업 목록을 하나의 원자적 작업으로 합성 (WriteOp).
+
+    모든 작업의 라인 번호는 합성 작업 시작 시점 기준이며, 앞선 작업으로 밀린
+    만큼 자동 보정된다. 하나라도 실패하면 라인 목록을 건드리지 않는다.
+    """
+
+    __slots__ = ("ops",)
+
+    def __init__(self, ops: list[WriteOp]) -> None:
+        self.ops = ops
+
+    def __call__(
+        self, lines: list[str], remap: Callable[[int], int]
+    ) -> Optional[list[LineEdit]]:
+        work = lines[:]
+        applied: list[LineEdit] = []
+        incremental = True
+        for op in self.ops:
+            edits = op(work, lambda n: _remap(applied, remap(n)))
+            if edits is None:
+                incremental = False
+            else:
+                applied.extend(edits)
+        lines[:] = work
+        return applied if incremental else None
+
+
+class _Expect:
+    """
+    기대 버전이 붙은 작업 (WriteOp).
+
+    배치 시작 시점 파일 내용 해시가 version과 같을 때만 적용된다
+    (검사는 _flush_batch가 배치당 한 번 — 제자리 패치 경로는 오프셋 표의 해시로).
+    """
+
+    __slots__ = ("op", "version")
+
+    def __init__(self, op: WriteOp, version: str) -> None:
+        self.op = op
+        self.version = version
+
+    def __call__(
+        self, lines: list[str], remap: Callable[[int], int]
+    ) -> Optional[list[LineEdit]]:
+        return self.op(lines, remap)
+
+
+def _stage_patches(ops: list[WriteOp]) -> Optional[list[_StageOp]]:
+    """배치가 마커 교체만으로 이루어졌으면 펼친 목록, 아니면 None"""
+    patches: list[_StageOp] = []
+    for op in ops:
+        if isinstance(op, _Expect):
+            op = op.op
+        if isinstance(op, _StageOp):
+            patches.append(op)
+        elif isinstance(op, _CombinedOp):
+            nested = _stage_patches(op.ops)
+            if nested is None:
+                return None
+            patches.extend(nested)
+        else:
+            return None
+    return patches
+
+
+# 프로세스 전역 그룹 커밋 큐 (모든 TodoWriter 인스턴스가 공유)
+write_queue: GroupCommitter[WriteOp, WriteResult] = GroupCommitter(
+    _flush_batch,
+    window=settings.WRITE_BATCH_WINDOW_MS / 1000,
+    max_ops=settings.WRITE_BATCH_MAX_OPS,
+)
 
-class TodoWriter:
-    """todo.md에 변경사항 기록 (원본 포맷 완벽 보존)"""
 
-    CHECKBOX_RE = re.compile(r"^(\s*- \[)[xX ~QD](\]\s+)")
+class TodoWriter:
+    """
+    todo.md에 변경사항 기록 (원본 포맷 완벽 보존).
+
+    모든 쓰기는 파일별 그룹 커밋 큐(write_queue)를 거친다. 같은 파일에 짧은
+    시간 창 안에 들어온 쓰기는 한 번의 읽기/원자적 교체로 묶이며, 각 메서드는
+    배치가 디스크에 기록된 뒤 반환한다. 라인 번호 인자는 호출 시점 파일 기준이며
+    같은 배치의 앞선 작업으로 밀린 만큼 자동 보정된다.
+
+    여러 변경을 한 번에 적용하려면 *_op 메서드로 작업을 만들어 apply_ops에 넘긴다.
+    expected_version(내용 해시)을 주면 파일이 그 버전이 아닐 때 쓰지 않고
+    VersionConflictError를 낸다 (재파싱 없이 배치 시작 시점 해시와 비교).
+    """
+
+    CHECKBOX_RE = _CHECKBOX_RE
+
+    @staticmethod
+    async def _submit(
+        file_path: str, op: WriteOp, expected_version: Optional[str]
+    ) -> WriteResult:
+        if expected_version is not None:
+            op = _Expect(op, expected_version)
+        result = await write_queue.submit(file_path, op)
+        if result.after_digest != result.before_digest:
+            # 파일 감시자가 이 쓰기의 변경 이벤트를 외부 편집과 구분하도록 기록
+            write_journal.record(
+                file_path,
+                result.after_fingerprint,
+                result.before_digest,
+                result.after_digest,
+                request_id.get(),
+            )
+        return result
 
     async def update_ticket_stage(
         self,
         file_path: str,
         line_number: int,
         new_stage: KanbanStage,
-    ) -> None:
+        expected_version: Optional[str] = None,
+    ) -> WriteResult:
+        """특정 라인의 마커만 교체, 나머지 모든 내용 그대로 보존."""
+        return await self._submit(
+            file_path, self.stage_op(line_number, new_stage), expected_version
+        )
+
+    async def delete_lines(
+        self,
+        file_path: str,
+        line_numbers: list[int],
+        expected_version: Optional[str] = None,
+    ) -> WriteResult:
         """
-        특정 라인의 마커만 교체, 나머지 모든 내용 그대로 보존.
+        지정된 라인들을 todo.md에서 삭제.
 
-        동시 쓰기 방지를 위해 asyncio.Lock 사용.
+        line_numbers는 1-based. 복수 라인을 한 번의 파일 쓰기로 처리.
         """
-        async with _file_lock:
-            path = Path(file_path)
-            text = path.read_text(encoding="utf-8")
-            lines = text.splitlines(keepends=True)
+        return await self._submit(
+            file_path, self.delete_op(line_numbers), expected_version
+        )
 
-            target_idx = line_number - 1  # 0-based
-            if not (0 <= target_idx < len(lines)):
-                raise ValueError(
-                    f"라인 번호 {line_number}이 파일 범위를 벗어남 "
-                    f"(총 {len(lines)}줄)"
-                )
+    async def insert_ticket(
+        self,
+        file_path: str,
+        section_line_number: int,
+        title: str,
+        expected_version: Optional[str] = None,
+    ) -> WriteResult:
+        """
+        지정 섹션의 마지막 체크박스 뒤에 새 티켓 삽입.
 
-            old_line = lines[target_idx]
-            new_marker = STAGE_TO_MARKER[new_stage]
-            new_line = self.CHECKBOX_RE.sub(
-                rf"\g<1>{new_marker}\g<2>",
-                old_line,
-                count=1,
-            )
+        section_line_number: ## 헤더의 1-based 라인 번호.
+        title: 순수 텍스트 (마커 없이).
+        삽입 형식: `- [ ] {title}\\n`
+        """
+        return await self._submit(
+            file_path, self.insert_op(section_line_number, title), expected_version
+        )
 
-            if new_line == old_line:
-                return  # 변경 없음
+    async def insert_child_ticket(
+        self,
+        file_path: str,
+        parent_line_number: int,
+        title: str,
+        expected_version: Optional[str] = None,
+    ) -> WriteResult:
+        """
+        부모 티켓의 마지막 자식 뒤에 들여쓰기된 자식 티켓 삽입.
 
-            lines[target_idx] = new_line
-            path.write_text("".join(lines), encoding="utf-8")
+        parent_line_number: 부모 체크박스의 1-based 라인 번호.
+        title: 순수 텍스트 (마커 없이).
+        부모 indent + 2spaces 로 삽입하여 파서가 자식으로 인식.
+        """
+        return await self._submit(
+            file_path,
+            self.insert_child_op(parent_line_number, title),
+            expected_version,
+        )
 
-    async def delete_lines(
+    async def apply_ops(
         self,
         file_path: str,
-        line_numbers: list[int],
-    ) -> None:
+        ops: list[WriteOp],
+        expected_version: Optional[str] = None,
+    ) -> WriteResult:
         """
-        지정된 라인들을 todo.md에서 삭제.
+        여러 작업을 한 번의 파일 쓰기로 원자 적용 (하나라도 실패하면 전체 미적용).
 
-        line_numbers는 1-based. 복수 라인을 한 번의 파일 쓰기로 처리.
-        동시 쓰기 방지를 위해 asyncio.Lock 사용.
+        모든 라인 번호는 호출 시점 파일 기준 — 목록의 앞선 작업으로 인한
+        라인 이동은 자동 보정된다.
         """
-        async with _file_lock:
-            path = Path(file_path)
-            text = path.read_text(encoding="utf-8")
-            lines = text.splitlines(keepends=True)
+        return await self._submit(file_path, _CombinedOp(ops), expected_version)
+
+    # ── 작업 생성 (라인 목록을 직접 수정하는 WriteOp) ──
 
+    def stage_op(self, line_number: int, new_stage: KanbanStage) -> WriteOp:
+        """마커 교체 작업 (마커 교체만 모인 배치는 제자리 바이트 패치)"""
+        return _StageOp(line_number, new_stage)
+
+    def delete_op(self, line_numbers: list[int]) -> WriteOp:
+        """라인 삭제 작업"""
+
+        def op(lines: list[str], remap: Callable[[int], int]) -> list[LineEdit]:
             # 삭제 대상 라인 인덱스 (0-based)
-            delete_indices = set(ln - 1 for ln in line_numbers)
+            delete_indices = set(remap(ln) - 1 for ln in line_numbers)
 
             # 범위 검증
             for idx in delete_indices:
@@ -82,31 +583,30 @@ class TodoWriter:
                         f"(총 {len(lines)}줄)"
                     )
 
-            new_lines = [
+            lines[:] = [
                 line for i, line in enumerate(lines)
                 if i not in delete_indices
             ]
-            path.write_text("".join(new_lines), encoding="utf-8")
 
-    async def insert_ticket(
-        self,
-        file_path: str,
-        section_line_number: int,
-        title: str,
-    ) -> None:
-        """
-        지정 섹션의 마지막 체크박스 뒤에 새 티켓 삽입.
+            # 연속 구간 단위 편집 (뒤에서부터 적용해야 앞 구간 라인번호 불변)
+            edits: list[LineEdit] = []
+            for idx in sorted(delete_indices, reverse=True):
+                if edits and edits[-1].start == idx + 2:
+                    edits[-1] = LineEdit(idx + 1, edits[-1].deleted + 1)
+                else:
+                    edits.append(LineEdit(idx + 1, 1))
+            return edits
 
-        section_line_number: ## 헤더의 1-based 라인 번호.
-        title: 순수 텍스트 (마커 없이).
-        삽입 형식: `- [ ] {title}\n`
-        """
-        async with _file_lock:
-            path = Path(file_path)
-            text = path.read_text(encoding="utf-8")
-            lines = text.splitlines(keepends=True)
+        return op
 
-            section_idx = section_line_number - 1  # 0-based
+    def insert_op(self, section_line_number: int, title: str) -> WriteOp:
+        """섹션 끝 티켓 삽입 작업"""
+        new_line = f"- [ ] {title}\n"
+
+        def op(
+            lines: list[str], remap: Callable[[int], int]
+        ) -> Optional[list[LineEdit]]:
+            section_idx = remap(section_line_number) - 1  # 0-based
 
             if not (0 <= section_idx < len(lines)):
                 raise ValueError(
@@ -134,29 +634,19 @@ class TodoWriter:
                 else (section_idx + 1)
             )
 
-            new_line = f"- [ ] {title}\n"
+            edits = self._insert_edits(lines, insert_idx, new_line)
             lines.insert(insert_idx, new_line)
-            path.write_text("".join(lines), encoding="utf-8")
+            return edits
 
-    async def insert_child_ticket(
-        self,
-        file_path: str,
-        parent_line_number: int,
-        title: str,
-    ) -> None:
-        """
-        부모 티켓의 마지막 자식 뒤에 들여쓰기된 자식 티켓 삽입.
+        return op
 
-        parent_line_number: 부모 체크박스의 1-based 라인 번호.
-        title: 순수 텍스트 (마커 없이).
-        부모 indent + 2spaces 로 삽입하여 파서가 자식으로 인식.
-        """
-        async with _file_lock:
-            path = Path(file_path)
-            text = path.read_text(encoding="utf-8")
-            lines = text.splitlines(keepends=True)
+    def insert_child_op(self, parent_line_number: int, title: str) -> WriteOp:
+        """부모 티켓 하위 삽입 작업"""
 
-            parent_idx = parent_line_number - 1  # 0-based
+        def op(
+            lines: list[str], remap: Callable[[int], int]
+        ) -> Optional[list[LineEdit]]:
+            parent_idx = remap(parent_line_number) - 1  # 0-based
 
             if not (0 <= parent_idx < len(lines)):
                 raise ValueError(
@@ -184,5 +674,17 @@ class TodoWriter:
                     break
 
             new_line = f"{' ' * child_indent}- [ ] {title}\n"
+            edits = self._insert_edits(lines, insert_idx, new_line)
             lines.insert(insert_idx, new_line)
-            path.write_text("".join(lines), encoding="utf-8")
+            return edits
+
+        return op
+
+    @staticmethod
+    def _insert_edits(
+        lines: list[str], insert_idx: int, new_line: str
+    ) -> Optional[list[LineEdit]]:
+        """삽입 편집 생성 (줄바꿈 없는 마지막 라인 뒤 삽입은 병합되므로 None)"""
+        if insert_idx == len(lines) and _is_unterminated(lines):
+            return None
+        return [LineEdit(insert_idx + 1, 0, tuple(new_line.splitlines()))]
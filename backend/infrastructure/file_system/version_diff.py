@@ -0,0 +1,297 @@
+"""버전 diff — 두 파싱 결과 사이의 변경 구간/변경 티켓 계산 (버전 충돌, delta 응답용)"""
+
+from bisect import bisect_left, bisect_right
+from typing import Optional
+
+from backend.domain.board import BoardDiff
+from backend.domain.board_delta import BoardDelta, LineShift
+from backend.domain.section import Section
+from backend.infrastructure.file_system.ticket_table import FALLBACK_SECTION
+from backend.infrastructure.file_system.todo_parser import ParseResult, TodoParser
+
+
+def board_diff(base: ParseResult, current: ParseResult) -> BoardDiff:
+    """
+    base → current 변경 구간 계산.
+
+    알고리즘:
+    1. 두 버퍼의 공통 앞/뒤 라인을 제외한 구간이 원본 변경 구간
+    2. 구간 직전 티켓의 루트 조상부터 시작 (에픽의 children_ids 변화 포함)
+    3. 구간에 섹션 헤더가 있으면 다음 섹션 헤더 전까지 확장 (섹션 소속 변화)
+    4. 구간 뒤 첫 티켓이 루트(indent 0)가 될 때까지 확장 (parent_id 변화 포함)
+
+    공통 앞부분은 두 버전에서 파싱 결과(계층 포함)가 같고, 공통 뒷부분은
+    라인 번호만 이동하므로 구간 밖 티켓은 클라이언트가 그대로 재사용할 수 있다
+    (중복 순번이 바뀐 뒤쪽 티켓만 예외로 포함).
+    """
+    base_lines = base.table.buffer.split("\n")
+    lines = current.table.buffer.split("\n")
+
+    common = min(len(base_lines), len(lines))
+    prefix = 0
+    while prefix < common and base_lines[prefix] == lines[prefix]:
+        prefix += 1
+    suffix = 0
+    while (
+        suffix < common - prefix
+        and base_lines[-1 - suffix] == lines[-1 - suffix]
+    ):
+        suffix += 1
+
+    # 1-based 라인 구간 (끝 < 시작이면 빈 구간)
+    start = prefix + 1
+    end = len(lines) - suffix
+    delta = len(lines) - len(base_lines)
+
+    table = current.table
+    line_numbers = table.line_numbers
+
+    # 구간 직전 티켓의 루트 조상 (공통 앞부분이므로 두 버전에서 같음)
+    index = bisect_left(line_numbers, start) - 1
+    if index >= 0:
+        while table.parent_indexes[index] >= 0:
+            index = table.parent_indexes[index]
+        start = line_numbers[index]
+
+    # 섹션 헤더가 바뀌었으면 다음 섹션 헤더 전까지
+    section_re = TodoParser.SECTION_RE
+
+    def next_section(after: int) -> int:
+        """after 라인 뒤 첫 섹션 헤더 직전 라인 (없으면 마지막 라인)"""
+        return next(
+            (i for i in range(after, len(lines)) if section_re.match(lines[i])),
+            len(lines),
+        )
+
+    if any(
+        section_re.match(line)
+        for line in (*base_lines[prefix:end - delta], *lines[prefix:end])
+    ):
+        end = next_section(end)
+
+    # 구간 뒤 첫 티켓이 루트(indent 0)가 될 때까지 확장 — 루트 티켓은 부모 스택을
+    # 비우므로 그 뒤 티켓의 계층은 구간과 무관하다. 확장하며 섹션 헤더를 넘으면
+    # 뒤 티켓의 섹션 라인 번호가 구간 안에 남지 않도록 다음 헤더 직전까지 간다.
+    while True:
+        index = bisect_right(line_numbers, end)
+        if index >= len(line_numbers) or table.indent_levels[index] == 0:
+            break
+        root = next(
+            (
+                line_numbers[i] - 1
+                for i in range(index, len(line_numbers))
+                if table.indent_levels[i] == 0
+            ),
+            len(lines),
+        )
+        if any(section_re.match(line) for line in lines[end:root]):
+            end = next_section(root)
+        else:
+            end = root
+    end_base = end - delta
+
+    project_id = current.project_id
+    base_table = base.table
+    base_ids = base_table.local_ids(base.sections)
+    ids = table.local_ids(current.sections)
+    base_lo = bisect_left(base_table.line_numbers, start)
+    base_hi = bisect_right(base_table.line_numbers, end_base)
+    lo = bisect_left(line_numbers, start)
+    hi = bisect_right(line_numbers, end)
+
+    # 구간 뒤 티켓은 두 버전에서 1:1 대응 — 구간에서 같은 키 티켓이 생기거나
+    # 사라져 중복 순번(ID)이 바뀐 티켓과, 그 ID를 참조하는 부모/자식도 포함
+    renamed: set[int] = set()
+    if base_ids[base_hi:] != ids[hi:]:
+        for offset, (old_id, new_id) in enumerate(zip(base_ids[base_hi:], ids[hi:])):
+            if old_id == new_id:
+                continue
+            index = hi + offset
+            renamed.add(index)
+            parent = table.parent_indexes[index]
+            if parent >= 0:
+                renamed.add(parent)
+            renamed.update(table.children(index))
+    extra = sorted(renamed)
+
+    return BoardDiff(
+        base_version=base.digest,
+        version=current.digest,
+        start_line=start,
+        end_line_base=end_base,
+        end_line=end,
+        removed_ticket_ids=[
+            f"{project_id}:{local_id}"
+            for local_id in (
+                *base_ids[base_lo:base_hi],
+                *(base_ids[base_hi + index - hi] for index in extra),
+            )
+        ],
+        tickets=[
+            table.ticket(index, project_id, current.sections)
+            for index in (*range(lo, hi), *extra)
+        ],
+        sections=current.sections,
+        changed_ticket_ids=[
+            f"{project_id}:{local_id}"
+            for local_id in _changed_ids(
+                base_ids[base_lo:base_hi],
+                base_table.line_numbers[base_lo:base_hi],
+                base_lines,
+                ids[lo:hi],
+                line_numbers[lo:hi],
+                lines,
+            )
+        ]
+        + [f"{project_id}:{base_ids[base_hi + index - hi]}" for index in extra],
+    )
+
+
+def _changed_ids(
+    base_ids: list[str],
+    base_line_numbers,
+    base_lines: list[str],
+    ids: list[str],
+    line_numbers,
+    lines: list[str],
+) -> list[str]:
+    """
+    변경 구간의 기준 버전 티켓 중 자기 자신이 바뀐 티켓의 로컬 ID.
+
+    현재 구간에 같은 ID가 같은 원본 라인으로 남아 있고 같은 키(중복 순번 앞부분)의
+    ID 순서도 그대로면 — 같은 루트 블록/섹션의 다른 티켓만 바뀐 것이므로 제외한다.
+    """
+    current = {
+        local_id: lines[line_number - 1]
+        for local_id, line_number in zip(ids, line_numbers)
+    }
+
+    def by_key(local_ids: list[str]) -> dict[str, list[str]]:
+        groups: dict[str, list[str]] = {}
+        for local_id in local_ids:
+            groups.setdefault(local_id.split("-")[0], []).append(local_id)
+        return groups
+
+    base_groups = by_key(base_ids)
+    groups = by_key(ids)
+    return [
+        local_id
+        for local_id, line_number in zip(base_ids, base_line_numbers)
+        if current.get(local_id) != base_lines[line_number - 1]
+        or base_groups[local_id.split("-")[0]] != groups.get(local_id.split("-")[0])
+    ]
+
+
+def board_delta(base: ParseResult, current: ParseResult) -> BoardDelta:
+    """
+    base → current 티켓 단위 변경분 (ID 대응, Ticket은 추가/변경분만 생성).
+
+    알고리즘:
+    1. 현재 티켓마다 같은 ID의 기준 티켓을 역색인으로 찾음 (없으면 추가)
+    2. 원본 라인(마커/들여쓰기/제목)이나 부모 ID가 다르면 변경, 추가/삭제/부모 변경
+       티켓의 (이전/현재) 부모도 자식 목록이 바뀌므로 변경
+    3. 대응 티켓과 (이름, 순번)이 같은 섹션 헤더의 라인 쌍을 이동량이 같은
+       연속 구간으로 묶어 line_shifts 생성 (섹션 라인이 구간으로 설명되지 않는 티켓은 변경)
+    """
+    project_id = current.project_id
+    base_table = base.table
+    table = current.table
+    base_ids = base_table.local_ids(base.sections)
+    ids = table.local_ids(current.sections)
+    base_buffer = base_table.buffer
+    buffer = table.buffer
+
+    def raw_line(t, text: str, index: int) -> str:
+        return text[t.line_starts[index]:t.title_ends[index]]
+
+    def parent_id(t, local_ids: list[str], index: int) -> Optional[str]:
+        parent = t.parent_indexes[index]
+        return local_ids[parent] if parent >= 0 else None
+
+    # 섹션 헤더 대응: (이름, 같은 이름 순번) → 라인
+    def section_keys(sections: list[Section]) -> dict[tuple[str, int], int]:
+        seen: dict[str, int] = {}
+        keys = {}
+        for section in sections:
+            count = seen.get(section.name, 0)
+            seen[section.name] = count + 1
+            keys[(section.name, count)] = section.line_number
+        return keys
+
+    base_section_keys = section_keys(base.sections)
+    section_map = {FALLBACK_SECTION.line_number: FALLBACK_SECTION.line_number}
+    for key, line_number in section_keys(current.sections).items():
+        if key in base_section_keys:
+            section_map[base_section_keys[key]] = line_number
+    points = [(old, new) for old, new in section_map.items() if old > 0]
+
+    def section_line(t, sections: list[Section], index: int) -> int:
+        section_index = t.section_indexes[index]
+        return sections[section_index].line_number if section_index >= 0 else 0
+
+    added: list[int] = []
+    changed: set[int] = set()
+    touched: set[str] = set()  # 자식 목록이 바뀐 부모 로컬 ID
+    for index, local_id in enumerate(ids):
+        base_index = base_table.index_of_id(local_id, base.sections)
+        if base_index is None:
+            added.append(index)
+            parent = parent_id(table, ids, index)
+            if parent is not None:
+                touched.add(parent)
+            continue
+        points.append((base_table.line_numbers[base_index], table.line_numbers[index]))
+        old_parent = parent_id(base_table, base_ids, base_index)
+        new_parent = parent_id(table, ids, index)
+        if old_parent != new_parent:
+            changed.add(index)
+            touched.update(p for p in (old_parent, new_parent) if p is not None)
+        elif raw_line(base_table, base_buffer, base_index) != raw_line(
+            table, buffer, index
+        ) or section_map.get(
+            section_line(base_table, base.sections, base_index)
+        ) != section_line(table, current.sections, index):
+            changed.add(index)
+
+    removed = []
+    for base_index, local_id in enumerate(base_ids):
+        if table.index_of_id(local_id, current.sections) is None:
+            removed.append(f"{project_id}:{local_id}")
+            parent = parent_id(base_table, base_ids, base_index)
+            if parent is not None:
+                touched.add(parent)
+    added_set = set(added)
+    for local_id in touched:
+        index = table.index_of_id(local_id, current.sections)
+        if index is not None and index not in added_set:
+            changed.add(index)
+
+    # 이동량이 같은 연속 라인 쌍 → 구간 (이동 없는 구간은 생략)
+    shifts: list[LineShift] = []
+    run_start = run_end = run_delta = None
+    for old, new in sorted(points):
+        delta = new - old
+        if run_delta is not None and delta == run_delta:
+            run_end = old
+            continue
+        if run_delta:
+            shifts.append(LineShift(start_line=run_start, end_line=run_end, delta=run_delta))
+        run_start = run_end = old
+        run_delta = delta
+    if run_delta:
+        shifts.append(LineShift(start_line=run_start, end_line=run_end, delta=run_delta))
+
+    return BoardDelta(
+        project_id=project_id,
+        base_version=base.digest,
+        version=current.digest,
+        total=len(table),
+        added=[table.ticket(index, project_id, current.sections) for index in added],
+        changed=[
+            table.ticket(index, project_id, current.sections)
+            for index in sorted(changed)
+        ],
+        removed_ticket_ids=removed,
+        line_shifts=shifts,
+        sections=current.sections,
+    )
@@ -0,0 +1,110 @@
+"""자기 쓰기 기록 — 파일 감시 이벤트가 이 프로세스의 쓰기인지 외부 편집인지 구분"""
+
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Optional
+
+from backend.infrastructure.file_system.parse_cache import (
+    FileFingerprint,
+    file_fingerprint,
+)
+
+# 아직 감시자가 가져가지 않은 파일당 보관할 최근 요청 ID 수
+MAX_REQUEST_IDS = 32
+
+
+@dataclass
+class OwnWrite:
+    """파일의 마지막 자기 쓰기 (감시자가 가져갈 때까지 누적)"""
+
+    fingerprint: FileFingerprint
+    # 쓰기 후 내용 해시 (보드 버전)
+    version: str
+    # 가져가기 전까지 쓴 요청 ID (요청 밖의 쓰기는 없음)
+    request_ids: list[str] = field(default_factory=list)
+    # 누적 중 외부 편집이 끼어들었음 (앞 쓰기 후 버전 ≠ 다음 쓰기 전 버전)
+    interleaved: bool = False
+
+
+class WriteJournal:
+    """
+    todo.md별 마지막 자기 쓰기의 파일 지문/버전/요청 ID.
+
+    TodoWriter가 쓰기를 마칠 때마다 기록하고, 감시자는 디바운스 후 현재 파일
+    지문이 기록과 같으면(그 뒤 외부 편집이 없으면) 자기 쓰기로 본다.
+    가져가면(claim) 기록은 비워진다 — 지문이 다르면 외부 편집으로 보고 버린다.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._writes: dict[str, OwnWrite] = {}
+        self._recorded = 0
+        self._claimed = 0
+        self._mismatched = 0
+
+    @staticmethod
+    def _key(file_path: str) -> str:
+        return os.path.realpath(file_path)
+
+    def record(
+        self,
+        file_path: str,
+        fingerprint: Optional[FileFingerprint],
+        before_version: str,
+        version: str,
+        request_id: Optional[str],
+    ) -> None:
+        """쓰기 완료 기록 (지문을 못 얻었으면 기록을 비워 외부 편집으로 취급)"""
+        key = self._key(file_path)
+        with self._lock:
+            self._recorded += 1
+            previous = self._writes.pop(key, None)
+            if fingerprint is None:
+                return
+            if previous is not None and previous.fingerprint == fingerprint:
+                # 같은 배치의 다른 호출자 (같은 쓰기 결과)
+                write = previous
+            else:
+                write = OwnWrite(fingerprint, version)
+            if previous is not None and previous is not write:
+                write.request_ids = previous.request_ids[-(MAX_REQUEST_IDS - 1):]
+                write.interleaved = (
+                    previous.interleaved or previous.version != before_version
+                )
+            if request_id is not None:
+                write.request_ids.append(request_id)
+            self._writes[key] = write
+
+    def claim(self, file_path: str) -> Optional[OwnWrite]:
+        """
+        현재 파일이 마지막 자기 쓰기 그대로면 그 기록 반환 (I/O 스레드에서 호출).
+
+        기록이 없거나 지문이 다르거나 중간에 외부 편집이 끼었으면 None.
+        """
+        key = self._key(file_path)
+        with self._lock:
+            write = self._writes.pop(key, None)
+        if write is None:
+            return None
+        own = not write.interleaved and file_fingerprint(file_path) == write.fingerprint
+        with self._lock:
+            if own:
+                self._claimed += 1
+            else:
+                self._mismatched += 1
+        return write if own else None
+
+    def stats(self) -> dict:
+        """기록/자기 쓰기로 판정/외부 편집으로 판정 횟수"""
+        with self._lock:
+            return {
+                "pending": len(self._writes),
+                "recorded": self._recorded,
+                "claimed": self._claimed,
+                "mismatched": self._mismatched,
+            }
+
+
+# 프로세스 전역 자기 쓰기 기록 (TodoWriter 기록, 파일 감시자 조회)
+write_journal = WriteJournal()
@@ -7,6 +7,7 @@ from pathlib import Path
 from backend.core.config import settings
 from backend.domain.interfaces import NoteRepository
 from backend.domain.note import NoteSector, ProjectNote
+from backend.infrastructure.file_system.io_executor import io_executor
 
 _note_lock = asyncio.Lock()
 # 신규 포맷: HTML 주석 기반 섹터 구분 (콘텐츠 내 ## 헤더와 충돌 방지)
@@ -30,22 +31,21 @@ class FileNoteRepository(NoteRepository):
         return self._notes_dir / f"{project_id}.md"
 
     async def get_note(self, project_id: str) -> ProjectNote:
-        path = self._note_path(project_id)
-        if not path.exists():
+        text = await io_executor.run(self._read_note, self._note_path(project_id))
+        if text is None:
             return ProjectNote(
                 project_id=project_id,
                 sectors=[NoteSector(name=s, content="") for s in DEFAULT_SECTORS],
             )
-        text = path.read_text(encoding="utf-8")
         sectors = self._parse_sectors(text)
         return ProjectNote(project_id=project_id, sectors=sectors)
 
     async def save_note(self, note: ProjectNote) -> ProjectNote:
+        content = self._serialize(note.sectors)
         async with _note_lock:
-            self._notes_dir.mkdir(parents=True, exist_ok=True)
-            path = self._note_path(note.project_id)
-            content = self._serialize(note.sectors)
-            path.write_text(content, encoding="utf-8")
+            await io_executor.run(
+                self._write_note, self._note_path(note.project_id), content
+            )
         return note
 
     async def push_to_project(
@@ -53,15 +53,33 @@ class FileNoteRepository(NoteRepository):
     ) -> list[str]:
         note = await self.get_note(project_id)
         target_dir = self._root / project_id
-        if not target_dir.exists():
-            raise ValueError(f"대상 프로젝트 디렉토리가 없습니다: {project_id}")
         # sector_names 지정 시 해당 섹터만, None이면 전체
         targets = note.sectors
         if sector_names is not None:
             name_set = set(sector_names)
             targets = [s for s in note.sectors if s.name in name_set]
+        return await io_executor.run(self._export_sectors, target_dir, targets)
+
+    # ── 파일 I/O (I/O 스레드에서 실행) ──
+
+    @staticmethod
+    def _read_note(path: Path) -> str | None:
+        """노트 파일 내용 (없으면 None)"""
+        if not path.exists():
+            return None
+        return path.read_text(encoding="utf-8")
+
+    def _write_note(self, path: Path, content: str) -> None:
+        self._notes_dir.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+
+    @staticmethod
+    def _export_sectors(target_dir: Path, sectors: list[NoteSector]) -> list[str]:
+        """섹터별 notes-{섹터}.md 파일 기록 후 경로 목록 반환"""
+        if not target_dir.exists():
+            raise ValueError(f"대상 프로젝트 디렉토리가 없습니다: {target_dir.name}")
         pushed: list[str] = []
-        for sector in targets:
+        for sector in sectors:
             safe_name = _SANITIZE_RE.sub("_", sector.name)
             file_path = target_dir / f"notes-{safe_name}.md"
             file_path.write_text(sector.content, encoding="utf-8")
@@ -1,67 +1,76 @@
 """파일 시스템 기반 프로젝트 저장소 — pj.* 폴더를 스캔하여 Project Entity 생성"""
 
-from pathlib import Path
 from typing import Optional
 
-from backend.core.config import settings
+from backend.domain.dashboard import Dashboard
 from backend.domain.interfaces import ProjectRepository
-from backend.domain.project import PROJECT_COLORS, Project
-from backend.domain.ticket import KanbanStage
-from backend.infrastructure.file_system.todo_parser import TodoParser
+from backend.domain.project import Project
+from backend.domain.ticket import KanbanStage, Ticket
+from backend.infrastructure.file_system.board_db import board_db
+from backend.infrastructure.file_system.board_store import board_store
+from backend.infrastructure.file_system.io_executor import io_executor
+from backend.infrastructure.file_system.parse_cache import file_fingerprint
+from backend.infrastructure.file_system.project_catalog import project_catalog
 
 
 class FileProjectRepository(ProjectRepository):
-    """PROJECTS_ROOT에서 pj.* 패턴 폴더를 탐색하는 저장소 구현체"""
+    """
+    PROJECTS_ROOT에서 pj.* 패턴 폴더를 탐색하는 저장소 구현체.
+
+    폴더 목록과 프로젝트 요약은 ProjectCatalog가 stat 기반으로 캐시하므로
+    바뀐 todo.md만 다시 파싱한다.
+    """
 
     def __init__(self) -> None:
-        self._parser = TodoParser()
-        self._root = Path(settings.PROJECTS_ROOT)
+        self._catalog = project_catalog
 
     async def scan_all(self) -> list[Project]:
-        """pj.* 폴더를 glob으로 스캔하여 모든 프로젝트 반환"""
-        projects: list[Project] = []
-        # pj.* 패턴 폴더를 정렬하여 색상 인덱스 안정화
-        folders = sorted(self._root.glob("pj.*"))
+        """
+        pj.* 폴더의 모든 프로젝트 반환 (I/O 스레드에서, 폴더 이름순).
 
-        for idx, folder in enumerate(folders):
-            if not folder.is_dir():
-                continue
+        바뀐 프로젝트가 많으면 카탈로그가 파싱을 프로세스 풀에 나눠 맡긴다.
+        """
+        return await io_executor.run(self._catalog.scan)
 
-            todo_path = folder / "todo.md"
-            if not todo_path.exists():
-                continue
+    async def get_by_id(self, project_id: str) -> Optional[Project]:
+        """특정 프로젝트 ID로 조회 (그 프로젝트만 파싱)"""
+        return await io_executor.run(self._catalog.get, project_id)
 
-            project_id = folder.name
-            result = self._parser.parse(str(todo_path), project_id)
+    async def get_dashboard(self) -> Dashboard:
+        """대시보드 집계 (카탈로그의 구체화 집계, 감시 중이면 바뀐 프로젝트만 확인)"""
+        return await io_executor.run(self._catalog.dashboard)
 
-            # 스테이지별 티켓 수 집계
-            count_by_stage = self._count_by_stage(result.tickets)
+    async def find_tickets(self, stage: Optional[KanbanStage] = None) -> list[Ticket]:
+        """
+        전체 프로젝트의 티켓 (프로젝트 ID, 라인 순).
 
-            project = Project(
-                project_id=project_id,
-                name=result.project_title or project_id,
-                path=str(folder),
-                todo_file_path=str(todo_path),
-                sections=result.sections,
-                ticket_count_by_stage=count_by_stage,
-                color=PROJECT_COLORS[idx % len(PROJECT_COLORS)],
+        영속 색인이 켜져 있으면 티켓 행이 현재 파일과 다른 프로젝트만 다시
+        읽어 색인한 뒤 SQL로 조회한다. 아니면 프로젝트별 보드를 읽어 모은다.
+        """
+        if board_db.enabled:
+            tickets = await io_executor.run(self._find_indexed, stage)
+            if tickets is not None:
+                return tickets
+        tickets = []
+        for project in await self.scan_all():
+            result = await board_store.get(project.todo_file_path, project.project_id)
+            tickets.extend(
+                result.tickets if stage is None else result.index.by_stage(stage)
             )
-            projects.append(project)
-
-        return projects
+        return tickets
 
-    async def get_by_id(self, project_id: str) -> Optional[Project]:
-        """특정 프로젝트 ID로 조회"""
-        all_projects = await self.scan_all()
-        for project in all_projects:
-            if project.project_id == project_id:
-                return project
-        return None
-
-    @staticmethod
-    def _count_by_stage(tickets: list) -> dict[str, int]:
-        """스테이지별 티켓 수 집계 (모든 스테이지 키 포함)"""
-        counts: dict[str, int] = {stage.value: 0 for stage in KanbanStage}
-        for ticket in tickets:
-            counts[ticket.stage.value] = counts.get(ticket.stage.value, 0) + 1
-        return counts
+    def _find_indexed(self, stage: Optional[KanbanStage]) -> Optional[list[Ticket]]:
+        """색인 조회 (I/O 스레드) — 티켓 행이 없거나 오래된 프로젝트는 읽어서 저장"""
+        projects = self._catalog.scan()
+        for project in projects:
+            fingerprint = file_fingerprint(project.todo_file_path)
+            if fingerprint is None or board_db.indexed(project.todo_file_path, fingerprint):
+                continue
+            result = board_store.load(project.todo_file_path, project.project_id)
+            board_db.submit_result(
+                project.project_id, project.todo_file_path, fingerprint, result, tickets=True
+            )
+        board_db.flush()
+        return board_db.tickets(
+            [project.todo_file_path for project in projects], stage
+        )
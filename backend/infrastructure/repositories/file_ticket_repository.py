@@ -1,17 +1,47 @@
 """파일 시스템 기반 티켓 저장소 — todo.md 파싱/쓰기를 통한 티켓 CRUD"""
 
 from pathlib import Path
-from typing import Optional
+from typing import Awaitable, Optional
 
 from backend.core.config import settings
+from backend.domain.board import TicketBoard, VersionConflictError, VersionedTicket
+from backend.domain.board_delta import BoardDelta
 from backend.domain.interfaces import TicketRepository
 from backend.domain.ticket import KanbanStage, Ticket
-from backend.infrastructure.file_system.todo_parser import TodoParser
-from backend.infrastructure.file_system.todo_writer import TodoWriter
+from backend.domain.ticket_operation import (
+    TicketBatchResult,
+    TicketOperation,
+    TicketOpType,
+)
+from backend.infrastructure.file_system.board_store import board_store
+from backend.infrastructure.file_system.io_executor import io_executor
+from backend.infrastructure.file_system.parse_cache import parse_cache
+from backend.infrastructure.file_system.project_catalog import project_catalog
+from backend.infrastructure.file_system.todo_parser import (
+    ParseResult,
+    TodoParser,
+)
+from backend.infrastructure.file_system.todo_writer import (
+    TodoWriter,
+    WriteOp,
+    WriteResult,
+)
+from backend.infrastructure.file_system.version_diff import (
+    board_delta,
+    board_diff,
+)
 
 
 class FileTicketRepository(TicketRepository):
-    """todo.md 파일을 직접 읽고 쓰는 티켓 저장소 구현체"""
+    """
+    todo.md 파일을 직접 읽고 쓰는 티켓 저장소 구현체.
+
+    읽기는 보드 저장소(board_store)의 상주 결과를 쓰고, 쓰기 후 증분 결과를
+    다시 저장소에 넣는다 (쓰기 관통).
+    모든 변경은 파싱한 버전(내용 해시)을 기대 버전으로 TodoWriter에 넘기므로
+    파싱과 쓰기 사이에 파일이 바뀌면 엉뚱한 라인을 고치지 않고
+    VersionConflictError(현재 버전 기준 diff 포함)로 끝난다.
+    """
 
     def __init__(self) -> None:
         self._parser = TodoParser()
@@ -22,88 +52,213 @@ class FileTicketRepository(TicketRepository):
         """프로젝트 ID로 todo.md 절대 경로 반환"""
         return str(self._root / project_id / "todo.md")
 
-    async def get_all_by_project(self, project_id: str) -> list[Ticket]:
-        """특정 프로젝트의 모든 티켓 반환"""
-        todo_path = self._todo_path(project_id)
-        result = self._parser.parse(todo_path, project_id)
-        return result.tickets
+    async def _parse(self, project_id: str) -> ParseResult:
+        """프로젝트 파싱 결과 (보드 저장소 상주 결과, 없으면 I/O 스레드에서 파싱)"""
+        return await board_store.get(self._todo_path(project_id), project_id)
+
+    async def _reload(self, project_id: str) -> ParseResult:
+        """파일 지문을 다시 확인하여 파싱 (버전 불일치 시 메모리 결과 대신)"""
+        return await io_executor.run(
+            board_store.load, self._todo_path(project_id), project_id
+        )
+
+    async def _apply_write(
+        self,
+        todo_path: str,
+        project_id: str,
+        before: ParseResult,
+        write: WriteResult,
+    ) -> ParseResult:
+        """
+        쓰기 결과 증분 반영 (전체 재파싱 폴백 가능 → I/O 스레드에서 실행).
+
+        결과는 보드 저장소와 프로젝트 카탈로그(대시보드 집계)에도 넣으므로
+        다음 읽기는 다시 파싱하지 않는다.
+        """
+        after = await io_executor.run(
+            self._parser.apply_write, todo_path, project_id, before, write
+        )
+        board_store.put(todo_path, after, write.after_fingerprint, write.generation)
+        project_catalog.put(
+            project_id, after, write.after_fingerprint, write.generation
+        )
+        return after
+
+    async def _begin(
+        self, project_id: str, expected_version: Optional[str]
+    ) -> ParseResult:
+        """변경 전 파싱 — 요청 기준 버전(If-Match)과 다르면 VersionConflictError"""
+        before = await self._parse(project_id)
+        if expected_version is not None and expected_version != before.digest:
+            # 메모리 결과가 아직 감시 이벤트를 받지 못했을 수 있으므로 파일 재확인
+            before = await self._reload(project_id)
+        if expected_version is not None and expected_version != before.digest:
+            base = parse_cache.recall(
+                self._todo_path(project_id), project_id, expected_version
+            )
+            raise await self._conflict(expected_version, base, before)
+        return before
+
+    async def _write(
+        self, project_id: str, before: ParseResult, write: Awaitable[WriteResult]
+    ) -> WriteResult:
+        """쓰기 대기 — 파싱 이후 파일이 바뀌어 거부되면 diff를 붙여 다시 발생"""
+        try:
+            return await write
+        except VersionConflictError as e:
+            current = await self._reload(project_id)
+            raise await self._conflict(e.expected_version, before, current) from None
+
+    @staticmethod
+    async def _conflict(
+        expected_version: str, base: Optional[ParseResult], current: ParseResult
+    ) -> VersionConflictError:
+        """기준 결과가 있으면 현재 결과와의 diff가 붙은 충돌 오류 생성"""
+        diff = None
+        if base is not None:
+            diff = await io_executor.run(board_diff, base, current)
+        return VersionConflictError(expected_version, current.digest, diff)
+
+    @staticmethod
+    def _board(
+        result: ParseResult, before: Optional[ParseResult] = None
+    ) -> TicketBoard:
+        """파싱 결과 → 보드 (결과의 BoardIndex 공유, before는 변경 적용 전 결과)"""
+        return TicketBoard.from_index(
+            result.project_id,
+            result.digest,
+            result.index,
+            base_version=before.digest if before is not None else None,
+        )
+
+    async def get_all_by_project(self, project_id: str) -> TicketBoard:
+        """특정 프로젝트의 모든 티켓 반환 (버전 포함)"""
+        return self._board(await self._parse(project_id))
 
     async def get_by_id(
         self, project_id: str, ticket_id: str
     ) -> Optional[Ticket]:
-        """특정 티켓 조회 (ticket_id = 'pj.X:라인번호')"""
-        tickets = await self.get_all_by_project(project_id)
-        for ticket in tickets:
-            if ticket.ticket_id == ticket_id:
-                return ticket
-        return None
+        """특정 티켓 조회 (ticket_id = 'pj.X:티켓키', 이전 형식 'pj.X:라인번호'도 허용)"""
+        result = await self._parse(project_id)
+        return result.find_ticket(ticket_id)
+
+    async def get_delta(
+        self, project_id: str, base_version: str, version: str
+    ) -> Optional[BoardDelta]:
+        """최근 버전 이력의 두 결과로 변경분 계산 (이력에 없으면 None)"""
+        todo_path = self._todo_path(project_id)
+        base = parse_cache.recall(todo_path, project_id, base_version)
+        current = parse_cache.recall(todo_path, project_id, version)
+        if base is None or current is None:
+            return None
+        return await io_executor.run(board_delta, base, current)
 
     async def update_stage(
-        self, project_id: str, ticket_id: str, new_stage: KanbanStage
-    ) -> Ticket:
+        self,
+        project_id: str,
+        ticket_id: str,
+        new_stage: KanbanStage,
+        expected_version: Optional[str] = None,
+    ) -> VersionedTicket:
         """
         티켓 스테이지 변경 흐름:
         1. 현재 티켓 조회
         2. TodoWriter로 마커 교체 (파일 쓰기)
-        3. 재파싱하여 최신 상태의 Ticket 반환
+        3. 변경 라인만 증분 재파싱하여 최신 상태의 Ticket 반환
         """
         # 현재 티켓 조회
-        ticket = await self.get_by_id(project_id, ticket_id)
+        todo_path = self._todo_path(project_id)
+        before = await self._begin(project_id, expected_version)
+        ticket = before.find_ticket(ticket_id)
         if ticket is None:
             raise ValueError(f"티켓을 찾을 수 없습니다: {ticket_id}")
 
         # todo.md 마커 교체
-        todo_path = self._todo_path(project_id)
-        await self._writer.update_ticket_stage(
-            file_path=todo_path,
-            line_number=ticket.line_number,
-            new_stage=new_stage,
+        write = await self._write(
+            project_id,
+            before,
+            self._writer.update_ticket_stage(
+                file_path=todo_path,
+                line_number=ticket.line_number,
+                new_stage=new_stage,
+                expected_version=before.digest,
+            ),
         )
 
-        # 재파싱하여 변경 후 최신 티켓 반환
-        updated_ticket = await self.get_by_id(project_id, ticket_id)
+        # 증분 재파싱하여 변경 후 최신 티켓 반환
+        # (같은 배치의 다른 쓰기로 라인이 밀렸으면 새 라인 번호로 조회)
+        after = await self._apply_write(todo_path, project_id, before, write)
+        updated_ticket = after.ticket_at_line(write.line_after(ticket.line_number))
         if updated_ticket is None:
             raise ValueError(
                 f"스테이지 변경 후 티켓 재조회 실패: {ticket_id}"
             )
-        return updated_ticket
+        return VersionedTicket(ticket=updated_ticket, version=after.digest)
 
     async def delete_ticket(
-        self, project_id: str, ticket_id: str
-    ) -> list[Ticket]:
+        self,
+        project_id: str,
+        ticket_id: str,
+        expected_version: Optional[str] = None,
+    ) -> TicketBoard:
         """단일 티켓 삭제 → 재파싱하여 최신 목록 반환"""
-        ticket = await self.get_by_id(project_id, ticket_id)
+        todo_path = self._todo_path(project_id)
+        before = await self._begin(project_id, expected_version)
+        ticket = before.find_ticket(ticket_id)
         if ticket is None:
             raise ValueError(f"티켓을 찾을 수 없습니다: {ticket_id}")
 
-        todo_path = self._todo_path(project_id)
-        await self._writer.delete_lines(todo_path, [ticket.line_number])
+        write = await self._write(
+            project_id,
+            before,
+            self._writer.delete_lines(
+                todo_path, [ticket.line_number], expected_version=before.digest
+            ),
+        )
 
-        # 재파싱 (라인번호 재계산됨)
-        return await self.get_all_by_project(project_id)
+        # 증분 재파싱 (라인번호 재계산됨)
+        after = await self._apply_write(todo_path, project_id, before, write)
+        return self._board(after, before)
 
     async def delete_tickets(
-        self, project_id: str, ticket_ids: list[str]
-    ) -> list[Ticket]:
+        self,
+        project_id: str,
+        ticket_ids: list[str],
+        expected_version: Optional[str] = None,
+    ) -> TicketBoard:
         """복수 티켓 일괄 삭제 (한 번의 파일 쓰기로 처리)"""
-        tickets = await self.get_all_by_project(project_id)
-        id_set = set(ticket_ids)
-        targets = [t for t in tickets if t.ticket_id in id_set]
+        todo_path = self._todo_path(project_id)
+        before = await self._begin(project_id, expected_version)
+        targets = [
+            ticket
+            for ticket in map(before.find_ticket, dict.fromkeys(ticket_ids))
+            if ticket is not None
+        ]
 
         if not targets:
             raise ValueError(f"삭제 대상 티켓이 없습니다: {ticket_ids}")
 
-        todo_path = self._todo_path(project_id)
-        await self._writer.delete_lines(
-            todo_path, [t.line_number for t in targets]
+        write = await self._write(
+            project_id,
+            before,
+            self._writer.delete_lines(
+                todo_path,
+                [t.line_number for t in targets],
+                expected_version=before.digest,
+            ),
         )
 
-        # 재파싱 (라인번호 재계산됨)
-        return await self.get_all_by_project(project_id)
+        # 증분 재파싱 (라인번호 재계산됨)
+        after = await self._apply_write(todo_path, project_id, before, write)
+        return self._board(after, before)
 
     async def create_child_ticket(
-        self, project_id: str, parent_ticket_id: str, title: str
-    ) -> list[Ticket]:
+        self,
+        project_id: str,
+        parent_ticket_id: str,
+        title: str,
+        expected_version: Optional[str] = None,
+    ) -> TicketBoard:
         """
         부모 티켓 아래에 자식 티켓 생성.
 
@@ -112,27 +267,34 @@ class FileTicketRepository(TicketRepository):
         재파싱하여 최신 전체 목록을 반환한다.
         """
         todo_path = self._todo_path(project_id)
-        tickets = await self.get_all_by_project(project_id)
+        before = await self._begin(project_id, expected_version)
 
-        parent = next(
-            (t for t in tickets if t.ticket_id == parent_ticket_id),
-            None,
-        )
+        parent = before.find_ticket(parent_ticket_id)
         if parent is None:
             raise ValueError(f"부모 티켓을 찾을 수 없습니다: {parent_ticket_id}")
 
-        await self._writer.insert_child_ticket(
-            file_path=todo_path,
-            parent_line_number=parent.line_number,
-            title=title,
+        write = await self._write(
+            project_id,
+            before,
+            self._writer.insert_child_ticket(
+                file_path=todo_path,
+                parent_line_number=parent.line_number,
+                title=title,
+                expected_version=before.digest,
+            ),
         )
 
-        # 재파싱 (라인번호 + 계층 재계산됨)
-        return await self.get_all_by_project(project_id)
+        # 증분 재파싱 (라인번호 + 계층 재계산됨)
+        after = await self._apply_write(todo_path, project_id, before, write)
+        return self._board(after, before)
 
     async def create_ticket(
-        self, project_id: str, section_name: str, title: str
-    ) -> list[Ticket]:
+        self,
+        project_id: str,
+        section_name: str,
+        title: str,
+        expected_version: Optional[str] = None,
+    ) -> TicketBoard:
         """
         티켓 생성: 지정 섹션에 새 체크박스 삽입 후 재파싱.
 
@@ -141,21 +303,125 @@ class FileTicketRepository(TicketRepository):
         재파싱하여 최신 전체 목록을 반환한다.
         """
         todo_path = self._todo_path(project_id)
-        result = self._parser.parse(todo_path, project_id)
+        before = await self._begin(project_id, expected_version)
 
         # 섹션 이름으로 검색
-        target_section = next(
-            (s for s in result.sections if s.name == section_name),
-            None,
-        )
+        target_section = before.section_named(section_name)
         if target_section is None:
             raise ValueError(f"섹션을 찾을 수 없습니다: {section_name}")
 
-        await self._writer.insert_ticket(
-            file_path=todo_path,
-            section_line_number=target_section.line_number,
-            title=title,
+        write = await self._write(
+            project_id,
+            before,
+            self._writer.insert_ticket(
+                file_path=todo_path,
+                section_line_number=target_section.line_number,
+                title=title,
+                expected_version=before.digest,
+            ),
+        )
+
+        # 증분 재파싱 (라인번호 재계산됨)
+        after = await self._apply_write(todo_path, project_id, before, write)
+        return self._board(after, before)
+
+    async def apply_batch(
+        self,
+        project_id: str,
+        operations: list[TicketOperation],
+        expected_version: Optional[str] = None,
+    ) -> TicketBatchResult:
+        """
+        일괄 작업: 한 번의 파싱 결과로 모든 ID/섹션을 라인 번호로 해석하고
+        TodoWriter.apply_ops()로 한 번에 기록한 뒤 증분 재파싱한다.
+
+        하나라도 해석/적용에 실패하면 파일은 변경되지 않는다.
+        """
+        todo_path = self._todo_path(project_id)
+        before = await self._begin(project_id, expected_version)
+
+        ops: list[WriteOp] = []
+        targets: list[int] = []  # 적용 후 ID를 돌려줄 라인 (이동 대상/부모)
+        deleted: set[int] = set()  # 중복 삭제 방지 (cascade로 이미 포함된 자식 등)
+        for operation in operations:
+            if operation.op == TicketOpType.MOVE:
+                lines = self._target_lines(
+                    before, operation.ticket_id, operation.cascade
+                )
+                ops.extend(
+                    self._writer.stage_op(line, operation.new_stage)
+                    for line in lines
+                )
+                targets.extend(lines)
+            elif operation.op == TicketOpType.DELETE:
+                lines = [
+                    line
+                    for line in self._target_lines(
+                        before, operation.ticket_id, operation.cascade
+                    )
+                    if line not in deleted
+                ]
+                deleted.update(lines)
+                if lines:
+                    ops.append(self._writer.delete_op(lines))
+            elif operation.op == TicketOpType.CREATE:
+                section = before.section_named(operation.section_name)
+                if section is None:
+                    raise ValueError(
+                        f"섹션을 찾을 수 없습니다: {operation.section_name}"
+                    )
+                ops.append(
+                    self._writer.insert_op(section.line_number, operation.title)
+                )
+            else:
+                parent = before.find_ticket(operation.ticket_id)
+                if parent is None:
+                    raise ValueError(
+                        f"부모 티켓을 찾을 수 없습니다: {operation.ticket_id}"
+                    )
+                ops.append(
+                    self._writer.insert_child_op(parent.line_number, operation.title)
+                )
+                targets.append(parent.line_number)
+
+        write = await self._write(
+            project_id,
+            before,
+            self._writer.apply_ops(todo_path, ops, expected_version=before.digest),
         )
 
-        # 재파싱 (라인번호 재계산됨)
-        return await self.get_all_by_project(project_id)
+        # 증분 재파싱 (라인번호 + 계층 재계산됨)
+        after = await self._apply_write(todo_path, project_id, before, write)
+
+        id_map: dict[str, str] = {}
+        for line in targets:
+            try:
+                new_line = write.line_after(line)
+            except ValueError:
+                continue  # 같은 배치에서 삭제됨
+            new_id = after.ticket_id_at_line(new_line)
+            if new_id is not None:
+                id_map[before.ticket_id_at_line(line)] = new_id
+        return TicketBatchResult.from_index(
+            project_id,
+            after.digest,
+            after.index,
+            base_version=before.digest,
+            id_map=id_map,
+        )
+
+    @staticmethod
+    def _target_lines(
+        result: ParseResult, ticket_id: str, cascade: bool
+    ) -> list[int]:
+        """작업 대상 라인 번호 (cascade=True면 직계 자식 포함)"""
+        ticket = result.find_ticket(ticket_id)
+        if ticket is None:
+            raise ValueError(f"티켓을 찾을 수 없습니다: {ticket_id}")
+
+        lines = [ticket.line_number]
+        if cascade:
+            table = result.table
+            index = table.index_of_line(ticket.line_number)
+            lines.extend(table.line_numbers[child] for child in table.children(index))
+        return lines
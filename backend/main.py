@@ -9,7 +9,18 @@ from fastapi.middleware.cors import CORSMiddleware
 from sse_starlette.sse import EventSourceResponse
 
 from backend.core.config import settings
+from backend.core.request_context import RequestIdMiddleware
+from backend.infrastructure.file_system.board_db import board_db
+from backend.infrastructure.file_system.board_store import board_store
+from backend.infrastructure.file_system.file_locks import file_locks
 from backend.infrastructure.file_system.file_watcher import TodoFileWatcher
+from backend.infrastructure.file_system.io_executor import io_executor, loop_monitor
+from backend.infrastructure.file_system.parse_cache import parse_cache
+from backend.infrastructure.file_system.project_catalog import (
+    catalog_verifier,
+    project_catalog,
+)
+from backend.infrastructure.file_system.todo_writer import write_queue
 from backend.presentation.routers import agent, notes, projects, tickets
 
 # 파일 감시자 (앱 수명 동안 유지)
@@ -18,9 +29,15 @@ watcher = TodoFileWatcher(settings.PROJECTS_ROOT)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """앱 시작 시 파일 감시 시작, 종료 시 정리"""
+    """앱 시작 시 파일 감시/루프 지연 측정 시작, 종료 시 정리"""
     await watcher.start()
+    loop_monitor.start()
+    catalog_verifier.start()
     yield
+    await catalog_verifier.stop()
+    await loop_monitor.stop()
+    project_catalog.shutdown()
+    await io_executor.run(board_db.close)
 
 
 app = FastAPI(
@@ -37,8 +54,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Request-ID"],
 )
 
+# 요청 ID 전달 (X-Request-ID — 파일 감시 알림의 자기 쓰기 표시)
+app.add_middleware(RequestIdMiddleware)
+
 # 라우터 등록
 app.include_router(projects.router, prefix="/api")
 app.include_router(tickets.router, prefix="/api")
@@ -52,23 +73,45 @@ async def health_check() -> dict:
     return {"status": "ok", "project": settings.PROJECT_NAME}
 
 
+@app.get("/api/metrics", tags=["헬스체크"])
+async def metrics() -> dict:
+    """내부 성능 지표 (프로젝트 카탈로그/집계 검증, 보드 저장소/영속 색인, 파싱 캐시, 쓰기 잠금 대기, 그룹 커밋 배치, 파일 감시 알림, I/O 스레드 풀, 루프 지연)"""
+    return {
+        "project_catalog": project_catalog.stats(),
+        "catalog_verifier": catalog_verifier.stats(),
+        "board_store": board_store.stats(),
+        "board_index": board_db.stats(),
+        "parse_cache": parse_cache.stats(),
+        "write_locks": file_locks.stats(),
+        "write_batches": write_queue.stats(),
+        "file_watcher": watcher.stats(),
+        "io": io_executor.stats(),
+        "event_loop": loop_monitor.stats(),
+    }
+
+
 @app.get("/api/events/stream", tags=["실시간"])
 async def event_stream(request: Request):
-    """SSE 엔드포인트 — todo.md 파일 변경 시 실시간 이벤트 전송"""
+    """
+    SSE 엔드포인트 — todo.md 파일 변경 시 실시간 이벤트 전송.
+
+    이벤트: todo_changed (프로젝트별 디바운스 후 한 번), resync (이 연결이
+    밀려 이벤트를 버렸음 — 전체 다시 조회), ping (30초 keepalive)
+    """
 
     async def generate():
-        queue = watcher.subscribe()
+        subscription = watcher.subscribe()
         try:
             while True:
                 if await request.is_disconnected():
                     break
                 try:
-                    event = await asyncio.wait_for(queue.get(), timeout=30.0)
-                    yield {"event": "todo_changed", "data": json.dumps(event)}
+                    event = await asyncio.wait_for(subscription.get(), timeout=30.0)
+                    yield {"event": event["type"], "data": json.dumps(event)}
                 except asyncio.TimeoutError:
                     # 30초마다 keepalive 핑
                     yield {"event": "ping", "data": "keepalive"}
         finally:
-            watcher.unsubscribe(queue)
+            watcher.unsubscribe(subscription)
 
     return EventSourceResponse(generate())
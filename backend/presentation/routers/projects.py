@@ -1,8 +1,11 @@
-"""프로젝트 라우터 — 프로젝트 목록/상세/대시보드 엔드포인트"""
+"""프로젝트 라우터 — 프로젝트 목록/상세/대시보드/전체 티켓 조회 엔드포인트"""
 
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 
 from backend.application.project_service import ProjectService
+from backend.domain.ticket import KanbanStage
 from backend.infrastructure.repositories.file_project_repository import (
     FileProjectRepository,
 )
@@ -10,6 +13,7 @@ from backend.presentation.schemas.project_schemas import (
     DashboardResponse,
     ProjectResponse,
 )
+from backend.presentation.schemas.ticket_schemas import TicketResponse
 
 router = APIRouter(prefix="/projects", tags=["프로젝트"])
 
@@ -46,10 +50,25 @@ async def get_dashboard(
 ) -> DashboardResponse:
     """모든 프로젝트의 스테이지별 집계 데이터 반환"""
     try:
-        data = await service.get_dashboard()
-        # projects 리스트를 dict로 변환하여 Pydantic 검증 통과
-        data["projects"] = [p.model_dump() for p in data["projects"]]
-        return DashboardResponse.model_validate(data)
+        dashboard = await service.get_dashboard()
+        return DashboardResponse.model_validate(dashboard.model_dump())
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get(
+    "/tickets",
+    response_model=list[TicketResponse],
+    summary="전체 프로젝트 티켓 조회",
+)
+async def find_tickets(
+    stage: Optional[KanbanStage] = Query(default=None, description="이 스테이지의 티켓만"),
+    service: ProjectService = Depends(get_project_service),
+) -> list[TicketResponse]:
+    """모든 프로젝트의 티켓 (프로젝트 ID, 라인 순 — 예: ?stage=진행중)"""
+    try:
+        tickets = await service.find_tickets(stage)
+        return [TicketResponse.model_validate(t) for t in tickets]
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -61,9 +80,10 @@ async def get_dashboard(
 )
 async def get_project(
     project_id: str,
+    response: Response,
     service: ProjectService = Depends(get_project_service),
 ) -> ProjectResponse:
-    """특정 프로젝트 상세 정보 반환"""
+    """특정 프로젝트 상세 정보 반환 (ETag = todo.md 버전)"""
     try:
         project = await service.get_by_id(project_id)
         if project is None:
@@ -71,6 +91,8 @@ async def get_project(
                 status_code=404,
                 detail=f"프로젝트를 찾을 수 없습니다: {project_id}",
             )
+        if project.version is not None:
+            response.headers["ETag"] = f'"{project.version}"'
         return ProjectResponse.model_validate(project.model_dump())
     except HTTPException:
         raise
@@ -1,19 +1,26 @@
 """티켓 라우터 — 프로젝트별 티켓 조회/스테이지 이동/삭제/에픽 관리 엔드포인트"""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Optional, Union
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 
 from backend.application.ticket_service import TicketService
+from backend.domain.board import TicketBoard, VersionConflictError
 from backend.domain.ticket import KanbanStage
+from backend.domain.ticket_operation import TicketOperation
 from backend.infrastructure.repositories.file_ticket_repository import (
     FileTicketRepository,
 )
 from backend.presentation.schemas.ticket_schemas import (
     BatchDeleteRequest,
+    BatchOperationsRequest,
+    BoardDeltaResponse,
     CreateChildTicketRequest,
     CreateTicketRequest,
     MoveEpicRequest,
     MoveTicketRequest,
     ProjectTicketsResponse,
+    ResponseMode,
     TicketResponse,
     TicketsByStageResponse,
 )
@@ -27,27 +34,100 @@ def get_ticket_service() -> TicketService:
     return TicketService(repository)
 
 
+def if_match(
+    value: Optional[str] = Header(
+        None,
+        alias="If-Match",
+        description="요청 기준 todo.md 버전 (응답 ETag / version 값, *이면 검사 안 함)",
+    ),
+) -> Optional[str]:
+    """If-Match 헤더에서 버전 추출 (W/ 접두어와 따옴표 제거)"""
+    if value is None:
+        return None
+    value = value.strip()
+    if value == "*":
+        return None
+    if value.startswith("W/"):
+        value = value[2:]
+    return value.strip('"') or None
+
+
+def _set_etag(response: Response, version: Optional[str]) -> None:
+    """응답에 현재 버전 ETag 헤더 설정"""
+    if version is not None:
+        response.headers["ETag"] = f'"{version}"'
+
+
+def _conflict(e: VersionConflictError) -> HTTPException:
+    """버전 충돌 → 409 (현재 버전 + 가능하면 변경 구간 diff)"""
+    return HTTPException(
+        status_code=409,
+        detail={
+            "message": str(e),
+            "current_version": e.current_version,
+            "diff": e.diff.model_dump(mode="json") if e.diff is not None else None,
+        },
+        headers={"ETag": f'"{e.current_version}"'} if e.current_version else None,
+    )
+
+
 def _build_project_tickets_response(
-    project_id: str, tickets: list,
+    board: TicketBoard, response: Optional[Response] = None
 ) -> ProjectTicketsResponse:
-    """티켓 목록을 ProjectTicketsResponse로 변환 (중복 로직 제거)"""
+    """TicketBoard를 ProjectTicketsResponse로 변환 (중복 로직 제거, ETag 설정)"""
+    if response is not None:
+        _set_etag(response, board.version)
     ticket_responses = [
-        TicketResponse.model_validate(t.model_dump()) for t in tickets
+        TicketResponse.model_validate(t) for t in board.tickets
     ]
-    by_stage: list[TicketsByStageResponse] = []
-    for stage in KanbanStage:
-        stage_tickets = [t for t in ticket_responses if t.stage == stage]
-        by_stage.append(
-            TicketsByStageResponse(stage=stage, tickets=stage_tickets)
+    # 스테이지별 그룹은 보드 색인의 위치 목록으로 응답 객체를 재사용
+    index = board.index
+    by_stage = [
+        TicketsByStageResponse(
+            stage=stage,
+            tickets=[ticket_responses[p] for p in index.stage_positions(stage)],
         )
+        for stage in KanbanStage
+    ]
     return ProjectTicketsResponse(
-        project_id=project_id,
+        project_id=board.project_id,
+        version=board.version,
         total=len(ticket_responses),
         tickets=ticket_responses,
         by_stage=by_stage,
     )
 
 
+# 변경 요청 응답 (?response=delta면 변경분, 아니면 전체 목록)
+MutationResponse = Union[ProjectTicketsResponse, BoardDeltaResponse]
+
+
+def response_mode(
+    mode: ResponseMode = Query(
+        ResponseMode.FULL,
+        alias="response",
+        description="full: 전체 티켓 목록, delta: 변경분만 (계산할 수 없으면 full)",
+    ),
+) -> ResponseMode:
+    """?response= 쿼리에서 응답 형식 추출"""
+    return mode
+
+
+async def _build_mutation_response(
+    board: TicketBoard,
+    response: Response,
+    mode: ResponseMode,
+    service: TicketService,
+) -> MutationResponse:
+    """변경 결과 보드 → delta 응답 (요청 시, 가능하면) 또는 전체 응답"""
+    if mode == ResponseMode.DELTA:
+        delta = await service.get_delta(board)
+        if delta is not None:
+            _set_etag(response, delta.version)
+            return BoardDeltaResponse.model_validate(delta)
+    return _build_project_tickets_response(board, response)
+
+
 @router.get(
     "",
     response_model=ProjectTicketsResponse,
@@ -55,33 +135,39 @@ def _build_project_tickets_response(
 )
 async def list_tickets(
     project_id: str,
+    response: Response,
     service: TicketService = Depends(get_ticket_service),
 ) -> ProjectTicketsResponse:
-    """특정 프로젝트의 모든 티켓을 스테이지별로 그룹핑하여 반환"""
+    """특정 프로젝트의 모든 티켓을 스테이지별로 그룹핑하여 반환 (ETag = 버전)"""
     try:
-        tickets = await service.get_all(project_id)
-        return _build_project_tickets_response(project_id, tickets)
+        board = await service.get_all(project_id)
+        return _build_project_tickets_response(board, response)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post(
     "",
-    response_model=ProjectTicketsResponse,
+    response_model=MutationResponse,
     summary="티켓 생성",
     status_code=201,
 )
 async def create_ticket(
     project_id: str,
     body: CreateTicketRequest,
+    response: Response,
+    expected_version: Optional[str] = Depends(if_match),
+    mode: ResponseMode = Depends(response_mode),
     service: TicketService = Depends(get_ticket_service),
-) -> ProjectTicketsResponse:
-    """새 티켓을 지정 섹션에 추가 후 전체 티켓 목록 반환"""
+) -> MutationResponse:
+    """새 티켓을 지정 섹션에 추가 후 전체 티켓 목록 (또는 변경분) 반환"""
     try:
-        tickets = await service.create_ticket(
-            project_id, body.section_name, body.title
+        board = await service.create_ticket(
+            project_id, body.section_name, body.title, expected_version
         )
-        return _build_project_tickets_response(project_id, tickets)
+        return await _build_mutation_response(board, response, mode, service)
+    except VersionConflictError as e:
+        raise _conflict(e)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -97,12 +183,19 @@ async def move_ticket_stage(
     project_id: str,
     ticket_id: str,
     body: MoveTicketRequest,
+    response: Response,
+    expected_version: Optional[str] = Depends(if_match),
     service: TicketService = Depends(get_ticket_service),
 ) -> TicketResponse:
-    """티켓의 칸반 스테이지를 변경하고 최신 상태 반환"""
+    """티켓의 칸반 스테이지를 변경하고 최신 상태 반환 (ETag = 변경 후 버전)"""
     try:
-        ticket = await service.move_ticket(project_id, ticket_id, body.new_stage)
-        return TicketResponse.model_validate(ticket.model_dump())
+        result = await service.move_ticket(
+            project_id, ticket_id, body.new_stage, expected_version
+        )
+        _set_etag(response, result.version)
+        return TicketResponse.model_validate(result.ticket)
+    except VersionConflictError as e:
+        raise _conflict(e)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -111,19 +204,26 @@ async def move_ticket_stage(
 
 @router.delete(
     "/{ticket_id}",
-    response_model=ProjectTicketsResponse,
+    response_model=MutationResponse,
     summary="티켓 삭제",
 )
 async def delete_ticket(
     project_id: str,
     ticket_id: str,
+    response: Response,
     cascade: bool = Query(False, description="에픽 삭제 시 자식도 함께 삭제"),
+    expected_version: Optional[str] = Depends(if_match),
+    mode: ResponseMode = Depends(response_mode),
     service: TicketService = Depends(get_ticket_service),
-) -> ProjectTicketsResponse:
-    """티켓 삭제 후 전체 티켓 목록 반환 (라인번호 갱신)"""
+) -> MutationResponse:
+    """티켓 삭제 후 전체 티켓 목록 (또는 변경분) 반환 (라인번호 갱신)"""
     try:
-        tickets = await service.delete_ticket(project_id, ticket_id, cascade)
-        return _build_project_tickets_response(project_id, tickets)
+        board = await service.delete_ticket(
+            project_id, ticket_id, cascade, expected_version
+        )
+        return await _build_mutation_response(board, response, mode, service)
+    except VersionConflictError as e:
+        raise _conflict(e)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -132,27 +232,63 @@ async def delete_ticket(
 
 @router.post(
     "/batch-delete",
-    response_model=ProjectTicketsResponse,
+    response_model=MutationResponse,
     summary="복수 티켓 일괄 삭제",
 )
 async def batch_delete_tickets(
     project_id: str,
     body: BatchDeleteRequest,
+    response: Response,
+    expected_version: Optional[str] = Depends(if_match),
+    mode: ResponseMode = Depends(response_mode),
     service: TicketService = Depends(get_ticket_service),
-) -> ProjectTicketsResponse:
-    """선택된 티켓들 일괄 삭제 후 전체 티켓 목록 반환"""
+) -> MutationResponse:
+    """선택된 티켓들 일괄 삭제 후 전체 티켓 목록 (또는 변경분) 반환"""
     try:
-        tickets = await service.delete_tickets(project_id, body.ticket_ids)
-        return _build_project_tickets_response(project_id, tickets)
+        board = await service.delete_tickets(
+            project_id, body.ticket_ids, expected_version
+        )
+        return await _build_mutation_response(board, response, mode, service)
+    except VersionConflictError as e:
+        raise _conflict(e)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post(
+    "/batch",
+    response_model=MutationResponse,
+    summary="티켓 일괄 작업",
+)
+async def apply_ticket_batch(
+    project_id: str,
+    body: BatchOperationsRequest,
+    response: Response,
+    expected_version: Optional[str] = Depends(if_match),
+    mode: ResponseMode = Depends(response_mode),
+    service: TicketService = Depends(get_ticket_service),
+) -> MutationResponse:
+    """이동/삭제/생성 작업들을 한 번의 파일 쓰기로 적용 후 전체 티켓 목록 (또는 변경분) 반환"""
+    try:
+        result = await service.apply_batch(
+            project_id,
+            [TicketOperation(**o.model_dump()) for o in body.operations],
+            expected_version,
+        )
+        return await _build_mutation_response(result, response, mode, service)
+    except VersionConflictError as e:
+        raise _conflict(e)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post(
     "/{ticket_id}/children",
-    response_model=ProjectTicketsResponse,
+    response_model=MutationResponse,
     summary="하위 티켓 생성",
     status_code=201,
 )
@@ -160,14 +296,19 @@ async def create_child_ticket(
     project_id: str,
     ticket_id: str,
     body: CreateChildTicketRequest,
+    response: Response,
+    expected_version: Optional[str] = Depends(if_match),
+    mode: ResponseMode = Depends(response_mode),
     service: TicketService = Depends(get_ticket_service),
-) -> ProjectTicketsResponse:
-    """부모 티켓 아래에 자식 티켓 추가 후 전체 티켓 목록 반환"""
+) -> MutationResponse:
+    """부모 티켓 아래에 자식 티켓 추가 후 전체 티켓 목록 (또는 변경분) 반환"""
     try:
-        tickets = await service.create_child_ticket(
-            project_id, ticket_id, body.title
+        board = await service.create_child_ticket(
+            project_id, ticket_id, body.title, expected_version
         )
-        return _build_project_tickets_response(project_id, tickets)
+        return await _build_mutation_response(board, response, mode, service)
+    except VersionConflictError as e:
+        raise _conflict(e)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -183,14 +324,23 @@ async def move_epic_stage(
     project_id: str,
     ticket_id: str,
     body: MoveEpicRequest,
+    response: Response,
+    expected_version: Optional[str] = Depends(if_match),
     service: TicketService = Depends(get_ticket_service),
 ) -> list[TicketResponse]:
-    """에픽과 자식 티켓들의 스테이지를 일괄 변경"""
+    """에픽과 자식 티켓들의 스테이지를 일괄 변경 (ETag = 변경 후 버전)"""
     try:
-        tickets = await service.move_epic(
-            project_id, ticket_id, body.new_stage, body.include_children
+        board = await service.move_epic(
+            project_id,
+            ticket_id,
+            body.new_stage,
+            body.include_children,
+            expected_version,
         )
-        return [TicketResponse.model_validate(t.model_dump()) for t in tickets]
+        _set_etag(response, board.version)
+        return [TicketResponse.model_validate(t) for t in board.tickets]
+    except VersionConflictError as e:
+        raise _conflict(e)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
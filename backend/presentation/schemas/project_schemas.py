@@ -20,7 +20,17 @@ class ProjectResponse(BaseModel):
         title="스테이지별 티켓 수",
         description="각 칸반 스테이지의 티켓 수 집계",
     )
+    ticket_count_by_section: dict[str, dict[str, int]] = Field(
+        default_factory=dict,
+        title="섹션별 스테이지별 티켓 수",
+        description="섹션명 → 스테이지 → 티켓 수 (같은 이름 섹션은 합산, 섹션 밖 티켓은 '미분류')",
+    )
     color: str = Field(..., title="프로젝트 색상", description="UI 식별용 hex 색상")
+    version: str | None = Field(
+        default=None,
+        title="보드 버전",
+        description="todo.md 내용 해시 — 티켓 변경 요청의 If-Match 헤더 값",
+    )
 
 
 class DashboardResponse(BaseModel):
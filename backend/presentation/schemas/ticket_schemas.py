@@ -1,15 +1,21 @@
 """티켓 관련 Pydantic 응답/요청 스키마"""
 
-from pydantic import BaseModel, Field
+from enum import Enum
 
+from pydantic import BaseModel, ConfigDict, Field
+
+from backend.domain.board_delta import LineShift
 from backend.domain.section import Section
 from backend.domain.ticket import KanbanStage
+from backend.domain.ticket_operation import TicketOpType
 
 
 class TicketResponse(BaseModel):
     """티켓 단건 응답"""
 
-    ticket_id: str = Field(..., title="티켓 ID", description="고유 식별자 (프로젝트ID:라인번호)")
+    model_config = ConfigDict(from_attributes=True)
+
+    ticket_id: str = Field(..., title="티켓 ID", description="고유 식별자 (프로젝트ID:티켓 키, 라인 이동과 무관)")
     title: str = Field(..., title="티켓 제목", description="체크박스 텍스트")
     stage: KanbanStage = Field(..., title="칸반 스테이지", description="현재 스테이지")
     section: Section = Field(..., title="소속 섹션")
@@ -44,6 +50,11 @@ class ProjectTicketsResponse(BaseModel):
     """프로젝트 전체 티켓 응답 (스테이지별 그룹핑)"""
 
     project_id: str = Field(..., title="프로젝트 ID")
+    version: str | None = Field(
+        default=None,
+        title="보드 버전",
+        description="todo.md 내용 해시 — 변경 요청의 If-Match 헤더 값",
+    )
     total: int = Field(..., title="전체 티켓 수")
     tickets: list[TicketResponse] = Field(default_factory=list, title="전체 티켓 목록")
     by_stage: list[TicketsByStageResponse] = Field(
@@ -53,6 +64,37 @@ class ProjectTicketsResponse(BaseModel):
     )
 
 
+class ResponseMode(str, Enum):
+    """변경 요청 응답 형식 (?response=)"""
+
+    FULL = "full"    # 전체 티켓 목록 (ProjectTicketsResponse)
+    DELTA = "delta"  # 변경분만 (BoardDeltaResponse)
+
+
+class BoardDeltaResponse(BaseModel):
+    """변경 요청 delta 응답 — 변경 전 보드에 적용할 티켓 변경분"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    project_id: str = Field(..., title="프로젝트 ID")
+    base_version: str = Field(..., title="기준 버전", description="변경 적용 전 todo.md 내용 해시")
+    version: str = Field(..., title="보드 버전", description="변경 적용 후 todo.md 내용 해시")
+    total: int = Field(..., title="전체 티켓 수")
+    added: list[TicketResponse] = Field(default_factory=list, title="추가된 티켓")
+    changed: list[TicketResponse] = Field(
+        default_factory=list,
+        title="변경된 티켓",
+        description="같은 ID의 티켓을 교체 (라인 이동만 한 티켓은 제외)",
+    )
+    removed_ticket_ids: list[str] = Field(default_factory=list, title="삭제된 티켓 ID")
+    line_shifts: list[LineShift] = Field(
+        default_factory=list,
+        title="라인 이동 구간",
+        description="기준 버전 라인 [start_line, end_line]의 line_number/section.line_number에 delta를 더함",
+    )
+    sections: list[Section] = Field(default_factory=list, title="현재 섹션 목록")
+
+
 class BatchDeleteRequest(BaseModel):
     """복수 티켓 일괄 삭제 요청"""
 
@@ -92,3 +134,37 @@ class CreateChildTicketRequest(BaseModel):
         max_length=200,
         title="하위 티켓 제목",
     )
+
+
+class TicketOperationRequest(BaseModel):
+    """일괄 작업 하나"""
+
+    op: TicketOpType = Field(
+        ...,
+        title="작업 종류",
+        description="move | delete | create | create_child",
+    )
+    ticket_id: str | None = Field(
+        default=None,
+        title="대상 티켓 ID",
+        description="move/delete 대상 또는 create_child의 부모 (배치 적용 전 기준)",
+    )
+    new_stage: KanbanStage | None = Field(default=None, title="이동할 스테이지 (move)")
+    section_name: str | None = Field(default=None, title="소속 섹션명 (create)")
+    title: str | None = Field(
+        default=None,
+        max_length=200,
+        title="티켓 제목 (create/create_child)",
+    )
+    cascade: bool = Field(
+        default=False,
+        title="직계 자식 포함 여부 (move/delete)",
+    )
+
+
+class BatchOperationsRequest(BaseModel):
+    """티켓 일괄 작업 요청 (순서대로 한 번의 파일 쓰기로 적용)"""
+
+    operations: list[TicketOperationRequest] = Field(
+        ..., min_length=1, title="작업 목록"
+    )
@@ -0,0 +1,213 @@
+"""증분 재파싱 차등 테스트 — reparse_edit/apply_write 결과가 새 본문 전체 파싱과 같은지"""
+
+import asyncio
+import random
+from pathlib import Path
+
+import pytest
+
+from backend.domain.ticket import KanbanStage
+from backend.infrastructure.file_system.todo_parser import (
+    LineEdit,
+    ParseResult,
+    TodoParser,
+)
+from backend.infrastructure.file_system.todo_writer import TodoWriter
+
+PROJECT_ID = "pj.t"
+# 제목 후보를 적게 두어 같은 섹션의 중복 ID(-n 접미사)가 자주 생기게 한다
+TITLES = ["로그인", "회원가입", "배포 스크립트", "API 문서", "QA 체크"]
+MARKERS = " xX~QD"
+INDENTS = ["  ", "    ", "\t"]
+STAGES = list(KanbanStage)
+
+
+def random_line(rng: random.Random, headers: bool = True) -> str:
+    """무작위 todo.md 라인 (체크박스 위주, 빈 줄/본문/헤더 섞음)"""
+    roll = rng.random()
+    if roll < 0.08:
+        return ""
+    if roll < 0.14:
+        return f"메모 {rng.randint(0, 9)}"
+    if headers and roll < 0.20:
+        return rng.choice(["## 섹션 A", "## 섹션 B", f"## 섹션 {rng.randint(0, 3)}"])
+    if headers and roll < 0.22:
+        return "# 다른 제목"
+    depth = rng.choice([0, 0, 1, 1, 2, 3])
+    title = rng.choice(TITLES)
+    if rng.random() < 0.3:
+        title += f" {rng.randint(0, 3)}"
+    return f"{rng.choice(INDENTS) * depth}- [{rng.choice(MARKERS)}] {title}"
+
+
+def random_lines(rng: random.Random) -> list[str]:
+    """무작위 todo.md 라인 목록 (제목 없음/빈 파일 포함)"""
+    lines = ["# 프로젝트"] if rng.random() < 0.8 else []
+    if rng.random() < 0.8:
+        lines.append("## 섹션 A")
+    lines += [random_line(rng) for _ in range(rng.randint(0, 40))]
+    return lines
+
+
+def join_lines(lines: list[str], eol: str, final_newline: bool) -> str:
+    """라인 목록 → 본문 (마지막 줄이 비어 있으면 줄바꿈 생략 불가)"""
+    if not lines:
+        return ""
+    if not lines[-1]:
+        final_newline = True
+    return eol.join(lines) + (eol if final_newline else "")
+
+
+def random_edit(rng: random.Random, line_count: int) -> LineEdit:
+    """교체/삽입/삭제 중 하나 (파일 끝 다음 라인 삽입 포함)"""
+    start = rng.randint(1, line_count + 1)
+    kind = rng.choice(["replace", "insert", "delete"])
+    room = line_count + 1 - start
+    if kind == "insert" or room == 0:
+        deleted = 0
+        count = rng.randint(1, 3)
+    elif kind == "delete":
+        deleted = rng.randint(1, min(3, room))
+        count = 0
+    else:
+        deleted = rng.randint(1, min(3, room))
+        count = rng.randint(1, 3)
+    headers = rng.random() < 0.2
+    return LineEdit(
+        start, deleted, tuple(random_line(rng, headers) for _ in range(count))
+    )
+
+
+def snapshot(result: ParseResult) -> dict:
+    """비교용 결과 (제목/섹션/버퍼/티켓 전체 필드 — ID, 부모/자식 링크 포함)"""
+    return {
+        "title": result.project_title,
+        "title_line": result.title_line_number,
+        "sections": [(s.name, s.line_number) for s in result.sections],
+        "line_count": result.table.line_count,
+        "buffer": result.table.buffer,
+        "tickets": [t.model_dump() for t in result.tickets],
+    }
+
+
+def touches_header(lines: list[str], edit: LineEdit) -> bool:
+    """편집이 # 라인을 지우거나 넣는지 (reparse_edit가 전체 재파싱을 요구해도 되는 경우)"""
+    removed = lines[edit.start - 1:edit.start - 1 + edit.deleted]
+    return any(line.startswith("#") for line in (*removed, *edit.new_lines))
+
+
+@pytest.mark.parametrize("seed", range(300))
+def test_reparse_edit_matches_full_parse(seed: int) -> None:
+    rng = random.Random(seed)
+    parser = TodoParser()
+    eol = rng.choice(["\n", "\r\n"])
+    final_newline = rng.random() < 0.7
+    lines = random_lines(rng)
+    result = parser.parse_text(join_lines(lines, eol, final_newline), PROJECT_ID)
+
+    # 연속 편집 (apply_write처럼 이전 결과에 이어서 적용)
+    for _ in range(rng.randint(1, 4)):
+        edit = random_edit(rng, len(lines))
+        header_edit = touches_header(lines, edit)
+        lines = (
+            lines[:edit.start - 1]
+            + list(edit.new_lines)
+            + lines[edit.start - 1 + edit.deleted:]
+        )
+        expected = parser.parse_text(join_lines(lines, eol, final_newline), PROJECT_ID)
+        spliced = parser.reparse_edit(result, edit, PROJECT_ID)
+        if spliced is None:
+            assert header_edit, edit
+            result = expected
+            continue
+        assert snapshot(spliced) == snapshot(expected), edit
+        result = spliced
+
+
+class _CountingParser(TodoParser):
+    """전체 파싱 횟수 집계 (apply_write가 증분 경로를 탔는지 확인)"""
+
+    full_parses = 0
+
+    def parse(self, file_path, project_id, restore=None):
+        type(self).full_parses += 1
+        return super().parse(file_path, project_id, restore)
+
+
+def random_ops(rng: random.Random, writer: TodoWriter, prev: ParseResult) -> list:
+    """현재 결과 기준 무작위 쓰기 작업 1~3개 (라인이 겹치지 않게)"""
+    tickets = prev.tickets
+    used: set[int] = set()
+    ops = []
+    for _ in range(rng.randint(1, 3)):
+        kind = rng.choice(["stage", "stage", "delete", "insert", "child"])
+        if kind == "insert" and prev.sections:
+            section = rng.choice(prev.sections)
+            ops.append(writer.insert_op(section.line_number, rng.choice(TITLES)))
+            continue
+        free = [t for t in tickets if t.line_number not in used]
+        if not free:
+            break
+        ticket = rng.choice(free)
+        used.add(ticket.line_number)
+        if kind == "delete":
+            ops.append(writer.delete_op([ticket.line_number]))
+        elif kind == "child":
+            ops.append(writer.insert_child_op(ticket.line_number, rng.choice(TITLES)))
+        else:
+            ops.append(writer.stage_op(ticket.line_number, rng.choice(STAGES)))
+    return ops
+
+
+@pytest.mark.parametrize("seed", range(80))
+def test_apply_write_matches_full_parse(seed: int, tmp_path: Path) -> None:
+    rng = random.Random(seed)
+    parser = _CountingParser()
+    writer = TodoWriter()
+    path = tmp_path / "todo.md"
+    eol = rng.choice(["\n", "\r\n"])
+    lines = random_lines(rng)
+    path.write_bytes(join_lines(lines, eol, rng.random() < 0.7).encode("utf-8"))
+    prev = parser.parse(str(path), PROJECT_ID)
+
+    for _ in range(rng.randint(1, 3)):
+        ops = random_ops(rng, writer, prev)
+        if not ops:
+            break
+        try:
+            write = asyncio.run(
+                writer.apply_ops(str(path), ops, expected_version=prev.digest)
+            )
+        except ValueError:
+            break  # 작업 검증 실패 (파일 변경 없음)
+        after = parser.apply_write(str(path), PROJECT_ID, prev, write)
+        expected = parser.parse_text(
+            path.read_bytes().decode("utf-8"), PROJECT_ID
+        )
+        assert snapshot(after) == snapshot(expected)
+        assert after.digest == write.after_digest
+        prev = after
+
+
+def test_apply_write_takes_incremental_path(tmp_path: Path) -> None:
+    """위 차등 테스트가 대부분 전체 재파싱 폴백으로 통과하지 않도록 확인"""
+    parser = _CountingParser()
+    writer = TodoWriter()
+    path = tmp_path / "todo.md"
+    path.write_text(
+        "# 프로젝트\n## 섹션 A\n- [ ] 로그인\n  - [x] 회원가입\n- [ ] 로그인\n",
+        encoding="utf-8",
+    )
+    prev = parser.parse(str(path), PROJECT_ID)
+    before = _CountingParser.full_parses
+    ops = [
+        writer.stage_op(3, KanbanStage.DONE),
+        writer.insert_child_op(5, "QA 체크"),
+        writer.delete_op([4]),
+    ]
+    write = asyncio.run(writer.apply_ops(str(path), ops, expected_version=prev.digest))
+    after = parser.apply_write(str(path), PROJECT_ID, prev, write)
+    assert _CountingParser.full_parses == before
+    assert snapshot(after) == snapshot(
+        parser.parse_text(path.read_text(encoding="utf-8"), PROJECT_ID)
+    )
@@ -0,0 +1,66 @@
+"""스트리밍 파싱 테스트 — iter_parse가 전체 파싱과 같은 티켓을 점진적으로 방출하는지"""
+
+from pathlib import Path
+from typing import Iterator
+
+from backend.domain.ticket import Ticket
+from backend.infrastructure.file_system.todo_parser import (
+    Section,
+    TodoParser,
+    _iter_blocks,
+)
+
+PROJECT_ID = "pj.s"
+
+
+def rootless_blocks(count: int, consumed: list[int]) -> Iterator[str]:
+    """루트(indent 0) 티켓 없이 들여쓴 에픽/자식 블록만 이어지는 본문 (읽은 블록 수 기록)"""
+    yield "# 프로젝트\n## 섹션\n"
+    for i in range(count):
+        consumed.append(i)
+        yield f"  - [ ] 작업 {i}\n    - [x] 하위 {i}\n      - [~] 손자 {i}\n"
+
+
+def test_rootless_file_streams_per_block() -> None:
+    consumed: list[int] = []
+    events = TodoParser()._iter_events(rootless_blocks(1000, consumed), PROJECT_ID)
+
+    tickets = 0
+    for event in events:
+        if isinstance(event, Ticket):
+            tickets += 1
+            # 블록 i의 티켓은 다음 블록(i + 1)의 첫 티켓을 본 직후 방출
+            assert len(consumed) <= (tickets - 1) // 3 + 2
+    assert tickets == 3000
+    assert len(consumed) == 1000
+
+
+def test_iter_parse_matches_full_parse(tmp_path: Path) -> None:
+    text = (
+        "# 프로젝트\n"
+        "  - [ ] 고아\n"
+        "## 인증\n"
+        "- [ ] 로그인\n"
+        "  - [x] 회원가입\n"
+        "## 배포\n"
+        "    - [~] 스크립트\n"
+        "      - [ ] 롤백\n"
+        "  - [ ] 스크립트\n"
+        "- [ ] 로그인\n"
+    )
+    path = tmp_path / "todo.md"
+    path.write_text(text, encoding="utf-8")
+    parser = TodoParser()
+    expected = parser.parse_text(text, PROJECT_ID)
+
+    events = list(parser.iter_parse(str(path), PROJECT_ID))
+    assert [t.model_dump() for t in events if isinstance(t, Ticket)] == [
+        t.model_dump() for t in expected.tickets
+    ]
+    assert [s for s in events if isinstance(s, Section)] == expected.sections
+
+    # 블록 경계가 라인마다 생겨도 결과는 같다
+    small = list(parser._iter_events(_iter_blocks(text.encode(), 1), PROJECT_ID))
+    assert [e.model_dump() if isinstance(e, Ticket) else e for e in small] == [
+        e.model_dump() if isinstance(e, Ticket) else e for e in events
+    ]
@@ -0,0 +1,138 @@
+"""TodoWriter 테스트 — 마커 제자리 패치와 기대 버전(If-Match) 검사"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from backend.domain.board import VersionConflictError
+from backend.domain.ticket import KanbanStage
+from backend.infrastructure.file_system.parse_cache import content_digest
+from backend.infrastructure.file_system import todo_writer
+from backend.infrastructure.file_system.todo_writer import TodoWriter
+
+BASE = (
+    "# 프로젝트\n"
+    "## 인증\n"
+    "- [ ] 로그인 화면 ✨\n"
+    "  - [x] 회원가입\n"
+    "- [~] 비밀번호 재설정\n"
+)
+
+
+@pytest.fixture
+def todo(tmp_path: Path) -> Path:
+    path = tmp_path / "todo.md"
+    path.write_text(BASE, encoding="utf-8")
+    return path
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def no_rewrite(file_path: str, data: bytes) -> None:
+    raise AssertionError("제자리 패치 대신 전체 재작성")
+
+
+def prime(writer: TodoWriter, todo: Path) -> str:
+    """전체 재작성 한 번으로 오프셋 표 준비 (이후 마커 교체는 제자리 패치 대상)"""
+    result = run(writer.insert_child_ticket(str(todo), 5, "메일 발송"))
+    return result.after_digest
+
+
+def test_stage_patch_rewrites_marker_in_place(todo: Path, monkeypatch) -> None:
+    writer = TodoWriter()
+    version = prime(writer, todo)
+    before = todo.read_bytes()
+    monkeypatch.setattr(todo_writer, "_atomic_write", no_rewrite)
+
+    first = run(
+        writer.update_ticket_stage(
+            str(todo), 4, KanbanStage.QA_DONE, expected_version=version
+        )
+    )
+    second = run(
+        writer.update_ticket_stage(
+            str(todo), 6, KanbanStage.DEPLOYED, expected_version=first.after_digest
+        )
+    )
+
+    # 대상 마커 바이트만 바뀜
+    after = todo.read_bytes()
+    assert after == before.replace(
+        "  - [x] 회원가입".encode(), "  - [Q] 회원가입".encode()
+    ).replace("  - [ ] 메일 발송".encode(), "  - [D] 메일 발송".encode())
+    assert second.before_digest == first.after_digest
+    assert second.after_digest == content_digest(after)
+    assert [e.new_lines for e in first.edits] == [("  - [Q] 회원가입",)]
+    assert [e.new_lines for e in second.edits] == [("  - [D] 메일 발송",)]
+
+
+def test_stage_patch_after_multibyte_lines(todo: Path, monkeypatch) -> None:
+    writer = TodoWriter()
+    prime(writer, todo)
+    monkeypatch.setattr(todo_writer, "_atomic_write", no_rewrite)
+
+    run(writer.update_ticket_stage(str(todo), 3, KanbanStage.DEPLOYED))
+    run(writer.update_ticket_stage(str(todo), 5, KanbanStage.PLAN))
+
+    lines = todo.read_text(encoding="utf-8").splitlines()
+    assert lines[2] == "- [D] 로그인 화면 ✨"
+    assert lines[4] == "- [ ] 비밀번호 재설정"
+
+
+def test_stage_patch_falls_back_after_external_edit(todo: Path) -> None:
+    writer = TodoWriter()
+    prime(writer, todo)
+    # 오프셋 표를 만든 뒤 외부에서 앞쪽 라인 길이를 바꿈 (표가 낡음)
+    text = todo.read_text(encoding="utf-8").replace("## 인증", "## 인증 (v2)")
+    todo.write_text(text, encoding="utf-8")
+
+    result = run(writer.update_ticket_stage(str(todo), 5, KanbanStage.DONE))
+
+    after = todo.read_text(encoding="utf-8")
+    assert after == text.replace("- [~] 비밀번호 재설정", "- [x] 비밀번호 재설정")
+    assert result.before_digest == content_digest(text.encode("utf-8"))
+    assert result.after_digest == content_digest(after.encode("utf-8"))
+
+
+def test_version_is_content_digest(todo: Path) -> None:
+    writer = TodoWriter()
+    result = run(
+        writer.update_ticket_stage(
+            str(todo),
+            3,
+            KanbanStage.DONE,
+            expected_version=content_digest(BASE.encode("utf-8")),
+        )
+    )
+    assert result.before_digest == content_digest(BASE.encode("utf-8"))
+    assert result.after_digest == content_digest(todo.read_bytes())
+
+
+@pytest.mark.parametrize("primed", [False, True])
+def test_stale_version_conflicts_without_writing(todo: Path, primed: bool) -> None:
+    writer = TodoWriter()
+    stale = content_digest(BASE.encode("utf-8"))
+    if primed:
+        prime(writer, todo)
+    else:
+        todo.write_text(BASE + "- [ ] 외부 추가\n", encoding="utf-8")
+    current = todo.read_bytes()
+
+    with pytest.raises(VersionConflictError):
+        run(
+            writer.update_ticket_stage(
+                str(todo), 3, KanbanStage.DONE, expected_version=stale
+            )
+        )
+    with pytest.raises(VersionConflictError):
+        run(
+            writer.apply_ops(
+                str(todo),
+                [writer.delete_op([4]), writer.insert_op(2, "새 작업")],
+                expected_version=stale,
+            )
+        )
+    assert todo.read_bytes() == current
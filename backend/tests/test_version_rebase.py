@@ -0,0 +1,132 @@
+"""버전 충돌 diff의 ID 보정 테스트 — 같은 루트 블록의 다른 티켓만 바뀌면 그대로 재시도"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from backend.application.ticket_service import TicketService
+from backend.domain.board import VersionConflictError
+from backend.domain.ticket import KanbanStage
+from backend.infrastructure.file_system.board_store import board_store
+from backend.infrastructure.file_system.parse_cache import content_digest
+from backend.infrastructure.file_system.todo_parser import TodoParser
+from backend.infrastructure.file_system.version_diff import board_diff
+from backend.infrastructure.repositories.file_ticket_repository import (
+    FileTicketRepository,
+)
+
+PROJECT_ID = "pj.1"
+BASE = (
+    "# 프로젝트\n"
+    "## 인증\n"
+    "- [ ] 로그인\n"
+    "  - [ ] 회원가입\n"
+    "  - [ ] 비번\n"
+    "- [ ] 배포\n"
+)
+# 같은 루트 블록(로그인)의 형제 티켓만 바뀐 외부 편집
+SIBLING_EDIT = BASE.replace("  - [ ] 회원가입", "  - [~] 회원가입")
+
+
+def parse(text: str):
+    result = TodoParser().parse_text(text, PROJECT_ID)
+    result.digest = str(hash(text))
+    return result
+
+
+def id_of(result, title: str) -> str:
+    return next(t.ticket_id for t in result.tickets if t.title == title)
+
+
+def test_rebase_keeps_untouched_ids_in_changed_block() -> None:
+    base, current = parse(BASE), parse(SIBLING_EDIT)
+    diff = board_diff(base, current)
+
+    # 구간은 루트 블록 전체로 넓어지지만 바뀐 티켓은 회원가입뿐
+    assert id_of(base, "비번") in diff.removed_ticket_ids
+    assert diff.changed_ticket_ids == [id_of(base, "회원가입")]
+    assert diff.rebase_ticket_id(id_of(base, "비번")) == id_of(current, "비번")
+    assert diff.rebase_ticket_id(id_of(base, "로그인")) == id_of(current, "로그인")
+    assert diff.rebase_ticket_id(id_of(base, "회원가입")) is None
+
+
+def test_rebase_rejects_removed_or_renumbered_duplicates() -> None:
+    base = parse("## S\n- [ ] 작업\n- [ ] 작업\n- [ ] 끝\n")
+    current = parse("## S\n- [ ] 끝\n- [ ] 작업\n")
+    diff = board_diff(base, current)
+    # 첫 "작업"이 사라져 두 번째가 순번 없는 ID를 물려받음 — 어느 쪽도 확신할 수 없다
+    first, second = (t.ticket_id for t in base.tickets if t.title == "작업")
+    assert diff.rebase_ticket_id(first) is None
+    assert diff.rebase_ticket_id(second) is None
+    assert diff.rebase_ticket_id(id_of(base, "끝")) == id_of(current, "끝")
+
+
+@pytest.fixture
+def project(tmp_path: Path):
+    """pj.1/todo.md + 감시 중으로 표시된 보드 저장소 (외부 편집이 상주 결과에 반영되지 않은 상태 재현)"""
+    project_dir = tmp_path / PROJECT_ID
+    project_dir.mkdir()
+    todo = project_dir / "todo.md"
+    todo.write_text(BASE, encoding="utf-8")
+    repo = FileTicketRepository()
+    repo._root = tmp_path
+    board_store.watch([str(project_dir)])
+    yield repo, todo
+    board_store.unwatch()
+    board_store.evict(str(todo))
+
+
+def test_move_without_if_match_survives_sibling_edit(project) -> None:
+    repo, todo = project
+    service = TicketService(repo)
+
+    async def scenario():
+        board = await service.get_all(PROJECT_ID)
+        target = next(t.ticket_id for t in board.tickets if t.title == "비번")
+        todo.write_text(SIBLING_EDIT, encoding="utf-8")
+        return await service.move_ticket(PROJECT_ID, target, KanbanStage.DONE)
+
+    moved = asyncio.run(scenario())
+    assert moved.ticket.title == "비번" and moved.ticket.stage == KanbanStage.DONE
+    text = todo.read_text(encoding="utf-8")
+    assert "  - [~] 회원가입\n" in text and "  - [x] 비번\n" in text
+
+
+def test_move_without_if_match_conflicts_when_target_changed(project) -> None:
+    repo, todo = project
+    service = TicketService(repo)
+
+    async def scenario():
+        board = await service.get_all(PROJECT_ID)
+        target = next(t.ticket_id for t in board.tickets if t.title == "회원가입")
+        todo.write_text(SIBLING_EDIT, encoding="utf-8")
+        await service.move_ticket(PROJECT_ID, target, KanbanStage.DONE)
+
+    with pytest.raises(VersionConflictError):
+        asyncio.run(scenario())
+    assert todo.read_text(encoding="utf-8") == SIBLING_EDIT
+
+
+def test_stale_if_match_conflicts_with_diff(project) -> None:
+    repo, todo = project
+    service = TicketService(repo)
+
+    async def scenario():
+        board = await service.get_all(PROJECT_ID)
+        target = next(t.ticket_id for t in board.tickets if t.title == "비번")
+        todo.write_text(SIBLING_EDIT, encoding="utf-8")
+        await service.move_ticket(
+            PROJECT_ID, target, KanbanStage.DONE, expected_version=board.version
+        )
+
+    with pytest.raises(VersionConflictError) as caught:
+        asyncio.run(scenario())
+    # If-Match가 있으면 자동 재시도하지 않는다 — 파일 그대로, 현재 버전과 변경분 안내
+    assert todo.read_text(encoding="utf-8") == SIBLING_EDIT
+    conflict = caught.value
+    assert conflict.current_version == content_digest(SIBLING_EDIT.encode("utf-8"))
+    assert conflict.diff is not None
+    assert conflict.diff.version == conflict.current_version
+    assert [t.title for t in conflict.diff.tickets] == ["로그인", "회원가입", "비번"]
+    assert len(conflict.diff.changed_ticket_ids) == 1
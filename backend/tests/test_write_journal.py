@@ -0,0 +1,118 @@
+"""자기 쓰기 기록 테스트 — 감시자가 자기 쓰기(todo_applied)와 외부 편집을 구분하는지"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+from watchfiles import Change
+
+from backend.core.request_context import request_id
+from backend.domain.ticket import KanbanStage
+from backend.infrastructure.file_system.file_watcher import TodoFileWatcher
+from backend.infrastructure.file_system.parse_cache import (
+    content_digest,
+    file_fingerprint,
+)
+from backend.infrastructure.file_system.todo_writer import TodoWriter
+from backend.infrastructure.file_system.write_journal import (
+    WriteJournal,
+    write_journal,
+)
+
+BASE = "# 프로젝트\n## 인증\n- [ ] 로그인\n- [ ] 회원가입\n"
+
+
+@pytest.fixture
+def todo(tmp_path: Path) -> Path:
+    project_dir = tmp_path / "pj.1"
+    project_dir.mkdir()
+    path = project_dir / "todo.md"
+    path.write_text(BASE, encoding="utf-8")
+    yield path
+    write_journal.claim(str(path))  # 다른 테스트로 기록이 새지 않게
+
+
+def rewrite(path: Path, text: str) -> str:
+    """외부 편집 흉내 — 새 내용 해시 반환"""
+    path.write_text(text, encoding="utf-8")
+    return content_digest(text.encode("utf-8"))
+
+
+def test_claim_own_write(todo: Path) -> None:
+    journal = WriteJournal()
+    before = content_digest(BASE.encode("utf-8"))
+    after = rewrite(todo, BASE + "- [ ] 배포\n")
+    journal.record(str(todo), file_fingerprint(str(todo)), before, after, "req-1")
+
+    own = journal.claim(str(todo))
+    assert own is not None and own.version == after and own.request_ids == ["req-1"]
+    # 가져간 기록은 비워짐 — 같은 변경의 두 번째 이벤트는 외부 편집 취급
+    assert journal.claim(str(todo)) is None
+    assert journal.stats()["claimed"] == 1
+
+
+def test_external_edit_after_own_write_is_not_claimed(todo: Path) -> None:
+    journal = WriteJournal()
+    before = content_digest(BASE.encode("utf-8"))
+    after = rewrite(todo, BASE + "- [ ] 배포\n")
+    journal.record(str(todo), file_fingerprint(str(todo)), before, after, "req-1")
+    rewrite(todo, BASE + "- [ ] 배포\n- [ ] 외부\n")
+
+    assert journal.claim(str(todo)) is None
+    assert journal.stats()["mismatched"] == 1
+
+
+def test_consecutive_own_writes_merge_request_ids(todo: Path) -> None:
+    journal = WriteJournal()
+    v0 = content_digest(BASE.encode("utf-8"))
+    v1 = rewrite(todo, BASE + "- [ ] 배포\n")
+    journal.record(str(todo), file_fingerprint(str(todo)), v0, v1, "req-1")
+    # 같은 배치의 다른 호출자 (같은 지문)
+    journal.record(str(todo), file_fingerprint(str(todo)), v0, v1, "req-2")
+    v2 = rewrite(todo, BASE + "- [ ] 배포\n- [ ] 문서\n")
+    journal.record(str(todo), file_fingerprint(str(todo)), v1, v2, None)
+
+    own = journal.claim(str(todo))
+    assert own is not None
+    assert own.version == v2 and own.request_ids == ["req-1", "req-2"]
+
+
+def test_interleaved_external_edit_is_not_claimed(todo: Path) -> None:
+    journal = WriteJournal()
+    v0 = content_digest(BASE.encode("utf-8"))
+    v1 = rewrite(todo, BASE + "- [ ] 배포\n")
+    journal.record(str(todo), file_fingerprint(str(todo)), v0, v1, "req-1")
+    # 외부 편집 뒤 다시 자기 쓰기 — 마지막 지문은 맞아도 외부 변경이 섞였다
+    external = rewrite(todo, BASE + "- [ ] 외부\n")
+    v3 = rewrite(todo, BASE + "- [ ] 외부\n- [ ] 문서\n")
+    journal.record(str(todo), file_fingerprint(str(todo)), external, v3, "req-2")
+
+    assert journal.claim(str(todo)) is None
+
+
+def test_watcher_reports_own_write_as_todo_applied(todo: Path) -> None:
+    watcher = TodoFileWatcher(str(todo.parent.parent), debounce_ms=0)
+    subscription = watcher.subscribe()
+
+    async def scenario():
+        token = request_id.set("tab-1")
+        try:
+            write = await TodoWriter().update_ticket_stage(
+                str(todo), 3, KanbanStage.DONE
+            )
+        finally:
+            request_id.reset(token)
+        watcher._on_change(Change.modified, str(todo))
+        applied = await asyncio.wait_for(subscription.get(), 5)
+
+        todo.write_text(todo.read_text(encoding="utf-8") + "- [ ] 외부\n")
+        watcher._on_change(Change.modified, str(todo))
+        external = await asyncio.wait_for(subscription.get(), 5)
+        return write, applied, external
+
+    write, applied, external = asyncio.run(scenario())
+    assert applied["type"] == "todo_applied"
+    assert applied["version"] == write.after_digest
+    assert applied["request_ids"] == ["tab-1"]
+    assert external["type"] == "todo_changed"
+    assert "request_ids" not in external
@@ -13,4 +13,18 @@ const apiClient = axios.create({
   },
 });
 
+// 요청 ID: 탭별 접두사 + 순번 — SSE todo_applied 알림이 이 탭의 쓰기인지 구분
+const CLIENT_ID = Math.random().toString(36).slice(2, 10);
+let requestSeq = 0;
+
+apiClient.interceptors.request.use((config) => {
+  config.headers.set("X-Request-ID", `${CLIENT_ID}-${++requestSeq}`);
+  return config;
+});
+
+/** 이 탭이 보낸 요청의 ID인지 */
+export function isOwnRequestId(requestId: string): boolean {
+  return requestId.startsWith(`${CLIENT_ID}-`);
+}
+
 export default apiClient;
@@ -23,7 +23,7 @@ export default function DashboardPage() {
   const handleTodoChanged = useCallback(() => {
     fetchDashboard();
   }, [fetchDashboard]);
-  useSSE({ onTodoChanged: handleTodoChanged });
+  useSSE({ onTodoChanged: handleTodoChanged, onResync: handleTodoChanged });
 
   // 로딩 상태
   if (isLoading && !dashboard) {
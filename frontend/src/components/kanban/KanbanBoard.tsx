@@ -21,7 +21,14 @@ import {
 import { sortableKeyboardCoordinates } from "@dnd-kit/sortable";
 import { AnimatePresence } from "framer-motion";
 import { Loader2 } from "lucide-react";
-import type { TicketResponse, KanbanStage, AgentMode } from "@/src/types";
+import type {
+  TicketResponse,
+  KanbanStage,
+  AgentMode,
+  BoardDeltaResponse,
+  TodoAppliedEvent,
+} from "@/src/types";
+import { isOwnRequestId } from "@/src/api/client";
 import { KANBAN_STAGES } from "@/src/constants/kanban";
 import { useKanbanStore } from "@/src/store/useKanbanStore";
 import { useProjectStore } from "@/src/store/useProjectStore";
@@ -57,7 +64,7 @@ export default function KanbanBoard({
   onMultiDetailHandled,
 }: KanbanBoardProps) {
   const {
-    isLoading, error, fetchTickets,
+    isLoading, error, fetchTickets, applyDelta,
     moveTicket, moveTickets, deleteTicket, deleteTickets, createTicket, createChildTicket, tickets,
     searchQuery, filterCategories, filterTypes,
   } = useKanbanStore();
@@ -125,7 +132,34 @@ export default function KanbanBoard({
     },
     [projectId, fetchTickets]
   );
-  useSSE({ onTodoChanged: handleTodoChanged });
+  // 기준 버전이 맞지 않으면 변경분 대신 다시 조회
+  const handleBoardDelta = useCallback(
+    (delta: BoardDeltaResponse) => {
+      if (!applyDelta(delta)) fetchTickets(projectId);
+    },
+    [projectId, applyDelta, fetchTickets]
+  );
+  // 서버 자신의 쓰기: 이 탭의 요청이면 이미 응답을 반영했으므로 다시 조회하지 않음
+  const handleTodoApplied = useCallback(
+    (event: TodoAppliedEvent) => {
+      if (event.project_id !== projectId) return;
+      if (event.delta && applyDelta(event.delta)) return;
+      if (event.version === useKanbanStore.getState().version) return;
+      if (event.request_ids.some(isOwnRequestId)) return;
+      fetchTickets(projectId);
+    },
+    [projectId, applyDelta, fetchTickets]
+  );
+  const handleResync = useCallback(
+    () => fetchTickets(projectId),
+    [projectId, fetchTickets]
+  );
+  useSSE({
+    onTodoChanged: handleTodoChanged,
+    onBoardDelta: handleBoardDelta,
+    onTodoApplied: handleTodoApplied,
+    onResync: handleResync,
+  });
 
   const handleDragStart = useCallback(
     (event: DragStartEvent) => {
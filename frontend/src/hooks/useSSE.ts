@@ -3,6 +3,7 @@
 // SSE 구독 훅 — todo.md 변경 시 자동으로 데이터 리프레시
 // 콜백을 ref로 관리하여 EventSource 재생성 방지 (무한 루프 방어)
 import { useEffect, useRef } from "react";
+import type { BoardDeltaResponse, TodoAppliedEvent } from "@/src/types";
 
 const SSE_URL = process.env.NEXT_PUBLIC_API_URL
   ? `${process.env.NEXT_PUBLIC_API_URL.replace("/api", "")}/api/events/stream`
@@ -10,12 +11,29 @@ const SSE_URL = process.env.NEXT_PUBLIC_API_URL
 
 interface UseSSEOptions {
   onTodoChanged?: (projectId: string) => void;
+  // 티켓 변경분 (없으면 onTodoChanged로 다시 조회)
+  onBoardDelta?: (delta: BoardDeltaResponse) => void;
+  // 서버 자신의 쓰기 (없으면 onTodoChanged로 다시 조회)
+  onTodoApplied?: (event: TodoAppliedEvent) => void;
+  // 서버가 밀린 이벤트를 버렸을 때 (전체 다시 조회)
+  onResync?: () => void;
 }
 
-export function useSSE({ onTodoChanged }: UseSSEOptions) {
+export function useSSE({
+  onTodoChanged,
+  onBoardDelta,
+  onTodoApplied,
+  onResync,
+}: UseSSEOptions) {
   // 콜백을 ref로 관리 → 의존성 배열에서 제외 → EventSource 재생성 방지
   const callbackRef = useRef(onTodoChanged);
   callbackRef.current = onTodoChanged;
+  const deltaRef = useRef(onBoardDelta);
+  deltaRef.current = onBoardDelta;
+  const appliedRef = useRef(onTodoApplied);
+  appliedRef.current = onTodoApplied;
+  const resyncRef = useRef(onResync);
+  resyncRef.current = onResync;
 
   useEffect(() => {
     const es = new EventSource(SSE_URL);
@@ -29,6 +47,30 @@ export function useSSE({ onTodoChanged }: UseSSEOptions) {
       }
     });
 
+    es.addEventListener("board_delta", (event) => {
+      try {
+        const data = JSON.parse(event.data);
+        if (deltaRef.current) deltaRef.current(data.delta);
+        else callbackRef.current?.(data.project_id);
+      } catch {
+        // 파싱 실패 무시
+      }
+    });
+
+    es.addEventListener("todo_applied", (event) => {
+      try {
+        const data: TodoAppliedEvent = JSON.parse(event.data);
+        if (appliedRef.current) appliedRef.current(data);
+        else callbackRef.current?.(data.project_id);
+      } catch {
+        // 파싱 실패 무시
+      }
+    });
+
+    es.addEventListener("resync", () => {
+      resyncRef.current?.();
+    });
+
     es.onerror = () => {
       // 자동 재연결 (EventSource 기본 동작)
     };
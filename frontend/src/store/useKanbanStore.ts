@@ -8,6 +8,9 @@ import type {
   TicketResponse,
   KanbanStage,
   ProjectTicketsResponse,
+  BoardDeltaResponse,
+  LineShift,
+  Section,
 } from "@/src/types";
 import {
   fetchTickets as apiFetchTickets,
@@ -33,6 +36,8 @@ interface KanbanState {
   total: number;
   /** 현재 프로젝트 ID */
   projectId: string | null;
+  /** 마지막으로 받은 보드 버전 (todo.md 내용 해시) */
+  version: string | null;
   /** 로딩 상태 */
   isLoading: boolean;
   /** 에러 메시지 */
@@ -40,6 +45,8 @@ interface KanbanState {
 
   /** 프로젝트별 티켓 가져오기 */
   fetchTickets: (projectId: string) => Promise<void>;
+  /** SSE 변경분 적용 (기준 버전이 현재 버전과 다르면 false → 다시 조회) */
+  applyDelta: (delta: BoardDeltaResponse) => boolean;
   /** 티켓 스테이지 이동 (낙관적 업데이트) */
   moveTicket: (
     ticketId: string,
@@ -80,11 +87,20 @@ function groupByStage(tickets: TicketResponse[]): ByStageEntry[] {
   }));
 }
 
+/** 기준 버전 라인을 이동 구간에 맞춰 현재 버전 라인으로 변환 */
+function shiftLine(shifts: LineShift[], line: number): number {
+  for (const s of shifts) {
+    if (s.start_line <= line && line <= s.end_line) return line + s.delta;
+  }
+  return line;
+}
+
 export const useKanbanStore = create<KanbanState>((set, get) => ({
   tickets: [],
   byStage: KANBAN_STAGES.map(({ key }) => ({ stage: key, tickets: [] })),
   total: 0,
   projectId: null,
+  version: null,
   isLoading: false,
   error: null,
 
@@ -120,7 +136,7 @@ export const useKanbanStore = create<KanbanState>((set, get) => ({
   fetchTickets: async (projectId: string) => {
     // 프로젝트 전환 시 필터 초기화
     set({
-      isLoading: true, error: null, projectId,
+      isLoading: true, error: null, projectId, version: null,
       searchQuery: "", filterCategories: new Set<string>(), filterTypes: new Set<string>(),
     });
     try {
@@ -129,6 +145,7 @@ export const useKanbanStore = create<KanbanState>((set, get) => ({
         tickets: data.tickets,
         byStage: groupByStage(data.tickets),
         total: data.total,
+        version: data.version ?? null,
         isLoading: false,
       });
     } catch (err) {
@@ -138,6 +155,40 @@ export const useKanbanStore = create<KanbanState>((set, get) => ({
     }
   },
 
+  applyDelta: (delta: BoardDeltaResponse) => {
+    const { tickets: prevTickets, projectId, version } = get();
+    if (delta.project_id !== projectId) return true;
+    if (!version || delta.base_version !== version) return false;
+
+    const removed = new Set(delta.removed_ticket_ids);
+    const changed = new Map(delta.changed.map((t) => [t.ticket_id, t]));
+    // 같은 이름의 섹션이 여럿이면 첫 번째 (백엔드 section_named와 동일)
+    const sectionAt = new Map<string, Section>();
+    for (const s of delta.sections) {
+      if (!sectionAt.has(s.name)) sectionAt.set(s.name, s);
+    }
+    const next = prevTickets
+      .filter((t) => !removed.has(t.ticket_id))
+      .map(
+        (t) =>
+          changed.get(t.ticket_id) ?? {
+            ...t,
+            line_number: shiftLine(delta.line_shifts, t.line_number),
+            section: sectionAt.get(t.section.name) ?? t.section,
+          }
+      )
+      .concat(delta.added)
+      .sort((a, b) => a.line_number - b.line_number);
+
+    set({
+      tickets: next,
+      byStage: groupByStage(next),
+      total: delta.total,
+      version: delta.version,
+    });
+    return true;
+  },
+
   moveTicket: async (ticketId: string, newStage: KanbanStage) => {
     const { tickets: prevTickets, projectId } = get();
     if (!projectId) return;
@@ -229,6 +280,7 @@ export const useKanbanStore = create<KanbanState>((set, get) => ({
         tickets: data.tickets,
         byStage: groupByStage(data.tickets),
         total: data.total,
+        version: data.version ?? null,
       });
     } catch (err) {
       // 롤백
@@ -260,6 +312,7 @@ export const useKanbanStore = create<KanbanState>((set, get) => ({
         tickets: data.tickets,
         byStage: groupByStage(data.tickets),
         total: data.total,
+        version: data.version ?? null,
       });
     } catch (err) {
       set({
@@ -282,6 +335,7 @@ export const useKanbanStore = create<KanbanState>((set, get) => ({
         tickets: data.tickets,
         byStage: groupByStage(data.tickets),
         total: data.total,
+        version: data.version ?? null,
       });
     } catch (err) {
       set({
@@ -300,6 +354,7 @@ export const useKanbanStore = create<KanbanState>((set, get) => ({
         tickets: data.tickets,
         byStage: groupByStage(data.tickets),
         total: data.total,
+        version: data.version ?? null,
       });
     } catch (err) {
       set({
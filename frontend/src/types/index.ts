@@ -52,11 +52,47 @@ export interface DashboardResponse {
 /** 프로젝트별 티켓 목록 응답 */
 export interface ProjectTicketsResponse {
   project_id: string;
+  /** todo.md 내용 해시 (보드 버전) */
+  version?: string | null;
   total: number;
   tickets: TicketResponse[];
   by_stage: { stage: KanbanStage; tickets: TicketResponse[] }[];
 }
 
+/** 기준 버전 라인 [start_line, end_line]이 delta만큼 이동 */
+export interface LineShift {
+  start_line: number;
+  end_line: number;
+  delta: number;
+}
+
+/** 보드 변경분: 기준 버전 보드에 적용할 티켓 단위 차이 */
+export interface BoardDeltaResponse {
+  project_id: string;
+  base_version: string;
+  version: string;
+  total: number;
+  added: TicketResponse[];
+  changed: TicketResponse[];
+  removed_ticket_ids: string[];
+  line_shifts: LineShift[];
+  sections: Section[];
+}
+
+/** SSE todo_applied: 서버 자신의 쓰기로 바뀐 todo.md (요청 ID 포함) */
+export interface TodoAppliedEvent {
+  type: "todo_applied";
+  project_id: string;
+  change: string;
+  events: number;
+  /** 쓰기 후 보드 버전 */
+  version: string;
+  /** 이 변경을 만든 요청 ID (X-Request-ID) */
+  request_ids: string[];
+  /** 상주 보드면 마지막으로 알린 버전 대비 변경분 */
+  delta?: BoardDeltaResponse;
+}
+
 /** 에이전트 호출 상태 */
 export type AgentStatus = "pending" | "running" | "completed" | "failed";
 